@@ -0,0 +1,69 @@
+"""Compare palette extraction at full and reduced decoding resolution.
+
+Usage: python reduced_decoding_benchmark.py [IMAGE ...]
+
+For each pixel budget, prints the mean extraction time, the mean number of pixels
+sampled, and how far the palette drifts from the full-resolution one: the weighted
+mean RGB distance from each full-resolution colour to its nearest reduced colour.
+Without arguments, a small corpus of synthetic photo-like JPEG images is generated.
+"""
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+from PIL import Image, ImageFilter
+
+from pyletteyes import Palette
+
+BUDGETS = [None, 4_000_000, 1_000_000, 250_000, 50_000]
+N_COLOURS = 8
+STRATEGY = 'median_cut'
+
+
+def make_corpus(directory, count=4, size=(4000, 3000)):
+    """Write blurred random blobs as JPEG files, standing in for photographs."""
+    rng = np.random.default_rng(0)
+    paths = []
+    for i in range(count):
+        small = rng.integers(0, 256, size=(12, 16, 3), dtype=np.uint8)
+        image = Image.fromarray(small).resize(size, Image.BICUBIC).filter(ImageFilter.GaussianBlur(20))
+        noise = rng.normal(0, 6, size=(size[1], size[0], 3))
+        image = Image.fromarray(np.clip(np.asarray(image) + noise, 0, 255).astype(np.uint8))
+        path = Path(directory) / f"photo_{i}.jpg"
+        image.save(path, quality=90)
+        paths.append(path)
+    return paths
+
+
+def palette_drift(reference, reference_weights, palette):
+    """Weighted mean distance from each reference colour to the nearest colour of palette."""
+    a = np.array(reference.to_list(), dtype=np.float64)
+    b = np.array(palette.to_list(), dtype=np.float64)
+    nearest = np.sqrt(((a[:, np.newaxis] - b[np.newaxis]) ** 2).sum(axis=2)).min(axis=1)
+    return float((nearest * reference_weights).sum() / reference_weights.sum())
+
+
+def main(paths):
+    references = {path: Palette.from_image(path, N_COLOURS, STRATEGY, return_weights=True) for path in paths}
+    print(f"{'max_pixels':>12} {'seconds':>9} {'sampled':>12} {'drift':>7}")
+    for budget in BUDGETS:
+        seconds, sampled, drift = [], [], []
+        for path in paths:
+            start = time.perf_counter()
+            palette, sample_size = Palette.from_image(path, N_COLOURS, STRATEGY, return_sample_size=True,
+                                                      max_pixels=budget)
+            seconds.append(time.perf_counter() - start)
+            sampled.append(sample_size)
+            drift.append(palette_drift(*references[path], palette))
+        label = 'full' if budget is None else f"{budget:,}"
+        print(f"{label:>12} {np.mean(seconds):9.3f} {np.mean(sampled):12,.0f} {np.mean(drift):7.2f}")
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        main([Path(arg) for arg in sys.argv[1:]])
+    else:
+        with tempfile.TemporaryDirectory() as directory:
+            main(make_corpus(directory))
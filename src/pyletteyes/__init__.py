@@ -1,2 +1,6 @@
-from pyletteyes.colour import Colour
-from pyletteyes.palette import Palette
\ No newline at end of file
+from pyletteyes.colour import Colour, disable_interning, enable_interning, interning_info
+from pyletteyes.palette import Palette
+from pyletteyes.colour_array import ColourArray
+from pyletteyes.batch import PaletteBatch
+from pyletteyes.parallel import PaletteExtraction, extract_palettes, score_many
+from pyletteyes.shared import SharedArrayDescriptor, SharedColourArray
@@ -0,0 +1,296 @@
+from typing import Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from .colour_array import _to_uint8
+from .convert import rgb_to_hsl
+from .palette import Palette
+from .scoring import MAX_RGB_DISTANCE, PaletteScores, luminance, pair_harmony
+
+# Pairwise terms held in memory per chunk of palettes (about 8 MB of float64)
+_CHUNK_PAIRS = 1 << 20
+
+
+def _contrast_terms(rgb: np.ndarray, hsl: np.ndarray) -> np.ndarray:
+    """Normalized luminance differences between all colours of each palette."""
+    lums = luminance(rgb)
+    return np.abs(lums[:, :, np.newaxis] - lums[:, np.newaxis, :]) / 255
+
+
+def _uniqueness_terms(rgb: np.ndarray, hsl: np.ndarray) -> np.ndarray:
+    """Normalized Euclidean distances between all colours of each palette."""
+    # Integer-valued inputs keep the expanded squared distances exact in float64
+    squares = np.einsum('bij,bij->bi', rgb, rgb)
+    distances = np.einsum('bij,bkj->bik', rgb, rgb)
+    distances *= -2
+    distances += squares[:, :, np.newaxis]
+    distances += squares[:, np.newaxis, :]
+    np.sqrt(np.maximum(distances, 0, out=distances), out=distances)
+    return distances / MAX_RGB_DISTANCE
+
+
+def _harmony_terms(rgb: np.ndarray, hsl: np.ndarray) -> np.ndarray:
+    """Hue harmony between all colours of each palette."""
+    hues = hsl[:, :, 0]
+    hue_diff = np.abs(hues[:, :, np.newaxis] - hues[:, np.newaxis, :])
+    # Smallest hue difference accounting for circular nature
+    np.minimum(hue_diff, 1 - hue_diff, out=hue_diff)
+    return pair_harmony(hue_diff)
+
+
+# Pairwise terms behind each pairwise score, computed from (b, N, 3) float RGB and HSL chunks
+_PAIR_TERMS = {
+    'contrast': _contrast_terms,
+    'uniqueness': _uniqueness_terms,
+    'harmony': _harmony_terms,
+}
+
+
+class PaletteBatch:
+    """A batch of palettes stored as one padded (B, N, 3) uint8 array, scored all at once.
+
+    Palettes with fewer than N colours are padded, and a (B, N) mask marks the real colours.
+    Every score_* method mirrors the Palette method of the same name and returns a (B,) array.
+    """
+
+    def __init__(self, rgb: np.ndarray, mask: Optional[np.ndarray] = None):
+        """
+        Initialize a new PaletteBatch instance.
+
+        Args:
+            rgb (array-like): (B, N, 3) array of RGB values (0-255)
+            mask (array-like, optional): (B, N) booleans marking the colours that belong to
+                each palette; every colour is used if omitted
+
+        Raises:
+            ValueError: If the arrays have the wrong shape, RGB values are not in valid range,
+                or a palette has no colours
+        """
+        values = np.asarray(rgb)
+        if values.ndim != 3 or values.shape[2] != 3:
+            raise ValueError("RGB array must have shape (B, N, 3)")
+        if values.dtype != np.uint8:
+            values = _to_uint8(np.round(values.astype(np.float64)))
+
+        if mask is None:
+            mask = np.ones(values.shape[:2], dtype=bool)
+        mask = np.array(mask, dtype=bool)  # Copy to prevent external modification
+        if mask.shape != values.shape[:2]:
+            raise ValueError("Mask must have shape (B, N)")
+        if not mask.any(axis=1).all():
+            raise ValueError("Palette must contain at least one colour")
+
+        self._rgb = np.ascontiguousarray(values)
+        self._rgb.flags.writeable = False
+        self._mask = mask
+        self._mask.flags.writeable = False
+        self._hsl = None  # Lazily converted HSL array
+
+    @classmethod
+    def from_palettes(cls, palettes: Iterable[Palette]) -> 'PaletteBatch':
+        """
+        Create a PaletteBatch from Palette objects of any sizes.
+
+        Args:
+            palettes (Iterable[Palette]): Palettes to pack into the batch
+
+        Returns:
+            PaletteBatch: New PaletteBatch instance
+        """
+        arrays = [palette._rgb_array() for palette in palettes]
+        sizes = np.array([len(a) for a in arrays], dtype=np.intp)
+        return cls.from_offsets(np.concatenate(arrays) if arrays else np.empty((0, 3), dtype=np.uint8),
+                                np.concatenate([[0], np.cumsum(sizes)]))
+
+    @classmethod
+    def from_offsets(cls, rgb: np.ndarray, offsets: np.ndarray) -> 'PaletteBatch':
+        """
+        Create a PaletteBatch from the colours of all palettes laid end to end.
+
+        Args:
+            rgb (array-like): (M, 3) array of RGB values (0-255) of every palette in turn
+            offsets (array-like): (B + 1,) increasing start offsets into rgb, ending with M;
+                palette i is rgb[offsets[i]:offsets[i + 1]]
+
+        Returns:
+            PaletteBatch: New PaletteBatch instance
+
+        Raises:
+            ValueError: If the offsets do not describe non-empty palettes covering rgb
+        """
+        rgb = np.asarray(rgb).reshape(-1, 3)
+        offsets = np.asarray(offsets, dtype=np.intp)
+        if offsets.ndim != 1 or len(offsets) < 1 or offsets[0] != 0 or offsets[-1] != len(rgb):
+            raise ValueError("Offsets must start at 0 and end at the number of colours")
+        sizes = np.diff(offsets)
+        if (sizes < 1).any():
+            raise ValueError("Palette must contain at least one colour")
+
+        rows = np.repeat(np.arange(len(sizes)), sizes)
+        columns = np.arange(len(rgb)) - offsets[rows]
+        width = int(sizes.max()) if len(sizes) else 0
+        padded = np.zeros((len(sizes), width, 3), dtype=rgb.dtype)
+        padded[rows, columns] = rgb
+        mask = np.zeros((len(sizes), width), dtype=bool)
+        mask[rows, columns] = True
+        return cls(padded, mask)
+
+    @property
+    def rgb(self) -> np.ndarray:
+        """Get the padded RGB values as a read-only (B, N, 3) uint8 array."""
+        return self._rgb
+
+    @property
+    def mask(self) -> np.ndarray:
+        """Get the read-only (B, N) mask of colours that belong to each palette."""
+        return self._mask
+
+    @property
+    def sizes(self) -> np.ndarray:
+        """Get the number of colours in each palette as a (B,) array."""
+        return np.count_nonzero(self._mask, axis=1)
+
+    def __len__(self) -> int:
+        """Get the number of palettes in the batch."""
+        return len(self._rgb)
+
+    def __getitem__(self, index: int) -> Palette:
+        """Get one palette of the batch."""
+        return Palette.from_list([tuple(rgb) for rgb in self._rgb[index][self._mask[index]].tolist()])
+
+    def _hsl_array(self) -> np.ndarray:
+        """Get the HSL values of all colours as a read-only (B, N, 3) array, converted once."""
+        if self._hsl is None:
+            self._hsl = rgb_to_hsl(self._rgb)
+            self._hsl.flags.writeable = False
+        return self._hsl
+
+    def _masked_mean(self, values: np.ndarray) -> np.ndarray:
+        """Mean of (B, N) per-colour values over the colours of each palette."""
+        return np.where(self._mask, values, 0).sum(axis=1) / self.sizes
+
+    def _pair_scores(self, names: Sequence[str]) -> List[np.ndarray]:
+        """
+        Mean pairwise terms of each palette, for several pairwise scores in one pass.
+
+        Palettes are processed in chunks, so only about _CHUNK_PAIRS pairwise terms
+        per score are in memory at a time.
+
+        Args:
+            names (Sequence[str]): Keys of _PAIR_TERMS to compute
+
+        Returns:
+            List[np.ndarray]: (B,) scores for each name, 1.0 for palettes with fewer than two colours
+        """
+        batch, width = self._mask.shape
+        sums = np.zeros((len(names), batch))
+        chunk = max(1, _CHUNK_PAIRS // max(1, width * width))
+        for start in range(0, batch, chunk):
+            rgb = self._rgb[start:start + chunk].astype(np.float64)
+            hsl = self._hsl_array()[start:start + chunk]
+            mask = self._mask[start:start + chunk]
+            # Symmetric terms count each pair twice, and self-pairs are left out
+            pair_mask = mask[:, :, np.newaxis] & mask[:, np.newaxis, :]
+            pair_mask[:, np.arange(width), np.arange(width)] = False
+            for k, name in enumerate(names):
+                terms = _PAIR_TERMS[name](rgb, hsl)
+                sums[k, start:start + chunk] = np.where(pair_mask, terms, 0).sum(axis=(1, 2)) / 2
+
+        sizes = self.sizes
+        pairs = np.maximum(sizes * (sizes - 1) / 2, 1)
+        return [np.where(sizes < 2, 1.0, total / pairs) for total in sums]
+
+    def _single_score(self, values: np.ndarray) -> np.ndarray:
+        """Give palettes with fewer than two colours a score of 1.0, like Palette does."""
+        return np.where(self.sizes < 2, 1.0, values)
+
+    def score_contrast(self) -> np.ndarray:
+        """
+        Calculate the contrast score of every palette.
+
+        Returns:
+            np.ndarray: (B,) contrast scores between 0 and 1
+        """
+        return self._pair_scores(('contrast',))[0]
+
+    def score_uniqueness(self) -> np.ndarray:
+        """
+        Calculate the uniqueness score of every palette.
+
+        Returns:
+            np.ndarray: (B,) uniqueness scores between 0 and 1
+        """
+        return self._pair_scores(('uniqueness',))[0]
+
+    def score_harmony(self) -> np.ndarray:
+        """
+        Calculate the harmony score of every palette.
+
+        Returns:
+            np.ndarray: (B,) harmony scores between 0 and 1
+        """
+        return self._pair_scores(('harmony',))[0]
+
+    def score_saturation_variation(self) -> np.ndarray:
+        """
+        Calculate the saturation variation score of every palette.
+
+        Returns:
+            np.ndarray: (B,) saturation variation scores between 0 and 1
+        """
+        saturations = self._hsl_array()[:, :, 1]
+        deviations = saturations - self._masked_mean(saturations)[:, np.newaxis]
+        return self._single_score(np.sqrt(self._masked_mean(deviations ** 2)))
+
+    def score_temperature_variation(self) -> np.ndarray:
+        """
+        Calculate the temperature variation score of every palette.
+
+        Returns:
+            np.ndarray: (B,) temperature variation scores between 0 and 1
+        """
+        hues = self._hsl_array()[:, :, 0]
+        warm_colors = np.count_nonzero(self._mask & ((hues <= 0.167) | (hues >= 0.833)), axis=1)
+        cool_colors = self.sizes - warm_colors
+        return self._single_score(1 - np.abs(warm_colors - cool_colors) / self.sizes)
+
+    def score_brightness(self) -> np.ndarray:
+        """
+        Calculate the brightness score of every palette.
+
+        Returns:
+            np.ndarray: (B,) brightness scores between 0 and 1
+        """
+        return self._masked_mean(self._hsl_array()[:, :, 2])
+
+    def score_brightness_balance(self) -> np.ndarray:
+        """
+        Calculate the brightness balance score of every palette.
+
+        Returns:
+            np.ndarray: (B,) brightness balance scores between 0 and 1
+        """
+        return self._single_score(1 - np.abs(self.score_brightness() - 0.5) * 2)
+
+    def score_all(self) -> PaletteScores:
+        """
+        Calculate every score of every palette, walking the pairs of each palette once.
+
+        Returns:
+            PaletteScores: Every score as a (B,) array, each between 0 and 1
+        """
+        contrast, uniqueness, harmony = self._pair_scores(('contrast', 'uniqueness', 'harmony'))
+        brightness = self.score_brightness()
+        return PaletteScores(
+            contrast=contrast,
+            uniqueness=uniqueness,
+            harmony=harmony,
+            saturation_variation=self.score_saturation_variation(),
+            temperature_variation=self.score_temperature_variation(),
+            brightness=brightness,
+            brightness_balance=self._single_score(1 - np.abs(brightness - 0.5) * 2),
+        )
+
+    def __repr__(self) -> str:
+        """Get string representation of the batch."""
+        return f"PaletteBatch(size={len(self)}, max_colours={self._mask.shape[1]})"
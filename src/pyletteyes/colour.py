@@ -1,13 +1,102 @@
-from colorsys import rgb_to_hls, hls_to_rgb
-from typing import Tuple, Union
+from collections import OrderedDict
+from functools import lru_cache
+from typing import NamedTuple, Optional, Tuple, Union
+
+from .convert import hsl_to_rgb_single, rgb_to_hsl_single
+from .parsing import parse_css_colour, parse_hex_colour
+
+
+class InternInfo(NamedTuple):
+    """Statistics for the Colour interning cache."""
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class _InternCache:
+    """A bounded LRU cache of shared Colour instances keyed by packed RGB value."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.instances = OrderedDict()
+
+    def get(self, packed: int) -> Optional['Colour']:
+        colour = self.instances.get(packed)
+        if colour is not None:
+            try:
+                self.instances.move_to_end(packed)
+            except KeyError:
+                # Evicted by another thread's put() since the lookup; a lock would slow every hit
+                colour = None
+        if colour is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return colour
+
+    def put(self, packed: int, colour: 'Colour') -> None:
+        self.instances[packed] = colour
+        if len(self.instances) > self.maxsize:
+            self.instances.popitem(last=False)
+
+
+_intern_cache: Optional[_InternCache] = None
+
+
+@lru_cache(maxsize=1 << 16)
+def _packed_hsl(packed: int) -> Tuple[float, float, float]:
+    """Memoized HSL conversion keyed by packed RGB, shared by all Colour instances."""
+    return rgb_to_hsl_single(packed >> 16, (packed >> 8) & 0xFF, packed & 0xFF)
+
+
+def enable_interning(maxsize: int = 65536) -> None:
+    """
+    Share Colour instances between constructions of the same RGB value.
+
+    While enabled, creating a Colour returns the cached instance for its RGB
+    value if there is one. Any previous cache and its statistics are discarded.
+
+    Args:
+        maxsize (int): Maximum number of cached colours; least recently used colours are evicted first
+
+    Raises:
+        ValueError: If maxsize is not positive
+    """
+    global _intern_cache
+    if maxsize < 1:
+        raise ValueError("maxsize must be at least 1")
+    _intern_cache = _InternCache(maxsize)
+
+
+def disable_interning() -> None:
+    """Stop sharing Colour instances and release the interning cache."""
+    global _intern_cache
+    _intern_cache = None
+
+
+def interning_info() -> Optional[InternInfo]:
+    """Get the interning cache statistics, or None if interning is disabled."""
+    cache = _intern_cache
+    if cache is None:
+        return None
+    return InternInfo(cache.hits, cache.misses, cache.maxsize, len(cache.instances))
+
 
 
 class Colour:
-    """A class representing a colour in RGB space with various transformation capabilities."""
+    """A class representing a colour in RGB space with various transformation capabilities.
+
+    Colours are immutable and hashable, so they can be used in sets and as dict keys.
+    """
 
-    def __init__(self, r: Union[int, float], g: Union[int, float], b: Union[int, float]):
+    __slots__ = ('_r', '_g', '_b')
+
+    def __new__(cls, r: Union[int, float], g: Union[int, float], b: Union[int, float]):
         """
-        Initialize a new Colour instance.
+        Create a new Colour instance, or reuse an interned one if interning is enabled.
 
         Args:
             r (int): Red component (0-255)
@@ -21,23 +110,68 @@ class Colour:
         rounded_g = round(g)
         rounded_b = round(b)
 
-        if not all(isinstance(v, (int, float)) and 0 <= v <= 255 for v in (rounded_r, rounded_g, rounded_b)):
+        if not (isinstance(rounded_r, int) and isinstance(rounded_g, int) and isinstance(rounded_b, int)
+                and 0 <= rounded_r <= 255 and 0 <= rounded_g <= 255 and 0 <= rounded_b <= 255):
             raise ValueError("RGB values must be between 0 and 255")
 
-        self._r = rounded_r
-        self._g = rounded_g
-        self._b = rounded_b
+        return cls._from_valid(rounded_r, rounded_g, rounded_b)
+
+    @classmethod
+    def _from_valid(cls, r: int, g: int, b: int) -> 'Colour':
+        """Create a Colour from int components already known to be 0-255, skipping validation."""
+        cache = _intern_cache
+        if cache is not None and cls is Colour:
+            packed = (r << 16) | (g << 8) | b
+            self = cache.get(packed)
+            if self is not None:
+                return self
+
+        self = object.__new__(cls)
+        # Write the slots through their descriptors, around __setattr__
+        _set_r(self, r)
+        _set_g(self, g)
+        _set_b(self, b)
+
+        if cache is not None and cls is Colour:
+            cache.put(packed, self)
+        return self
+
+    @classmethod
+    def from_packed(cls, packed: int) -> 'Colour':
+        """
+        Create a Colour instance from a packed 24-bit RGB integer.
+
+        Args:
+            packed (int): RGB packed as 0xRRGGBB (e.g., 0xFF0000)
+
+        Returns:
+            Colour: New Colour instance
+
+        Raises:
+            ValueError: If the value is not a 24-bit integer
+        """
+        if not isinstance(packed, int) or not 0 <= packed <= 0xFFFFFF:
+            raise ValueError("Packed RGB value must be between 0 and 0xFFFFFF")
+        return cls._from_valid(packed >> 16, (packed >> 8) & 0xFF, packed & 0xFF)
 
     @property
     def rgb(self) -> Tuple[int, int, int]:
         """Get the RGB values as a tuple."""
         return (self._r, self._g, self._b)
 
+    @property
+    def packed(self) -> int:
+        """Get the RGB values packed into a 24-bit integer (0xRRGGBB)."""
+        return (self._r << 16) | (self._g << 8) | self._b
+
     @property
     def hsl(self) -> Tuple[float, float, float]:
-        """Get the HSL values as a tuple (Hue: 0-1, Saturation: 0-1, Lightness: 0-1)."""
-        hls = rgb_to_hls(self._r / 255, self._g / 255, self._b / 255)
-        return hls[0], hls[2], hls[1]  # must rearrange HLS to HSL
+        """Get the HSL values as a tuple (Hue: 0-1, Saturation: 0-1, Lightness: 0-1).
+
+        Colours are immutable, so the conversion is memoized in a cache keyed by RGB
+        value rather than stored on each instance.
+        """
+        return _packed_hsl((self._r << 16) | (self._g << 8) | self._b)
 
     @classmethod
     def from_hsl(cls, hsl: Tuple[float, float, float]) -> 'Colour':
@@ -58,36 +192,28 @@ class Colour:
                 raise ValueError("HSL values must be within the range of 0.0 to 1.0")
 
         try:
-            r, g, b = hls_to_rgb(h=hsl[0], l=hsl[2], s=hsl[1])
-            return cls(round(r * 255), round(g * 255), round(b * 255))
+            r, g, b = hsl_to_rgb_single(hsl[0], hsl[1], hsl[2])
+            return cls._from_valid(round(r), round(g), round(b))
         except ValueError:
             raise ValueError("Invalid HSL value")
 
     @classmethod
     def from_string(cls, rgb_string: str) -> 'Colour':
         """
-        Create a Colour instance from an RGB string.
+        Create a Colour instance from a CSS rgb(), rgba(), hsl() or hsla() string, or
+        a bare "R, G, B" triplet. Any alpha value is validated but discarded.
 
         Args:
-            rgb_string (str): RGB in string format (e.g., "rgb(255, 0, 0)")
+            rgb_string (str): Colour in string format (e.g., "rgb(255, 0, 0)" or "hsl(0 100% 50%)")
 
         Returns:
             Colour: New Colour instance
 
         Raises:
-            ValueError: If RGB string is invalid
+            ValueError: If the colour string is invalid
         """
-        rgb_string = rgb_string.replace('rgb(', '').replace(')', '').split(',')
-        rgb_string = [int(i.strip()) for i in rgb_string]
-
-        if len(rgb_string) != 3:
-            raise ValueError("Invalid rgb string")
-
-        try:
-            r, g, b = rgb_string[0], rgb_string[1], rgb_string[2]
-            return cls(r, g, b)
-        except ValueError:
-            raise ValueError("Invalid rgb string")
+        r, g, b = parse_css_colour(rgb_string)
+        return cls._from_valid(r, g, b)
 
 
     def to_string(self) -> str:
@@ -98,10 +224,11 @@ class Colour:
     @classmethod
     def from_hex(cls, hex_string: str) -> 'Colour':
         """
-        Create a Colour instance from a hex string.
+        Create a Colour instance from a "#RGB", "#RRGGBB" or "#RRGGBBAA" hex string,
+        with or without the "#". Any alpha is discarded.
 
         Args:
-            hex_string (str): Hex colour code (e.g., "#FF0000" or "FF0000")
+            hex_string (str): Hex colour code (e.g., "#FF0000", "FF0000" or "#F00")
 
         Returns:
             Colour: New Colour instance
@@ -109,15 +236,8 @@ class Colour:
         Raises:
             ValueError: If hex string is invalid
         """
-        hex_string = hex_string.lstrip('#')
-        if len(hex_string) != 6:
-            raise ValueError("Hex colour must be 6 characters long")
-
-        try:
-            r, g, b = tuple(int(hex_string[i:i + 2], 16) for i in (0, 2, 4))
-            return cls(r, g, b)
-        except ValueError:
-            raise ValueError("Invalid hex colour string")
+        r, g, b = parse_hex_colour(hex_string)
+        return cls._from_valid(r, g, b)
 
     def to_hex(self) -> str:
         """Convert the colour to hex format."""
@@ -134,8 +254,8 @@ class Colour:
             Colour: New lightened Colour instance
         """
         h, s, l = self.hsl
-        r, g, b = hls_to_rgb(h, min(1, l + amount), s)
-        return Colour(int(r * 255), int(g * 255), int(b * 255))
+        r, g, b = hsl_to_rgb_single(h, s, max(0, min(1, l + amount)))
+        return Colour._from_valid(int(r), int(g), int(b))
 
     def darken(self, amount: float = 0.1) -> 'Colour':
         """
@@ -148,8 +268,8 @@ class Colour:
             Colour: New darkened Colour instance
         """
         h, s, l = self.hsl
-        r, g, b = hls_to_rgb(h, max(0, l - amount), s)
-        return Colour(int(r * 255), int(g * 255), int(b * 255))
+        r, g, b = hsl_to_rgb_single(h, s, min(1, max(0, l - amount)))
+        return Colour._from_valid(int(r), int(g), int(b))
 
     def get_pastel(self) -> 'Colour':
         """
@@ -163,9 +283,9 @@ class Colour:
         # Reduce saturation and increase lightness
         new_s = max(0.05, (s * 0.5))
         new_l = min(0.95, (l * 1.2))
-        r, g, b = hls_to_rgb(h, new_l, new_s)
+        r, g, b = hsl_to_rgb_single(h, new_s, new_l)
 
-        return Colour(int(r * 255), int(g * 255), int(b * 255))
+        return Colour._from_valid(int(r), int(g), int(b))
 
     def get_complementary(self) -> 'Colour':
         """
@@ -177,8 +297,8 @@ class Colour:
         h, s, l = self.hsl
         # Add 0.5 to hue to get the opposite colour (180 degrees on the colour wheel)
         new_h = (h + 0.5) % 1.0
-        r, g, b = hls_to_rgb(new_h, l, s)
-        return Colour(int(r * 255), int(g * 255), int(b * 255))
+        r, g, b = hsl_to_rgb_single(new_h, s, l)
+        return Colour._from_valid(int(r), int(g), int(b))
 
     def get_analogous(self, angle: float = 30) -> Tuple['Colour', 'Colour']:
         """
@@ -196,12 +316,12 @@ class Colour:
         h1 = (h + angle) % 1.0
         h2 = (h - angle) % 1.0
 
-        r1, g1, b1 = hls_to_rgb(h1, l, s)
-        r2, g2, b2 = hls_to_rgb(h2, l, s)
+        r1, g1, b1 = hsl_to_rgb_single(h1, s, l)
+        r2, g2, b2 = hsl_to_rgb_single(h2, s, l)
 
         return (
-            Colour(int(r1 * 255), int(g1 * 255), int(b1 * 255)),
-            Colour(int(r2 * 255), int(g2 * 255), int(b2 * 255))
+            Colour._from_valid(int(r1), int(g1), int(b1)),
+            Colour._from_valid(int(r2), int(g2), int(b2))
         )
 
     def get_triadic(self) -> Tuple['Colour', 'Colour']:
@@ -218,8 +338,29 @@ class Colour:
         """Compare two colours for equality."""
         if not isinstance(other, Colour):
             return NotImplemented
-        return self.rgb == other.rgb
+        return self._r == other._r and self._g == other._g and self._b == other._b
+
+    def __hash__(self) -> int:
+        """Hash the colour as its packed 24-bit RGB value."""
+        return (self._r << 16) | (self._g << 8) | self._b
+
+    def __setattr__(self, name: str, value: object) -> None:
+        """Refuse to change a colour, as instances may be shared and are used as hash keys."""
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        """Refuse to delete a colour's components."""
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self):
+        """Pickle the colour by its RGB values, so unpickling goes through __new__."""
+        return self.__class__, self.rgb
 
     def __repr__(self) -> str:
         """String representation of the colour."""
-        return f"rgb({self._r}, {self._g}, {self._b})"
\ No newline at end of file
+        return f"rgb({self._r}, {self._g}, {self._b})"
+
+
+_set_r = Colour._r.__set__
+_set_g = Colour._g.__set__
+_set_b = Colour._b.__set__
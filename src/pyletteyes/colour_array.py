@@ -0,0 +1,277 @@
+from typing import Iterable, Iterator, List, Sequence, Tuple, Union
+
+import numpy as np
+
+from .colour import Colour
+from .convert import hsl_to_rgb, rgb_to_hsl
+from .formatting import format_hex_array, format_rgb_array
+from .palette import Palette
+from .parsing import _format_indices, parse_css_colour_array, parse_hex_array
+
+
+def _to_uint8(values: np.ndarray) -> np.ndarray:
+    """Validate an (N, 3) array of whole-number RGB values and cast it to uint8."""
+    if values.size and (values.min() < 0 or values.max() > 255):
+        raise ValueError("RGB values must be between 0 and 255")
+    return values.astype(np.uint8)
+
+
+class ColourArray:
+    """An immutable array of colours backed by one contiguous (N, 3) uint8 buffer.
+
+    Mirrors the Colour API, applying each operation to every colour at once.
+    """
+
+    def __init__(self, rgb: Union[np.ndarray, Iterable[Tuple[int, int, int]]]):
+        """
+        Initialize a new ColourArray instance.
+
+        Args:
+            rgb (array-like): (N, 3) array of RGB values (0-255)
+
+        Raises:
+            ValueError: If the array has the wrong shape or RGB values are not in valid range
+        """
+        values = np.asarray(rgb)
+        if values.size == 0:
+            values = values.reshape(0, 3)
+        if values.ndim != 2 or values.shape[1] != 3:
+            raise ValueError("RGB array must have shape (N, 3)")
+
+        if values.dtype == np.uint8:
+            values = values.copy()  # Copy to prevent external modification
+        else:
+            values = _to_uint8(np.round(values.astype(np.float64)))
+
+        self._rgb = np.ascontiguousarray(values)
+        self._rgb.flags.writeable = False
+
+    @classmethod
+    def from_colours(cls, colours: Iterable[Colour]) -> 'ColourArray':
+        """
+        Create a ColourArray from Colour objects.
+
+        Args:
+            colours (Iterable[Colour]): Colours to pack into the array
+
+        Returns:
+            ColourArray: New ColourArray instance
+        """
+        return cls(np.array([c.rgb for c in colours], dtype=np.uint8).reshape(-1, 3))
+
+    @classmethod
+    def from_palette(cls, palette: Palette) -> 'ColourArray':
+        """
+        Create a ColourArray from the colours of a palette.
+
+        Args:
+            palette (Palette): Source palette
+
+        Returns:
+            ColourArray: New ColourArray instance
+        """
+        return cls.from_colours(palette)
+
+    @classmethod
+    def from_hsl(cls, hsl: np.ndarray) -> 'ColourArray':
+        """
+        Create a ColourArray from an (N, 3) array of HSL values.
+
+        Args:
+            hsl (array-like): Hue, Saturation, Lightness rows, each within 0.0 to 1.0
+
+        Returns:
+            ColourArray: New ColourArray instance
+
+        Raises:
+            ValueError: If HSL values are invalid
+        """
+        hsl = np.asarray(hsl, dtype=np.float64).reshape(-1, 3)
+        if hsl.size and (hsl.min() < 0.0 or hsl.max() > 1.0):
+            raise ValueError("HSL values must be within the range of 0.0 to 1.0")
+
+        return cls(_to_uint8(np.round(hsl_to_rgb(hsl))))
+
+    @classmethod
+    def from_hex(cls, hex_strings: Sequence[str]) -> 'ColourArray':
+        """
+        Create a ColourArray from hex colour strings, parsed in one vectorized pass.
+
+        Args:
+            hex_strings (Sequence[str]): Hex colour codes ("#RGB", "#RRGGBB" or "#RRGGBBAA")
+
+        Returns:
+            ColourArray: New ColourArray instance
+
+        Raises:
+            ValueError: If any hex string is invalid, listing the invalid indices
+        """
+        rgb, invalid = parse_hex_array(hex_strings)
+        if invalid.size:
+            raise ValueError(f"Invalid hex colour strings at indices {_format_indices(invalid)}")
+        return cls(rgb)
+
+    @classmethod
+    def from_string(cls, rgb_strings: Iterable[str]) -> 'ColourArray':
+        """
+        Create a ColourArray from CSS rgb(), rgba(), hsl() or hsla() colour strings.
+
+        Args:
+            rgb_strings (Iterable[str]): Colour strings (e.g., "rgb(255, 0, 0)")
+
+        Returns:
+            ColourArray: New ColourArray instance
+
+        Raises:
+            ValueError: If any colour string is invalid, listing the invalid indices
+        """
+        rgb, invalid = parse_css_colour_array(rgb_strings)
+        if invalid.size:
+            raise ValueError(f"Invalid colour strings at indices {_format_indices(invalid)}")
+        return cls(rgb)
+
+    @property
+    def rgb(self) -> np.ndarray:
+        """Get the RGB values as a read-only (N, 3) uint8 array."""
+        return self._rgb
+
+    @property
+    def hsl(self) -> np.ndarray:
+        """Get the HSL values as an (N, 3) float array (Hue: 0-1, Saturation: 0-1, Lightness: 0-1)."""
+        return rgb_to_hsl(self._rgb)
+
+    @property
+    def size(self) -> int:
+        """Get the number of colours in the array."""
+        return len(self._rgb)
+
+    def to_colours(self) -> List[Colour]:
+        """Convert the array to a list of Colour objects."""
+        return [Colour._from_valid(r, g, b) for r, g, b in self._rgb.tolist()]
+
+    def to_palette(self) -> Palette:
+        """
+        Convert the array to a Palette.
+
+        Raises:
+            ValueError: If the array is empty
+        """
+        return Palette(self.to_colours())
+
+    def to_hex(self) -> List[str]:
+        """Convert the colours to a list of hex strings."""
+        return format_hex_array(self._rgb)
+
+    def to_string(self) -> List[str]:
+        """Convert the colours to a list of rgb strings."""
+        return format_rgb_array(self._rgb)
+
+    def _from_hsl_channels(self, h: np.ndarray, s: np.ndarray, l: np.ndarray) -> 'ColourArray':
+        """Build a ColourArray from HSL channels, truncating like the Colour transforms do."""
+        rgb = hsl_to_rgb(np.stack((h, s, l), axis=1))
+        return ColourArray(_to_uint8(np.trunc(rgb)))
+
+    def lighten(self, amount: float = 0.1) -> 'ColourArray':
+        """
+        Create lighter versions of the colours.
+
+        Args:
+            amount (float): Amount to lighten by (0-1)
+
+        Returns:
+            ColourArray: New lightened ColourArray instance
+        """
+        hsl = self.hsl
+        return self._from_hsl_channels(hsl[:, 0], hsl[:, 1], np.clip(hsl[:, 2] + amount, 0, 1))
+
+    def darken(self, amount: float = 0.1) -> 'ColourArray':
+        """
+        Create darker versions of the colours.
+
+        Args:
+            amount (float): Amount to darken by (0-1)
+
+        Returns:
+            ColourArray: New darkened ColourArray instance
+        """
+        hsl = self.hsl
+        return self._from_hsl_channels(hsl[:, 0], hsl[:, 1], np.clip(hsl[:, 2] - amount, 0, 1))
+
+    def get_pastel(self) -> 'ColourArray':
+        """
+        Return more 'pastel' versions of the colours.
+        Reduces saturation and increases brightness.
+
+        Returns:
+            ColourArray: New pastel-ised ColourArray instance
+        """
+        hsl = self.hsl
+        new_s = np.maximum(0.05, hsl[:, 1] * 0.5)
+        new_l = np.minimum(0.95, hsl[:, 2] * 1.2)
+        return self._from_hsl_channels(hsl[:, 0], new_s, new_l)
+
+    def get_complementary(self) -> 'ColourArray':
+        """
+        Get the complementary colours (180 degrees opposite on the colour wheel).
+
+        Returns:
+            ColourArray: New ColourArray instance of the complementary colours
+        """
+        hsl = self.hsl
+        return self._from_hsl_channels((hsl[:, 0] + 0.5) % 1.0, hsl[:, 1], hsl[:, 2])
+
+    def get_analogous(self, angle: float = 30) -> Tuple['ColourArray', 'ColourArray']:
+        """
+        Get analogous colours (adjacent on the colour wheel).
+
+        Args:
+            angle (float): Angle of separation in degrees (default 30)
+
+        Returns:
+            Tuple[ColourArray, ColourArray]: Two new ColourArray instances
+        """
+        hsl = self.hsl
+        angle = angle / 360  # Convert to 0-1 range
+
+        h, s, l = hsl[:, 0], hsl[:, 1], hsl[:, 2]
+        return (
+            self._from_hsl_channels((h + angle) % 1.0, s, l),
+            self._from_hsl_channels((h - angle) % 1.0, s, l),
+        )
+
+    def get_triadic(self) -> Tuple['ColourArray', 'ColourArray']:
+        """
+        Get triadic colours (shift hue left and right by 120 degrees).
+
+        Returns:
+            Tuple[ColourArray, ColourArray]: Two new ColourArray instances
+        """
+        return self.get_analogous(angle=120)
+
+    def __len__(self) -> int:
+        """Get the number of colours in the array."""
+        return self.size
+
+    def __getitem__(self, index: Union[int, slice, np.ndarray]) -> Union[Colour, 'ColourArray']:
+        """Get a Colour by integer index, or a new ColourArray by slice or index array."""
+        if isinstance(index, (int, np.integer)):
+            r, g, b = self._rgb[index].tolist()
+            return Colour._from_valid(r, g, b)
+        return ColourArray(self._rgb[index])
+
+    def __iter__(self) -> Iterator[Colour]:
+        """Iterate over the colours as Colour objects."""
+        return iter(self.to_colours())
+
+    def __eq__(self, other: object) -> bool:
+        """Compare two colour arrays for equality."""
+        if not isinstance(other, ColourArray):
+            return NotImplemented
+        return np.array_equal(self._rgb, other._rgb)
+
+    def __repr__(self) -> str:
+        """String representation of the colour array."""
+        hex_colours = ColourArray(self._rgb[:6]).to_hex()
+        if self.size > 6:
+            hex_colours.append('...')
+        return f"ColourArray(size={self.size}, colours={hex_colours})"
@@ -0,0 +1,247 @@
+from colorsys import ONE_SIXTH, ONE_THIRD, TWO_THIRD, hls_to_rgb, rgb_to_hls
+from functools import lru_cache
+from typing import Tuple
+
+import numpy as np
+
+# Colours converted at a time, small enough for the temporaries of a block to stay in cache
+_CONVERT_BLOCK = 1 << 14
+
+# colorsys computes six times the hue of a colour as (offset + sign * x) - subtract, where x is
+# (max - mid) / range. The case depends on which channel is the maximum (red, green, blue) and
+# then on whether red (green, for a red maximum) is above the minimum; case 8 is grey.
+_HUE_OFFSET = np.array([0.0, 1.0, 3.0, 2.0, 4.0, 5.0, 0.0, 0.0, 0.0])
+_HUE_SIGN = np.array([1.0, -1.0, -1.0, 1.0, 1.0, -1.0, 0.0, 0.0, 0.0])
+_HUE_SUBTRACT = np.array([1.0, 0.0, 0.0, 1.0, 1.0, 0.0, 0.0, 0.0, 0.0])
+
+
+def _rgb_to_hsl(rgb: np.ndarray) -> np.ndarray:
+    """Vectorized equivalent of colorsys.rgb_to_hls, for any numeric (..., 3) array."""
+    r, g, b = (rgb[..., i] / 255 for i in range(3))
+    maxc = np.maximum(np.maximum(r, g), b)
+    minc = np.minimum(np.minimum(r, g), b)
+    sumc = maxc + minc
+    rangec = maxc - minc
+    l = sumc / 2.0
+    grey = minc == maxc
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        s = np.where(l <= 0.5, rangec / sumc, rangec / (2.0 - maxc - minc))
+        rc = (maxc - r) / rangec
+        gc = (maxc - g) / rangec
+        bc = (maxc - b) / rangec
+
+    h = np.where(r == maxc, bc - gc, np.where(g == maxc, 2.0 + rc - bc, 4.0 + gc - rc)) / 6.0
+    # h is in [-1/6, 5/6) here, so wrapping negatives is the same as "% 1.0" but much cheaper
+    h = np.where(h < 0, h + 1.0, h)
+    return np.stack((np.where(grey, 0.0, h), np.where(grey, 0.0, s), l), axis=-1)
+
+
+@lru_cache(maxsize=None)
+def _hsl_tables() -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Lookup tables for 8-bit colours, built on first use.
+
+    Returns every channel value / 255, then the saturation, lightness and channel range
+    (1 for greys) indexed by max * 256 + min, all exactly as colorsys computes them.
+    """
+    channel = np.arange(256) / 255
+    maxc, minc = np.divmod(np.arange(1 << 16), 256)
+    hsl = _rgb_to_hsl(np.stack((maxc, minc, minc), axis=-1))
+    rangec = channel[maxc] - channel[minc]
+    rangec[maxc == minc] = 1.0
+    return channel, hsl[:, 1].copy(), hsl[:, 2].copy(), rangec
+
+
+def _rgb_to_hsl_block(rgb: np.ndarray, hsl: np.ndarray) -> None:
+    """Convert a block of (N, 3) uint8 colours into hsl, with the arithmetic of colorsys."""
+    channel, saturation, lightness, ranges = _hsl_tables()
+    r, g, b = np.ascontiguousarray(rgb.T)
+    maxc = np.maximum(r, g)
+    np.maximum(maxc, b, out=maxc)
+    minc = np.minimum(r, g)
+    np.minimum(minc, b, out=minc)
+    mid = r + g  # wraps around, but the sum minus maxc and minc is exact modulo 256
+    mid += b
+    mid -= maxc
+    mid -= minc
+
+    not_red = r != maxc
+    case = g != maxc
+    case &= not_red
+    case = case.view(np.uint8)
+    case += not_red.view(np.uint8)
+    case <<= 1
+    above = g != minc
+    above &= ~not_red
+    red_above = r != minc
+    red_above &= not_red
+    above |= red_above
+    case |= above.view(np.uint8)
+    case |= (maxc == minc).view(np.uint8) << 3
+
+    index = maxc.astype(np.uint16)
+    index <<= 8
+    index |= minc
+    saturation.take(index, out=hsl[:, 1])
+    lightness.take(index, out=hsl[:, 2])
+    hue = channel.take(maxc)
+    hue -= channel.take(mid)
+    hue /= ranges.take(index)
+    hue *= _HUE_SIGN.take(case)
+    hue += _HUE_OFFSET.take(case)
+    hue -= _HUE_SUBTRACT.take(case)
+    hue /= 6.0
+    hue += hue < 0
+    hsl[:, 0] = hue
+
+
+def rgb_to_hsl(rgb: np.ndarray) -> np.ndarray:
+    """
+    Convert an array of RGB colours to HSL.
+
+    Integer colours in 0-255 are converted a block at a time with lookup tables; other
+    input is converted arithmetically. Both agree exactly with colorsys.
+
+    Args:
+        rgb (array-like): (..., 3) array of RGB values (0-255)
+
+    Returns:
+        np.ndarray: (..., 3) float array of HSL values (Hue: 0-1, Saturation: 0-1, Lightness: 0-1)
+    """
+    rgb = np.asarray(rgb)
+    if rgb.dtype.kind in 'ui' and rgb.dtype != np.uint8 and rgb.size and 0 <= rgb.min() and rgb.max() <= 255:
+        rgb = rgb.astype(np.uint8)
+    if rgb.dtype != np.uint8:
+        return _rgb_to_hsl(rgb)
+
+    colours = rgb.reshape(-1, 3)
+    hsl = np.empty(colours.shape, dtype=np.float64)
+    for start in range(0, len(colours), _CONVERT_BLOCK):
+        stop = start + _CONVERT_BLOCK
+        _rgb_to_hsl_block(colours[start:stop], hsl[start:stop])
+    return hsl.reshape(rgb.shape)
+
+
+def _hsl_to_rgb_block(hsl: np.ndarray, rgb: np.ndarray) -> None:
+    """Convert a block of (N, 3) HSL colours into rgb, with the arithmetic of colorsys."""
+    h, s, l = np.ascontiguousarray(hsl.T)
+    m2 = 1.0 + s
+    m2 *= l
+    high = l + s
+    high -= l * s
+    np.copyto(m2, high, where=l > 0.5)
+    m1 = 2.0 * l
+    m1 -= m2
+    span = m2 - m1
+
+    hue = np.empty_like(h)
+    other = np.empty_like(h)
+    flat = np.empty(h.shape, dtype=bool)
+    below = np.empty(h.shape, dtype=bool)
+    for channel, shift in enumerate((ONE_THIRD, 0.0, -ONE_THIRD)):
+        np.add(h, shift, out=hue)
+        np.floor(hue, out=other)
+        hue -= other  # Same result as "hue % 1.0", but cheaper
+        np.greater_equal(hue, ONE_SIXTH, out=flat)
+        np.less(hue, 0.5, out=below)
+        flat &= below
+        # The rising edge uses hue and the falling edge TWO_THIRD - hue; past it the channel is m1
+        np.subtract(TWO_THIRD, hue, out=other)
+        np.minimum(hue, other, out=hue)
+        np.maximum(hue, 0.0, out=hue)
+        hue *= span
+        hue *= 6.0
+        hue += m1
+        np.copyto(hue, m2, where=flat)
+        np.multiply(hue, 255, out=rgb[:, channel])
+
+
+def hsl_to_rgb(hsl: np.ndarray) -> np.ndarray:
+    """
+    Convert an array of HSL colours to RGB.
+
+    The result is left unrounded so callers can round or truncate as required. It agrees
+    exactly with colorsys.
+
+    Args:
+        hsl (array-like): (..., 3) array of HSL values (0-1)
+
+    Returns:
+        np.ndarray: (..., 3) float array of RGB values (0-255)
+    """
+    hsl = np.asarray(hsl, dtype=np.float64)
+    colours = hsl.reshape(-1, 3)
+    rgb = np.empty(colours.shape, dtype=np.float64)
+    for start in range(0, len(colours), _CONVERT_BLOCK):
+        stop = start + _CONVERT_BLOCK
+        _hsl_to_rgb_block(colours[start:stop], rgb[start:stop])
+    return rgb.reshape(hsl.shape)
+
+
+def rgb_to_hsl_single(r: int, g: int, b: int) -> Tuple[float, float, float]:
+    """
+    Convert one RGB colour to HSL.
+
+    NumPy's per-call overhead outweighs the work for a single colour, so this
+    uses colorsys directly. It agrees exactly with rgb_to_hsl.
+
+    Args:
+        r (int): Red component (0-255)
+        g (int): Green component (0-255)
+        b (int): Blue component (0-255)
+
+    Returns:
+        Tuple[float, float, float]: Hue, Saturation, Lightness (0-1)
+    """
+    h, l, s = rgb_to_hls(r / 255, g / 255, b / 255)
+    return h, s, l  # must rearrange HLS to HSL
+
+
+def hsl_to_rgb_single(h: float, s: float, l: float) -> Tuple[float, float, float]:
+    """
+    Convert one HSL colour to unrounded RGB (0-255).
+
+    Args:
+        h (float): Hue (0-1)
+        s (float): Saturation (0-1)
+        l (float): Lightness (0-1)
+
+    Returns:
+        Tuple[float, float, float]: Red, Green, Blue (0-255)
+    """
+    r, g, b = hls_to_rgb(h, l, s)
+    return r * 255, g * 255, b * 255
+
+
+def pack_rgb(rgb: np.ndarray) -> np.ndarray:
+    """
+    Pack an array of RGB colours into 24-bit integers (0xRRGGBB).
+
+    Args:
+        rgb (array-like): (..., 3) array of RGB values (0-255)
+
+    Returns:
+        np.ndarray: (...) uint32 array of packed colours
+    """
+    rgb = np.asarray(rgb).astype(np.uint32)
+    return (rgb[..., 0] << 16) | (rgb[..., 1] << 8) | rgb[..., 2]
+
+
+def unpack_rgb(packed: np.ndarray) -> np.ndarray:
+    """
+    Unpack 24-bit integers (0xRRGGBB) into an array of RGB colours.
+
+    Args:
+        packed (array-like): (...) array of packed colours
+
+    Returns:
+        np.ndarray: (..., 3) uint8 array of RGB values
+    """
+    packed = np.asarray(packed)
+    rgb = np.empty(packed.shape + (3,), dtype=np.uint8)
+    # Storing into uint8 keeps the low byte, so each shift lands one channel
+    np.right_shift(packed, 16, out=rgb[..., 0], casting='unsafe')
+    np.right_shift(packed, 8, out=rgb[..., 1], casting='unsafe')
+    np.copyto(rgb[..., 2], packed, casting='unsafe')
+    return rgb
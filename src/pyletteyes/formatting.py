@@ -0,0 +1,101 @@
+from functools import lru_cache
+from typing import List, Tuple, Union
+
+import numpy as np
+
+# Two uppercase hex digits for every byte value
+_HEX_DIGITS = np.frombuffer(''.join(f"{i:02X}" for i in range(256)).encode('ascii'), dtype=np.uint8).reshape(256, 2)
+
+
+# Colours formatted per block, keeping the block's temporaries in cache
+_FORMAT_BLOCK = 8192
+
+
+@lru_cache(maxsize=None)
+def _rgb_tables() -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Lookup tables for "rgb(r, g, b)" lines, built on first use.
+
+    Each line is split into a head "rgb(r, g", looked up by r and g together, and a tail
+    ", b)\\n", looked up by b. Heads are NUL-padded to 16 bytes, so they copy as single
+    items; tails are 8 bytes, padded with the "rgb(" that starts the next line.
+
+    Returns:
+        Tuple of the (65536,) 16-byte heads and their lengths, indexed by r << 8 | g,
+        and the (256,) 8-byte tails and their lengths, indexed by b
+    """
+    heads = [f"rgb({r}, {g}".encode('ascii') for r in range(256) for g in range(256)]
+    tails = [f", {b})\n".encode('ascii') for b in range(256)]
+    return (
+        np.frombuffer(b''.join(head.ljust(16, b'\0') for head in heads), dtype='V16'),
+        np.array([len(head) for head in heads], dtype=np.intp),
+        np.frombuffer(b''.join((tail + b'rgb(')[:8] for tail in tails), dtype='<u8'),
+        np.array([len(tail) for tail in tails], dtype=np.intp),
+    )
+
+
+def _unaligned(buffer: np.ndarray, dtype: str) -> np.ndarray:
+    """View a uint8 buffer as overlapping items of dtype, one starting at every byte."""
+    itemsize = np.dtype(dtype).itemsize
+    return np.ndarray((len(buffer) - itemsize + 1,), dtype=dtype, buffer=buffer, strides=(1,))
+
+
+def _lines(blob: bytes, as_bytes: bool) -> Union[List[str], bytes]:
+    """Return newline-terminated output as bytes, or split into a list of strings."""
+    return blob if as_bytes else blob.decode('ascii').splitlines()
+
+
+def format_hex_array(rgb: np.ndarray, as_bytes: bool = False) -> Union[List[str], bytes]:
+    """
+    Format an array of RGB colours as uppercase hex strings (e.g., "#FF0000").
+
+    Args:
+        rgb (array-like): (N, 3) array of RGB values (0-255)
+        as_bytes (bool): Return one bytes blob with a line per colour, each ending in a newline
+
+    Returns:
+        List[str] or bytes: Hex colour codes
+    """
+    rgb = np.asarray(rgb, dtype=np.uint8).reshape(-1, 3)
+    lines = np.empty((len(rgb), 8), dtype=np.uint8)
+    lines[:, 0] = ord('#')
+    lines[:, 1:7] = _HEX_DIGITS[rgb].reshape(-1, 6)
+    lines[:, 7] = ord('\n')
+    return _lines(lines.tobytes(), as_bytes)
+
+
+def format_rgb_array(rgb: np.ndarray, as_bytes: bool = False) -> Union[List[str], bytes]:
+    """
+    Format an array of RGB colours as rgb strings (e.g., "rgb(255, 0, 0)").
+
+    Args:
+        rgb (array-like): (N, 3) array of RGB values (0-255)
+        as_bytes (bool): Return one bytes blob with a line per colour, each ending in a newline
+
+    Returns:
+        List[str] or bytes: RGB colour strings
+    """
+    rgb = np.asarray(rgb, dtype=np.uint8).reshape(-1, 3)
+    heads, head_lengths, tails, tail_lengths = _rgb_tables()
+    # Every line is at most 19 bytes, plus room for the last head or tail to overrun
+    blob = np.empty(len(rgb) * 19 + 16, dtype=np.uint8)
+    head_items, tail_items = _unaligned(blob, 'V16'), _unaligned(blob, '<u8')
+
+    # Lay the variable-length lines end to end. Heads go first; each tail then overwrites
+    # its head's padding, and its own overrun is the next line's "rgb(", rewritten unchanged
+    size = 0
+    for start in range(0, len(rgb), _FORMAT_BLOCK):
+        block = rgb[start:start + _FORMAT_BLOCK]
+        keys = np.left_shift(block[:, 0], 8, dtype=np.intp)
+        keys |= block[:, 1]
+        head_starts = head_lengths[keys]
+        tail_starts = tail_lengths[block[:, 2]]
+        ends = head_starts + tail_starts
+        np.cumsum(ends, out=ends)
+        ends += size
+        size = int(ends[-1])
+        np.subtract(ends, tail_starts, out=tail_starts)
+        np.subtract(tail_starts, head_starts, out=head_starts)
+        head_items[head_starts] = heads[keys]
+        tail_items[tail_starts] = tails[block[:, 2]]
+    return _lines(blob[:size].tobytes(), as_bytes)
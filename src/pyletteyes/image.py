@@ -0,0 +1,342 @@
+import math
+import os
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+from PIL import Image
+
+from .colour import Colour
+from .convert import unpack_rgb
+from .palette import Palette
+from .quantize import kmeans, median_cut, octree
+
+# Number of distinct 24-bit colours, one histogram bin each
+_HISTOGRAM_BINS = 1 << 24
+
+# Pixels up to which colours are counted by sorting them, rather than in 2^24 bins that take
+# 128 MB and a pass over all of them; also the most pixels packed and held at a time
+_SORT_LIMIT = 1 << 22
+
+# np.add.at is only fast for simple cases from numpy 1.25; before that, np.bincount is used
+_FAST_ADD_AT = np.lib.NumpyVersion(np.__version__) >= '1.25.0'
+
+# Pixels counted at a time with np.add.at, small enough for their indices to stay in cache
+_COUNT_BLOCK = 1 << 16
+
+# Default image rows decoded at a time by read_strips
+DEFAULT_STRIP_ROWS = 256
+
+# Modes whose conversion to RGB depends on nothing but the pixels, so strips can be decoded on their own
+_STREAMABLE_MODES = ('1', 'L', 'LA', 'RGB', 'RGBA', 'RGBX', 'CMYK')
+
+ImageSource = Union[str, os.PathLike, Image.Image]
+
+
+def _load_rgb(image: ImageSource) -> np.ndarray:
+    """Decode an image path or PIL image into an (H, W, 3) uint8 array, dropping any alpha."""
+    if isinstance(image, Image.Image):
+        return np.asarray(image if image.mode == 'RGB' else image.convert('RGB'))
+    with Image.open(image) as opened:
+        return np.asarray(opened if opened.mode == 'RGB' else opened.convert('RGB'))
+
+
+def _reduced_size(size: Tuple[int, int], max_pixels: Optional[int], scale: Optional[float]) -> Optional[Tuple[int, int]]:
+    """Largest size within the pixel budget and scale keeping the aspect ratio, or None if the image already fits."""
+    width, height = size
+    factor = 1 / scale if scale is not None else 1.0
+    if max_pixels is not None and width * height > max_pixels:
+        factor = max(factor, math.sqrt(width * height / max_pixels))
+    if factor <= 1:
+        return None
+    return max(1, int(width / factor)), max(1, int(height / factor))
+
+
+def _load_reduced(image: ImageSource, max_pixels: Optional[int], scale: Optional[float]) -> Image.Image:
+    """
+    Decode an image to RGB at no more than the requested resolution.
+
+    JPEG files opened here are decoded at 1/2, 1/4 or 1/8 scale straight from the DCT
+    coefficients with draft(), as close to the target as possible without going under it.
+    Images passed in are left untouched, so they are always decoded in full. The rest of
+    the way to the target is a box-filtered resize, which reduce()s by whole factors first.
+    """
+    if not isinstance(image, Image.Image):
+        with Image.open(image) as opened:
+            target = _reduced_size(opened.size, max_pixels, scale)
+            if target is not None and opened.format == 'JPEG':
+                opened.draft('RGB', target)
+            return _resize_rgb(opened, target)
+    return _resize_rgb(image, _reduced_size(image.size, max_pixels, scale))
+
+
+def _resize_rgb(image: Image.Image, target: Optional[Tuple[int, int]]) -> Image.Image:
+    """Convert an image to a new RGB image of the target size, or of its own size if None."""
+    rgb = image.convert('RGB')  # Always a new, decoded image, so a file opened by the caller can close
+    if target is None or rgb.size == target:
+        return rgb
+    return rgb.resize(target, Image.BOX, reducing_gap=2.0)
+
+
+def _raw_layout(opened: Image.Image) -> Optional[List[Tuple[Tuple[int, int, int, int], int, str, int, int, int]]]:
+    """
+    Work out where each row of an undecoded, uncompressed image lies in its file.
+
+    Returns:
+        List of (box, offset, rawmode, stride, orientation, line bytes) per tile, or None
+        if the image cannot be read strip by strip and has to be decoded whole
+    """
+    # Images made in memory, or already decoded, have no tiles left to read
+    tiles = getattr(opened, 'tile', None)
+    if (not tiles or getattr(opened, 'fp', None) is None or opened.mode not in _STREAMABLE_MODES
+            or any(tile[0] != 'raw' for tile in tiles)):
+        return None
+    layout = []
+    for tile in tiles:
+        box, offset, args = tuple(tile[1]), tile[2], tile[3]
+        rawmode, stride, orientation = ((args if isinstance(args, tuple) else (args,)) + (0, 1))[:3]
+        try:
+            line = len(Image.new(opened.mode, (box[2] - box[0], 1)).tobytes('raw', rawmode))
+        except (ValueError, OSError):
+            return None  # A rawmode Pillow only knows how to decode
+        layout.append((box, offset, rawmode, stride or line, orientation, line))
+    return layout
+
+
+def _raw_strips(opened: Image.Image, layout: list, strip_rows: int) -> Iterator[np.ndarray]:
+    """Read and decode the rows of an uncompressed image from its file, strip_rows at a time."""
+    for (x0, y0, x1, y1), offset, rawmode, stride, orientation, line in layout:
+        height = y1 - y0
+        for start in range(0, height, strip_rows):
+            rows = min(strip_rows, height - start)
+            # Bottom-up files store the last row first
+            first = start if orientation >= 0 else height - start - rows
+            opened.fp.seek(offset + first * stride)
+            data = opened.fp.read((rows - 1) * stride + line)
+            strip = Image.frombytes(opened.mode, (x1 - x0, rows), data, 'raw', rawmode, stride, orientation)
+            yield np.asarray(strip if strip.mode == 'RGB' else strip.convert('RGB'))
+
+
+def _cropped_strips(opened: Image.Image, strip_rows: int) -> Iterator[np.ndarray]:
+    """Convert a decoded image to RGB strip_rows at a time."""
+    width, height = opened.size
+    for start in range(0, height, strip_rows):
+        strip = opened.crop((0, start, width, min(start + strip_rows, height)))
+        yield np.asarray(strip if strip.mode == 'RGB' else strip.convert('RGB'))
+
+
+def read_strips(image: ImageSource, strip_rows: int = DEFAULT_STRIP_ROWS) -> Iterator[np.ndarray]:
+    """
+    Read an image as strips of rows, converted to RGB, without holding the whole image.
+
+    Uncompressed images (such as uncompressed TIFF, BMP and PPM files) are read from the
+    file one strip at a time, so memory is proportional to the strip size. Other images have
+    to be decoded whole by Pillow first, and are then only converted to RGB strip by strip.
+
+    Args:
+        image (str, PathLike or PIL.Image.Image): Image file path or an opened image
+        strip_rows (int): Maximum number of image rows per strip
+
+    Yields:
+        np.ndarray: (rows, width, 3) uint8 strips; tiled files yield each tile in turn
+
+    Raises:
+        ValueError: If strip_rows is less than 1
+    """
+    if strip_rows < 1:
+        raise ValueError("Number of rows per strip must be at least 1")
+    if isinstance(image, Image.Image):
+        layout = _raw_layout(image)
+        yield from _raw_strips(image, layout, strip_rows) if layout else _cropped_strips(image, strip_rows)
+        return
+    with Image.open(image) as opened:
+        layout = _raw_layout(opened)
+        yield from _raw_strips(opened, layout, strip_rows) if layout else _cropped_strips(opened, strip_rows)
+
+
+def _pack_pixels(pixels: np.ndarray, out: np.ndarray) -> None:
+    """Pack contiguous (N, 3) uint8 pixels into out, an integer array of length N, as 0xRRGGBB."""
+    if len(pixels):
+        # The big-endian 4-byte word starting at each pixel is 0xRRGGBB followed by the next
+        # pixel's red byte, so shifting that byte out packs the pixel; the last one has no word
+        words = np.ndarray((len(pixels) - 1,), dtype='>u4', buffer=pixels, strides=(3,))
+        np.right_shift(words, 8, out=out[:-1], casting='unsafe')
+        r, g, b = pixels[-1].tolist()
+        out[-1] = (r << 16) | (g << 8) | b
+
+
+def _count_pixels(bins: np.ndarray, pixels: np.ndarray) -> None:
+    """Add contiguous (N, 3) uint8 pixels to 2^24 int64 bins, packing them a block at a time."""
+    if not _FAST_ADD_AT:
+        packed = np.empty(min(len(pixels), _SORT_LIMIT), dtype=np.intp)
+        for start in range(0, len(pixels), _SORT_LIMIT):
+            block = pixels[start:start + _SORT_LIMIT]
+            _pack_pixels(block, packed[:len(block)])
+            bins += np.bincount(packed[:len(block)], minlength=_HISTOGRAM_BINS)
+        return
+    packed = np.empty(min(len(pixels), _COUNT_BLOCK), dtype=np.intp)
+    for start in range(0, len(pixels), _COUNT_BLOCK):
+        block = pixels[start:start + _COUNT_BLOCK]
+        _pack_pixels(block, packed[:len(block)])
+        np.add.at(bins, packed[:len(block)], 1)
+
+
+def colour_histogram(rgb: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Count every distinct colour of an array of pixels.
+
+    Pixels are packed into 24-bit integers. Small arrays are counted by sorting them;
+    larger ones in bins for all 2^24 possible colours, which is linear in the number of pixels.
+
+    Args:
+        rgb (array-like): (..., 3) uint8 array of pixels, such as an (H, W, 3) image
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (M, 3) uint8 distinct colours in packed order,
+            and their (M,) int64 pixel counts
+    """
+    histogram = ColourHistogram()
+    histogram.add(rgb)
+    return histogram.result()
+
+
+class ColourHistogram:
+    """A histogram of 24-bit colours built up from any number of blocks of pixels.
+
+    Up to a few million pixels are kept packed and counted by sorting. Beyond that, counts
+    move to one int64 bin per possible colour (128 MB), so memory is the same however many
+    pixels are added, and adding a block costs time linear in its size.
+    """
+
+    def __init__(self):
+        """Initialize a new, empty ColourHistogram instance."""
+        self._pending: List[np.ndarray] = []
+        self._pending_count = 0
+        self._bins: Optional[np.ndarray] = None
+        self._pixel_count = 0
+
+    @property
+    def pixel_count(self) -> int:
+        """Get the total number of pixels added."""
+        return self._pixel_count
+
+    def add(self, rgb: np.ndarray) -> None:
+        """
+        Count a block of pixels, such as a strip of image rows.
+
+        Args:
+            rgb (array-like): (..., 3) uint8 array of pixels
+        """
+        pixels = np.ascontiguousarray(rgb, dtype=np.uint8).reshape(-1, 3)
+        self._pixel_count += len(pixels)
+        if self._bins is None and self._pending_count + len(pixels) <= _SORT_LIMIT:
+            packed = np.empty(len(pixels), dtype=np.uint32)
+            _pack_pixels(pixels, packed)
+            self._pending.append(packed)
+            self._pending_count += len(packed)
+            return
+        if self._bins is None:
+            self._bins = np.zeros(_HISTOGRAM_BINS, dtype=np.int64)
+            packed, counts = self._count_pending()
+            self._bins[packed] += counts
+            self._pending, self._pending_count = [], 0
+        _count_pixels(self._bins, pixels)
+
+    def _count_pending(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Count the packed pixels not yet in bins by sorting them, into packed colours and int64 counts."""
+        pending = np.concatenate(self._pending) if self._pending else np.empty(0, dtype=np.uint32)
+        packed, counts = np.unique(pending, return_counts=True)
+        return packed, counts.astype(np.int64)
+
+    def result(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get every colour counted so far, in the same form as colour_histogram().
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (M, 3) uint8 distinct colours in packed order,
+                and their (M,) int64 pixel counts
+        """
+        if self._bins is None:
+            packed, counts = self._count_pending()
+            return unpack_rgb(packed), counts
+        packed = np.flatnonzero(self._bins)
+        return unpack_rgb(packed), self._bins[packed]
+
+
+def _most_frequent(colours: np.ndarray, counts: np.ndarray, n_colours: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Keep the n_colours most frequent colours of a histogram, ties going to the lower packed value."""
+    if len(counts) > n_colours:
+        # Partition first so that only the candidates get sorted
+        candidates = np.argpartition(-counts, n_colours - 1)[:n_colours]
+        threshold = counts[candidates].min()
+        candidates = np.flatnonzero(counts >= threshold)
+    else:
+        candidates = np.arange(len(counts))
+    order = candidates[np.argsort(-counts[candidates], kind='stable')][:n_colours]
+    return colours[order], counts[order]
+
+
+# Palette extraction strategies, each reducing a colour histogram to at most n_colours weighted colours
+_STRATEGIES: Dict[str, Callable[..., Tuple[np.ndarray, np.ndarray]]] = {
+    'frequency': _most_frequent,
+    'median_cut': median_cut,
+    'kmeans': kmeans,
+    'octree': octree,
+}
+
+
+def extract_palette(image: ImageSource, n_colours: int = 8, strategy: str = 'frequency',
+                    strip_rows: Optional[int] = None, max_pixels: Optional[int] = None,
+                    scale: Optional[float] = None, return_sample_size: bool = False,
+                    **options) -> Union[Tuple[Palette, np.ndarray], Tuple[Palette, np.ndarray, int]]:
+    """
+    Extract a palette from an image, with the number of pixels each colour represents.
+
+    Args:
+        image (str, PathLike or PIL.Image.Image): Image file path or an opened image
+        n_colours (int): Maximum number of colours in the palette
+        strategy (str): Extraction strategy; 'frequency' keeps the most common exact colours,
+            'median_cut' splits the colour histogram into boxes of similar colours,
+            'kmeans' clusters sampled pixels by mini-batch k-means,
+            'octree' merges the sparsest branches of a colour octree
+        strip_rows (int, optional): Read the image in strips of this many rows with read_strips()
+            and count them into one histogram, rather than decoding it into a single array;
+            the result is the same
+        max_pixels (int, optional): Decode the image at a reduced resolution of at most this
+            many pixels, using JPEG draft mode where possible
+        scale (float, optional): Decode the image at most at this fraction of its width and height
+        return_sample_size (bool): Also return the number of pixels the palette was extracted
+            from, which is smaller than the image when it was decoded at a reduced resolution
+        **options: Extra arguments for the strategy, such as seed and init for 'kmeans'
+
+    Returns:
+        Tuple[Palette, np.ndarray]: Palette ordered by descending weight, and (K,) pixel weights,
+            followed by the sample size if return_sample_size is set
+
+    Raises:
+        ValueError: If n_colours, strip_rows or max_pixels is less than 1, scale is not in (0, 1],
+            the strategy is unknown, or the image has no pixels
+    """
+    if n_colours < 1:
+        raise ValueError("Number of colours must be at least 1")
+    if strategy not in _STRATEGIES:
+        raise ValueError(f"Unknown strategy {strategy!r}, expected one of {list(_STRATEGIES)}")
+    if max_pixels is not None and max_pixels < 1:
+        raise ValueError("Maximum number of pixels must be at least 1")
+    if scale is not None and not 0 < scale <= 1:
+        raise ValueError("Scale must be greater than 0 and at most 1")
+
+    if max_pixels is not None or scale is not None:
+        image = _load_reduced(image, max_pixels, scale)
+
+    if strip_rows is None:
+        colours, counts = colour_histogram(_load_rgb(image))
+    else:
+        histogram = ColourHistogram()
+        for strip in read_strips(image, strip_rows):
+            histogram.add(strip)
+        colours, counts = histogram.result()
+    if not len(counts):
+        raise ValueError("Image has no pixels")
+    rgb, weights = _STRATEGIES[strategy](colours, counts, n_colours, **options)
+    palette = Palette([Colour._from_valid(r, g, b) for r, g, b in rgb.tolist()])
+    return (palette, weights, int(counts.sum())) if return_sample_size else (palette, weights)
@@ -1,17 +1,58 @@
-from typing import List, Optional, Tuple
+from collections import Counter
+from typing import Any, Callable, Hashable, Iterable, List, Optional, Sequence, Tuple, Union
 from .colour import Colour
+from .convert import rgb_to_hsl, unpack_rgb
+from .formatting import format_hex_array, format_rgb_array
+from .parsing import _format_indices, parse_css_colour_array, parse_hex_array
+from .scoring import (
+    DEFAULT_BLOCK_SIZE, PaletteScores, _contrast_of_luminance, brightness_balance_score, brightness_score, harmony_score,
+    luminance, pair_sums, pair_sums_with, saturation_variation_score, score_all, scores_from_pair_sums,
+    temperature_variation_score, uniqueness_score,
+)
 import numpy as np
 
+_DOMINANT_STRATEGIES = ('frequency', 'centroid', 'perceptual')
+
+# High bits of each RGB channel kept when clustering for the 'centroid' strategy (8 levels per channel)
+_CENTROID_CELL_BITS = 3
+
+# Clusters for the 'perceptual' strategy: hue sectors, saturation and lightness bands, and
+# the saturation below which hue is ignored (greys only split by lightness)
+_PERCEPTUAL_HUES, _PERCEPTUAL_SATURATIONS, _PERCEPTUAL_LIGHTNESSES = 12, 3, 5
+_PERCEPTUAL_GREY = 0.1
+
+
+def _group_totals(keys: np.ndarray, weights: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Total the weights of colours sharing a key, returning each colour's group total and group index."""
+    _, groups = np.unique(keys, return_inverse=True)
+    groups = groups.reshape(-1)
+    return np.bincount(groups, weights=weights)[groups], groups
+
+
+def _perceptual_cells(hsl: np.ndarray) -> np.ndarray:
+    """Assign (N, 3) HSL colours to clusters of similar appearance, returning one integer key per colour."""
+    h, s, l = hsl[:, 0], hsl[:, 1], hsl[:, 2]
+    # Centre a hue sector on 0 so pure reds are not split across the wrap-around
+    hue = np.floor(h * _PERCEPTUAL_HUES + 0.5).astype(np.intp) % _PERCEPTUAL_HUES
+    saturation = np.minimum((s * _PERCEPTUAL_SATURATIONS).astype(np.intp), _PERCEPTUAL_SATURATIONS - 1)
+    lightness = np.minimum((l * _PERCEPTUAL_LIGHTNESSES).astype(np.intp), _PERCEPTUAL_LIGHTNESSES - 1)
+    grey = s < _PERCEPTUAL_GREY
+    hue = np.where(grey, _PERCEPTUAL_HUES, hue)  # Greys get a sector of their own
+    saturation = np.where(grey, 0, saturation)
+    return (hue * _PERCEPTUAL_SATURATIONS + saturation) * _PERCEPTUAL_LIGHTNESSES + lightness
+
 
 class Palette:
     """A class representing a collection of colours with analysis capabilities."""
 
-    def __init__(self, colours: List[Colour]):
+    def __init__(self, colours: List[Colour], incremental: bool = False):
         """
         Initialize a new Palette instance.
 
         Args:
             colours (List[Colour]): List of Colour objects
+            incremental (bool): Keep running pair sums so that contrast, uniqueness and harmony
+                cost O(n) per add_colour/remove_colour rather than a walk over all pairs
 
         Raises:
             ValueError: If palette is empty
@@ -19,6 +60,12 @@ class Palette:
         if not colours:
             raise ValueError("Palette must contain at least one colour")
         self._colours = colours.copy()  # Create a copy to prevent external modification
+        self._counts = Counter(self._colours)  # O(1) membership checks
+        self._version = 0  # Bumped on every mutation
+        self._cache = {}  # Derived arrays and scores, valid while _cache_version matches _version
+        self._cache_version = 0
+        # Sums of the pairwise score terms, updated on mutation when incremental
+        self._pair_sums = pair_sums(self._rgb_array(), self._hsl_array()) if incremental else None
 
     @property
     def colours(self) -> List[Colour]:
@@ -30,6 +77,37 @@ class Palette:
         """Get the number of colours in the palette."""
         return len(self._colours)
 
+    def _cached(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Get a value derived from the colours, computing it only once per mutation."""
+        if self._cache_version != self._version:
+            self._cache.clear()
+            self._cache_version = self._version
+        if key not in self._cache:
+            value = compute()
+            if isinstance(value, np.ndarray):
+                value.flags.writeable = False
+            self._cache[key] = value
+        return self._cache[key]
+
+    def clear_cache(self) -> None:
+        """Release the cached arrays and scores; they are rebuilt on next use."""
+        self._cache.clear()
+
+    def _rgb_array(self) -> np.ndarray:
+        """Get the RGB values of all colours as a read-only (N, 3) uint8 array."""
+        def compute():
+            packed = np.fromiter((c.packed for c in self._colours), dtype=np.uint32, count=len(self._colours))
+            return unpack_rgb(packed)
+        return self._cached('rgb', compute)
+
+    def _hsl_array(self) -> np.ndarray:
+        """Get the HSL values of all colours as a read-only (N, 3) array."""
+        return self._cached('hsl', lambda: rgb_to_hsl(self._rgb_array()))
+
+    def _luminance_array(self) -> np.ndarray:
+        """Get the luminance of all colours as a read-only (N,) array."""
+        return self._cached('luminance', lambda: luminance(self._rgb_array()))
+
     def score_contrast(self) -> float:
         """
         Calculate the overall contrast score of the palette.
@@ -40,88 +118,46 @@ class Palette:
         """
         if self.size < 2:
             return 1.0  # Single colour has no contrast
+        if self._pair_sums is not None:
+            return scores_from_pair_sums(self._pair_sums, self.size)[0]
 
-        contrasts = []
-        for i, c1 in enumerate(self._colours):
-            for c2 in self._colours[i + 1:]:
-                # Calculate contrast using luminance difference
-                # Convert RGB to luminance using standard coefficients
-                l1 = 0.299 * c1.rgb[0] + 0.587 * c1.rgb[1] + 0.114 * c1.rgb[2]
-                l2 = 0.299 * c2.rgb[0] + 0.587 * c2.rgb[1] + 0.114 * c2.rgb[2]
-
-                # Normalize luminance difference
-                contrast = abs(l1 - l2) / 255
-                contrasts.append(contrast)
+        return self._cached('contrast', lambda: _contrast_of_luminance(self._luminance_array()))
 
-        return sum(contrasts) / len(contrasts)
 
-
-    def score_uniqueness(self) -> float:
+    def score_uniqueness(self, block_size: int = DEFAULT_BLOCK_SIZE) -> float:
         """
         Score the palette based on how distinct colours are from one another.
         Higher scores indicate greater uniqueness.
+        :param block_size: Colours per side of each pairwise tile, bounding memory use (unused when incremental)
         :return:
             float: Uniqueness score between 0 and 1
         """
         if self.size < 2:
             return 1.0
+        if self._pair_sums is not None:
+            return scores_from_pair_sums(self._pair_sums, self.size)[1]
 
-        rgb_values = np.array([
-            [int(c.rgb[0]), int(c.rgb[1]), int(c.rgb[2])]
-            for c in self._colours
-        ], dtype=np.int32)
-
-        similarities = []
-        for i in range(len(rgb_values)):
-            for j in range(i + 1, len(rgb_values)):
-                # Max possible distance in RGB space is sqrt(255^2 * 3) ≈ 441.67
-                distance = np.sqrt(np.sum((rgb_values[i].astype(float) - rgb_values[j].astype(float)) ** 2))
-                similarity = 1 - (distance / 441.67)
-                similarities.append(similarity)
+        return self._cached(('uniqueness', block_size), lambda: uniqueness_score(self._rgb_array(), block_size))
 
-        return float(1 - np.mean(similarities))
 
-
-    def score_harmony(self) -> float:
+    def score_harmony(self, block_size: int = DEFAULT_BLOCK_SIZE) -> float:
         """
         Calculate the colour harmony score of the palette.
         Based on hue differences and standard colour theory principles.
         Higher scores indicate more harmonious combinations.
 
+        Args:
+            block_size (int): Colours per side of each pairwise tile, bounding memory use (unused when incremental)
+
         Returns:
             float: Harmony score between 0 and 1
         """
         if self.size < 2:
             return 1.0
+        if self._pair_sums is not None:
+            return scores_from_pair_sums(self._pair_sums, self.size)[2]
 
-        # Get all HSL values
-        hsls = [c.hsl for c in self._colours]
-
-        # Calculate hue differences
-        harmony_scores = []
-        for i, (h1, _, _) in enumerate(hsls):
-            for h2, _, _ in hsls[i + 1:]:
-                # Calculate the smallest hue difference accounting for circular nature
-                hue_diff = min(abs(h1 - h2), 1 - abs(h1 - h2))
-
-                # Score based on common harmony principles
-                # Perfect harmony at:
-                # - 0 (same hue/monochromatic) = 1.0
-                # - 1/6 (30° analogous) = 0.8
-                # - 1/3 (120° triadic) = 0.9
-                # - 1/2 (180° complementary) = 0.85
-                harmony = max(
-                    1.0 if hue_diff < 0.01 else 0,  # Monochromatic
-                    0.8 if abs(hue_diff - 1 / 6) < 0.1 else 0,  # Analogous
-                    0.9 if abs(hue_diff - 1 / 3) < 0.1 else 0,  # Triadic
-                    0.85 if abs(hue_diff - 1 / 2) < 0.1 else 0,  # Complementary
-                    # Base score for other relationships
-                    0.5 - min(abs(hue_diff - 0), abs(hue_diff - 1 / 6),
-                              abs(hue_diff - 1 / 3), abs(hue_diff - 1 / 2))
-                )
-                harmony_scores.append(harmony)
-
-        return sum(harmony_scores) / len(harmony_scores)
+        return self._cached(('harmony', block_size), lambda: harmony_score(self._hsl_array(), block_size))
 
     def score_saturation_variation(self) -> float:
         """
@@ -132,8 +168,7 @@ class Palette:
         if self.size < 2:
             return 1.0
 
-        saturations = [c.hsl[1] for c in self._colours]
-        return float(np.std(saturations))
+        return self._cached('saturation_variation', lambda: saturation_variation_score(self._hsl_array()))
 
 
     def score_temperature_variation(self) -> float:
@@ -145,10 +180,7 @@ class Palette:
         if self.size < 2:
             return 1.0
 
-        hues = [c.hsl[0] for c in self._colours]
-        warm_colors = sum(1 for h in hues if h <= 0.167 or h >= 0.833)
-        cool_colors = len(hues) - warm_colors
-        return float(1 - abs(warm_colors - cool_colors) / len(hues))
+        return self._cached('temperature_variation', lambda: temperature_variation_score(self._hsl_array()))
 
 
     def score_brightness(self) -> float:
@@ -158,13 +190,8 @@ class Palette:
         Returns:
             float: Brightness score between 0 and 1
         """
-        brightnesses = []
-        for colour in self._colours:
-            # Use the lightness component from HSL
-            _, _, lightness = colour.hsl
-            brightnesses.append(lightness)
-
-        return sum(brightnesses) / len(brightnesses)
+        # Use the lightness component from HSL
+        return self._cached('brightness', lambda: brightness_score(self._hsl_array()))
 
 
     def score_brightness_balance(self) -> float:
@@ -176,21 +203,86 @@ class Palette:
         if self.size < 2:
             return 1.0
 
-        values = [c.hsl[2] for c in self._colours]
+        return self._cached('brightness_balance', lambda: brightness_balance_score(self._hsl_array()))
+
+    def score_all(self, block_size: int = DEFAULT_BLOCK_SIZE) -> PaletteScores:
+        """
+        Calculate every score of the palette in one pass.
+        Equivalent to calling each score_* method, but the RGB, HSL and luminance
+        arrays are built once and the pairwise scores share a walk over the pairs.
 
-        return float(1 - abs(np.mean(values) - 0.5) * 2)
+        Args:
+            block_size (int): Colours per side of each pairwise tile, bounding memory use
+
+        Returns:
+            PaletteScores: Every score, each between 0 and 1
+        """
+        if self._pair_sums is not None:
+            # Pairwise scores come straight from the running sums
+            return PaletteScores(
+                self.score_contrast(), self.score_uniqueness(), self.score_harmony(),
+                self.score_saturation_variation(), self.score_temperature_variation(),
+                self.score_brightness(), self.score_brightness_balance(),
+            )
+        return self._cached(('all', block_size), lambda: score_all(
+            self._rgb_array(), self._hsl_array(), block_size, self._luminance_array()))
 
 
-    def get_dominant_colour(self) -> Colour:
+    def get_dominant_colour(self, weights: Optional[Sequence[float]] = None, strategy: str = 'frequency') -> Colour:
         """
         Get the most dominant colour in the palette.
-        Currently returns the first colour, but could be enhanced with
-        clustering or frequency analysis.
+
+        Strategies:
+        - 'frequency': the colour with the greatest total weight, repeats included
+        - 'centroid': the weighted mean of the heaviest cluster of nearby RGB values
+        - 'perceptual': the heaviest colour within the heaviest cluster of similar
+          hue, saturation and lightness, so near-identical shades pool their weight
+        Ties go to the colour (or cluster) that appears first.
+
+        Args:
+            weights (Sequence[float], optional): Non-negative weight per colour, such as
+                pixel counts; every colour counts once if omitted
+            strategy (str): One of 'frequency', 'centroid' or 'perceptual'
 
         Returns:
             Colour: The dominant colour
-        """
-        return self._colours[0]
+
+        Raises:
+            ValueError: If the weights or strategy are invalid
+        """
+        if weights is None:
+            weights = np.ones(self.size)
+        else:
+            weights = np.asarray(weights, dtype=np.float64)
+            if weights.shape != (self.size,):
+                raise ValueError("Weights must have one value per colour")
+            if not np.isfinite(weights).all() or (weights < 0).any() or not weights.any():
+                raise ValueError("Weights must be non-negative and not all zero")
+
+        rgb = self._rgb_array().astype(np.intp)
+        exact = (rgb[:, 0] << 16) | (rgb[:, 1] << 8) | rgb[:, 2]
+        if strategy == 'frequency':
+            keys = exact
+        elif strategy == 'centroid':
+            cells = rgb >> (8 - _CENTROID_CELL_BITS)
+            keys = (cells[:, 0] << (2 * _CENTROID_CELL_BITS)) | (cells[:, 1] << _CENTROID_CELL_BITS) | cells[:, 2]
+        elif strategy == 'perceptual':
+            keys = _perceptual_cells(self._hsl_array())
+        else:
+            raise ValueError(f"Unknown strategy {strategy!r}, expected one of {list(_DOMINANT_STRATEGIES)}")
+
+        # The first colour of the heaviest group
+        totals, groups = _group_totals(keys, weights)
+        first = int(np.argmax(totals))
+        if strategy == 'centroid':
+            in_group = groups == groups[first]
+            centroid = np.average(rgb[in_group], axis=0, weights=weights[in_group])
+            return Colour._from_valid(*(int(v) for v in np.round(centroid)))
+        if strategy == 'perceptual':
+            # Heaviest single colour of the group, summing repeats
+            colour_totals, _ = _group_totals(exact, weights)
+            first = int(np.argmax(np.where(groups == groups[first], colour_totals, -1)))
+        return self._colours[first]
 
 
     def add_colour(self, colour: Colour) -> None:
@@ -200,7 +292,11 @@ class Palette:
         Args:
             colour (Colour): Colour to add
         """
+        if self._pair_sums is not None:
+            self._pair_sums = self._pair_sums + pair_sums_with(colour.rgb, self._rgb_array(), hsl=self._hsl_array())
         self._colours.append(colour)
+        self._counts[colour] += 1
+        self._version += 1
 
     def remove_colour(self, colour: Colour) -> None:
         """
@@ -212,13 +308,95 @@ class Palette:
         Raises:
             ValueError: If colour not in palette or would make palette empty
         """
-        if colour not in self._colours:
+        if colour not in self:
             raise ValueError("Colour not in palette")
         if self.size <= 1:
             raise ValueError("Cannot remove last colour from palette")
-        self._colours.remove(colour)
+        index = self._colours.index(colour)
+        if self._pair_sums is not None:
+            others = np.delete(self._rgb_array(), index, axis=0)
+            self._pair_sums = self._pair_sums - pair_sums_with(
+                colour.rgb, others, hsl=np.delete(self._hsl_array(), index, axis=0))
+        del self._colours[index]
+        self._counts[colour] -= 1
+        if not self._counts[colour]:
+            del self._counts[colour]
+        self._version += 1
 
 
+    @classmethod
+    def from_image(cls, image, n_colours: int = 8, strategy: str = 'frequency', return_weights: bool = False,
+                   strip_rows: Optional[int] = None, max_pixels: Optional[int] = None, scale: Optional[float] = None,
+                   return_sample_size: bool = False, **options) -> Union['Palette', Tuple]:
+        """
+        Create a palette from the colours of an image.
+
+        Args:
+            image (str, PathLike or PIL.Image.Image): Image file path or an opened image
+            n_colours (int): Maximum number of colours in the palette
+            strategy (str): Extraction strategy; 'frequency' keeps the most common exact colours,
+                'median_cut' splits the colour histogram into boxes of similar colours,
+                'kmeans' clusters sampled pixels by mini-batch k-means,
+                'octree' merges the sparsest branches of a colour octree
+            return_weights (bool): Also return the number of pixels each colour represents
+            strip_rows (int, optional): Read the image this many rows at a time instead of whole,
+                bounding memory on huge uncompressed images; the palette is the same
+            max_pixels (int, optional): Decode the image at a reduced resolution of at most
+                this many pixels, trading accuracy for speed
+            scale (float, optional): Decode the image at most at this fraction of its width and height
+            return_sample_size (bool): Also return the number of pixels the palette was extracted from
+            **options: Extra arguments for the strategy, such as seed and init for 'kmeans'
+
+        Returns:
+            Palette: New Palette instance ordered by descending weight, or a tuple of the
+                palette followed by the weights and sample size, whichever were requested
+
+        Raises:
+            ValueError: If n_colours, strip_rows or max_pixels is less than 1, scale is not
+                in (0, 1], the strategy is unknown, or the image has no pixels
+        """
+        from .image import extract_palette  # Imported here as the image module builds on Palette
+
+        palette, weights, sample_size = extract_palette(image, n_colours, strategy, strip_rows, max_pixels, scale,
+                                                        return_sample_size=True, **options)
+        extras = ((weights,) if return_weights else ()) + ((sample_size,) if return_sample_size else ())
+        return (palette,) + extras if extras else palette
+
+    @classmethod
+    def from_pixel_rows(cls, rows: Iterable[np.ndarray], n_colours: int = 8, max_leaves: int = 4096,
+                        return_weights: bool = False) -> Union['Palette', Tuple['Palette', np.ndarray]]:
+        """
+        Create a palette from blocks of pixels with a streaming octree quantizer.
+
+        Only one block and the octree, capped at max_leaves leaves, are held at a time,
+        so memory stays fixed however many pixels the rows add up to.
+
+        Args:
+            rows (Iterable[array-like]): Blocks of (..., 3) uint8 pixels, such as image rows
+            n_colours (int): Maximum number of colours in the palette
+            max_leaves (int): Maximum number of octree leaves kept between blocks
+            return_weights (bool): Also return the number of pixels each colour represents
+
+        Returns:
+            Palette: New Palette instance ordered by descending weight, or a
+                (Palette, weights) tuple if return_weights is set
+
+        Raises:
+            ValueError: If n_colours or max_leaves is less than 1, or the rows hold no pixels
+        """
+        from .quantize import OctreeQuantizer  # Imported here as the quantize module builds on Palette
+
+        if n_colours < 1:
+            raise ValueError("Number of colours must be at least 1")
+        quantizer = OctreeQuantizer(max_leaves)
+        for row in rows:
+            quantizer.add(row)
+        if not quantizer.leaf_count:
+            raise ValueError("Rows contain no pixels")
+        rgb, weights = quantizer.result(n_colours)
+        palette = cls([Colour._from_valid(r, g, b) for r, g, b in rgb.tolist()])
+        return (palette, weights) if return_weights else palette
+
     @classmethod
     def from_list(cls, rgb_colours: List[Tuple[int, int, int]]) -> 'Palette':
         """
@@ -246,14 +424,21 @@ class Palette:
     def from_hex_list(cls, hex_colours: List[str]) -> 'Palette':
         """
         Create a palette from a list of hex colour strings.
+        All strings are parsed in one vectorized pass.
 
         Args:
-            hex_colours (List[str]): List of hex colour codes
+            hex_colours (List[str]): List of hex colour codes ("#RGB", "#RRGGBB" or "#RRGGBBAA")
 
         Returns:
             Palette: New Palette instance
+
+        Raises:
+            ValueError: If any hex string is invalid, listing the invalid indices
         """
-        colours = [Colour.from_hex(hex_str) for hex_str in hex_colours]
+        rgb, invalid = parse_hex_array(hex_colours)
+        if invalid.size:
+            raise ValueError(f"Invalid hex colour strings at indices {_format_indices(invalid)}")
+        colours = [Colour._from_valid(r, g, b) for r, g, b in rgb.tolist()]
         return cls(colours)
 
     def to_hex_list(self) -> List[str]:
@@ -263,21 +448,27 @@ class Palette:
         Returns:
             List[str]: List of hex colour codes
         """
-        return [c.to_hex() for c in self._colours]
+        return format_hex_array(self._rgb_array())
 
 
     @classmethod
     def from_string_list(cls, rgb_colours: List[str]) -> 'Palette':
         """
-        Create a palette from a list of rgb colour strings.
+        Create a palette from a list of CSS rgb(), rgba(), hsl() or hsla() colour strings.
 
         Args:
-            rgb_colours (List[str]): List of rgb colour strings
+            rgb_colours (List[str]): List of colour strings
 
         Returns:
             Palette: New Palette instance
+
+        Raises:
+            ValueError: If any colour string is invalid, listing the invalid indices
         """
-        colours = [Colour.from_string(rgb_str) for rgb_str in rgb_colours]
+        rgb, invalid = parse_css_colour_array(rgb_colours)
+        if invalid.size:
+            raise ValueError(f"Invalid colour strings at indices {_format_indices(invalid)}")
+        colours = [Colour._from_valid(r, g, b) for r, g, b in rgb.tolist()]
         return cls(colours)
 
 
@@ -288,7 +479,7 @@ class Palette:
         Returns:
             List[str]: List of rgb colour strings
         """
-        return [c.to_string() for c in self._colours]
+        return format_rgb_array(self._rgb_array())
 
     def __len__(self) -> int:
         """Get the number of colours in the palette."""
@@ -298,11 +489,15 @@ class Palette:
         """Get a colour by index."""
         return self._colours[index]
 
+    def __contains__(self, colour: object) -> bool:
+        """Check whether a colour is in the palette."""
+        return isinstance(colour, Colour) and colour in self._counts
+
     def __iter__(self):
         """Iterate over colours in the palette."""
         return iter(self._colours)
 
     def __repr__(self) -> str:
         """String representation of the palette."""
-        hex_colours = [c.to_hex() for c in self._colours]
+        hex_colours = format_hex_array(self._rgb_array())
         return f"Palette(colours={hex_colours})"
@@ -0,0 +1,206 @@
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from .batch import PaletteBatch
+from .colour import Colour
+from .image import _STRATEGIES, ImageSource, extract_palette
+from .palette import Palette
+from .scoring import PaletteScores
+
+# Palettes per task: large enough to amortize the round trip, small enough to balance load
+DEFAULT_CHUNKSIZE = 2048
+
+
+def _pack_chunks(palettes: Iterable[Palette], chunksize: int) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """Pack palettes into (rgb, offsets) chunks: uint8 colours laid end to end with their start offsets."""
+    palettes = iter(palettes)
+    while True:
+        arrays = [palette._rgb_array() for palette in islice(palettes, chunksize)]
+        if not arrays:
+            return
+        offsets = np.zeros(len(arrays) + 1, dtype=np.intp)
+        np.cumsum([len(a) for a in arrays], out=offsets[1:])
+        yield np.concatenate(arrays), offsets
+
+
+def _score_chunk(rgb: np.ndarray, offsets: np.ndarray) -> PaletteScores:
+    """Score one packed chunk of palettes; runs in the worker processes."""
+    return PaletteBatch.from_offsets(rgb, offsets).score_all()
+
+
+def score_many(palettes: Iterable[Palette], workers: Optional[int] = None,
+               chunksize: int = DEFAULT_CHUNKSIZE) -> PaletteScores:
+    """
+    Calculate every score of many palettes, spread across worker processes.
+
+    Palettes are shipped to the workers as compact uint8 arrays rather than pickled
+    Colour objects, scored with PaletteBatch, and the results returned in input order.
+
+    Args:
+        palettes (Iterable[Palette]): Palettes to score
+        workers (int, optional): Number of worker processes, defaults to the CPU count;
+            1 scores in the calling process
+        chunksize (int): Palettes sent to a worker per task
+
+    Returns:
+        PaletteScores: Every score as a (B,) array, in the order of the palettes
+
+    Raises:
+        ValueError: If workers or chunksize is less than 1
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("Number of workers must be at least 1")
+    if chunksize < 1:
+        raise ValueError("Chunk size must be at least 1")
+
+    chunks = _pack_chunks(palettes, chunksize)
+    if workers == 1:
+        results = [_score_chunk(rgb, offsets) for rgb, offsets in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # Keep a few chunks queued per worker rather than packing every palette up front
+            pending = deque()
+            results = []
+            for rgb, offsets in chunks:
+                pending.append(executor.submit(_score_chunk, rgb, offsets))
+                if len(pending) >= 2 * workers:
+                    results.append(pending.popleft().result())
+            results.extend(future.result() for future in pending)
+
+    if not results:
+        return PaletteScores(*(np.empty(0) for _ in PaletteScores._fields))
+    return PaletteScores(*(np.concatenate(scores) for scores in zip(*results)))
+
+
+def _extract_one(image: ImageSource, n_colours: int, strategy: str, options: dict) -> Tuple[np.ndarray, np.ndarray]:
+    """Extract the palette of one image as (K, 3) uint8 colours and weights; runs in the worker processes."""
+    palette, weights = extract_palette(image, n_colours, strategy, **options)
+    return palette._rgb_array(), weights
+
+
+def _to_palette(rgb: np.ndarray) -> Palette:
+    """Rebuild a palette from the uint8 colours sent back by a worker."""
+    return Palette([Colour._from_valid(r, g, b) for r, g, b in rgb.tolist()])
+
+
+class PaletteExtraction:
+    """An iterator over the palettes of many images, extracted in worker processes.
+
+    Yields (image, palette, weights) for every image that could be read, in the order they
+    finish. Images that fail are recorded in errors as (image, exception) pairs instead of
+    stopping the batch. Only a few images per worker are queued at a time, so images are
+    taken from the input lazily and memory stays bounded however many there are.
+    """
+
+    def __init__(self, images: Iterable[ImageSource], workers: int, n_colours: int, strategy: str, options: dict):
+        """
+        Initialize a new PaletteExtraction instance; use extract_palettes() instead.
+
+        Args:
+            images (Iterable[str, PathLike or PIL.Image.Image]): Images to extract palettes from
+            workers (int): Number of worker processes; 1 extracts in the calling process
+            n_colours (int): Maximum number of colours in each palette
+            strategy (str): Extraction strategy passed to extract_palette()
+            options (dict): Extra arguments passed to extract_palette()
+        """
+        self.errors: List[Tuple[ImageSource, Exception]] = []
+        self._results = self._run(iter(images), workers, n_colours, strategy, options)
+
+    def _run(self, images: Iterator[ImageSource], workers: int, n_colours: int, strategy: str,
+             options: dict) -> Iterator[Tuple[ImageSource, Palette, np.ndarray]]:
+        """Generate the results, starting the workers on the first request."""
+        if workers == 1:
+            for image in images:
+                try:
+                    rgb, weights = _extract_one(image, n_colours, strategy, options)
+                except Exception as error:
+                    self.errors.append((image, error))
+                    continue
+                yield image, _to_palette(rgb), weights
+            return
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = {}
+            try:
+                while True:
+                    # Keep a few images queued per worker rather than submitting them all up front
+                    for image in islice(images, 2 * workers - len(pending)):
+                        pending[executor.submit(_extract_one, image, n_colours, strategy, options)] = image
+                    if not pending:
+                        return
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        image = pending.pop(future)
+                        error = future.exception()
+                        if error is not None:
+                            self.errors.append((image, error))
+                            continue
+                        rgb, weights = future.result()
+                        yield image, _to_palette(rgb), weights
+            finally:
+                # Stopped early: drop the queued images rather than waiting for them
+                for future in pending:
+                    future.cancel()
+
+    def __iter__(self) -> 'PaletteExtraction':
+        return self
+
+    def __next__(self) -> Tuple[ImageSource, Palette, np.ndarray]:
+        return next(self._results)
+
+    def close(self) -> None:
+        """Stop extracting, cancelling queued images and shutting down the workers."""
+        self._results.close()
+
+    def __enter__(self) -> 'PaletteExtraction':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def extract_palettes(images: Iterable[ImageSource], workers: Optional[int] = None, n_colours: int = 8,
+                     strategy: str = 'frequency', **options) -> PaletteExtraction:
+    """
+    Extract the palettes of many images, decoding and quantizing them across worker processes.
+
+    Results are yielded as each image finishes, and errors collected rather than raised:
+
+        extraction = extract_palettes(paths, max_pixels=250_000)
+        for path, palette, weights in extraction:
+            ...
+        for path, error in extraction.errors:
+            ...
+
+    Args:
+        images (Iterable[str, PathLike or PIL.Image.Image]): Images to extract palettes from,
+            read lazily so a generator over a large directory is fine
+        workers (int, optional): Number of worker processes, defaults to the CPU count;
+            1 extracts in the calling process
+        n_colours (int): Maximum number of colours in each palette
+        strategy (str): Extraction strategy, as for extract_palette()
+        **options: Extra arguments for extract_palette(), such as max_pixels or seed
+
+    Returns:
+        PaletteExtraction: Iterator of (image, palette, weights) in order of completion,
+            with failed images and their exceptions in its errors list
+
+    Raises:
+        ValueError: If workers or n_colours is less than 1, or the strategy is unknown
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("Number of workers must be at least 1")
+    if n_colours < 1:
+        raise ValueError("Number of colours must be at least 1")
+    if strategy not in _STRATEGIES:
+        raise ValueError(f"Unknown strategy {strategy!r}, expected one of {list(_STRATEGIES)}")
+    return PaletteExtraction(images, workers, n_colours, strategy, options)
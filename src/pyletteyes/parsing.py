@@ -0,0 +1,300 @@
+import math
+import re
+from typing import Iterable, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .convert import hsl_to_rgb_single
+
+# Maps a character code to its hex digit value, NUL padding to 0x20 and anything else to 0x10
+_HEX_VALUES = np.full(256, 0x10, dtype=np.uint8)
+_HEX_VALUES[0] = 0x20
+for _i, _c in enumerate('0123456789abcdef'):
+    _HEX_VALUES[ord(_c)] = _i
+    _HEX_VALUES[ord(_c.upper())] = _i
+
+# Characters of a hex code; int(..., 16) alone would also accept signs, underscores and whitespace
+_HEX_CHARS = frozenset('0123456789abcdefABCDEF')
+
+# With eight digit values packed little-endian into a uint64, masking with _FLAG_MASK
+# keeps only the padding/invalid flags, which must equal _DIGIT_PATTERNS[n] for
+# exactly n hex digits followed by padding
+_FLAG_MASK = np.uint64(0x3030303030303030)
+_DIGIT_PATTERNS = {n: np.uint64(sum(0x20 << (8 * i) for i in range(n, 8))) for n in (3, 6, 8)}
+
+# CSS Color Level 4 functional notation: rgb(), rgba(), hsl() and hsla() with either
+# legacy comma-separated or modern space-separated arguments and an optional alpha
+_CSS_NUMBER = r'[+-]?(?:\d+\.?\d*|\.\d+)(?:e[+-]?\d+)?'
+_CSS_VALUE = rf'(?:{_CSS_NUMBER}(?:%|deg|grad|rad|turn)?|none)'
+_CSS_FUNCTION = re.compile(rf"""
+    \s*(?P<function>rgba?|hsla?)\(\s*
+    (?:
+        (?P<legacy1>{_CSS_VALUE})\s*,\s*(?P<legacy2>{_CSS_VALUE})\s*,\s*(?P<legacy3>{_CSS_VALUE})
+        (?:\s*,\s*(?P<legacy_alpha>{_CSS_VALUE}))?
+      | (?P<modern1>{_CSS_VALUE})\s+(?P<modern2>{_CSS_VALUE})\s+(?P<modern3>{_CSS_VALUE})
+        (?:\s*/\s*(?P<modern_alpha>{_CSS_VALUE}))?
+    )
+    \s*\)\s*
+""", re.IGNORECASE | re.VERBOSE)
+# Fast path for the most common form, "rgb(R, G, B)" with integer channels
+_CSS_SIMPLE_RGB = re.compile(r'\s*rgba?\(\s*(\d{1,3})\s*,\s*(\d{1,3})\s*,\s*(\d{1,3})\s*\)\s*', re.IGNORECASE)
+# Bare "R, G, B" integer triplets, which Colour.from_string has always accepted
+_BARE_RGB = re.compile(r'\s*(\d{1,3})\s*,\s*(\d{1,3})\s*,\s*(\d{1,3})\s*')
+_CSS_NUMBER_UNIT = re.compile(rf'({_CSS_NUMBER})(.*)', re.IGNORECASE)
+
+_CSS_MEMO_SIZE = 1 << 16
+
+# Degrees per unit of a CSS hue angle
+_ANGLE_UNITS = {'': 1.0, 'deg': 1.0, 'grad': 0.9, 'rad': 180 / math.pi, 'turn': 360.0}
+
+# Rows decoded per pass, bounding the size of temporary arrays
+_CHUNK_ROWS = 1 << 18
+
+# Bytes that may pad out a fixed-stride record after the hex code
+_RECORD_PADDING = np.zeros(256, dtype=bool)
+_RECORD_PADDING[list(b'\x00\n\r\t ,;')] = True
+
+
+def _format_indices(indices: np.ndarray, limit: int = 10) -> str:
+    """Format row indices for an error message, truncating long lists."""
+    shown = ", ".join(str(i) for i in indices[:limit].tolist())
+    if len(indices) > limit:
+        shown += f", ... ({len(indices)} in total)"
+    return f"[{shown}]"
+
+
+def _parse_hex_codes(codes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Decode an (N, width) array of character codes, zero-padded on the right, into RGB."""
+    width = codes.shape[1]
+    chars = np.zeros((len(codes), 9), dtype=np.uint8)
+    chars[:, :min(width, 9)] = np.minimum(codes[:, :9], 255)  # Codes above 255 stay invalid
+
+    # Align the digits of every row, with or without its leading '#'
+    has_hash = chars[:, 0] == ord('#')
+    digits = np.where(has_hash[:, np.newaxis], chars[:, 1:9], chars[:, 0:8])
+    values = _HEX_VALUES[digits]
+
+    flags = values.view('<u8')[:, 0] & _FLAG_MASK
+    short = flags == _DIGIT_PATTERNS[3]
+    valid = short | (flags == _DIGIT_PATTERNS[6]) | (flags == _DIGIT_PATTERNS[8])
+    valid &= has_hash | (chars[:, 8] == 0)
+    if width > 9:
+        valid &= ~codes[:, 9:].any(axis=1)
+
+    rgb = np.where(short[:, np.newaxis], values[:, 0:3] * 17, values[:, 0:6:2] * 16 + values[:, 1:6:2])
+    rgb[~valid] = 0
+    return rgb, np.flatnonzero(~valid)
+
+
+def _parse_hex_chunks(codes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Decode a character code array chunk by chunk, merging the results."""
+    rgb = np.empty((len(codes), 3), dtype=np.uint8)
+    invalid = []
+    for start in range(0, len(codes), _CHUNK_ROWS):
+        chunk = codes[start:start + _CHUNK_ROWS]
+        rgb[start:start + len(chunk)], chunk_invalid = _parse_hex_codes(chunk)
+        invalid.append(chunk_invalid + start)
+    return rgb, np.concatenate(invalid) if invalid else np.zeros(0, dtype=np.intp)
+
+
+def parse_hex_colour(text: str) -> Tuple[int, int, int]:
+    """
+    Parse one hex colour string, with the same grammar as parse_hex_array.
+
+    Args:
+        text (str): Hex colour code (e.g., "#FF0000", "F00" or "#FF000080")
+
+    Returns:
+        Tuple[int, int, int]: Red, Green, Blue (0-255)
+
+    Raises:
+        ValueError: If the string is not "#RGB", "#RRGGBB" or "#RRGGBBAA", with or without the "#"
+    """
+    digits = text[1:] if text.startswith('#') else text
+    if len(digits) not in (3, 6, 8):
+        raise ValueError("Hex colour must be 3, 6 or 8 characters long")
+    if not _HEX_CHARS.issuperset(digits):
+        raise ValueError("Invalid hex colour string")
+    if len(digits) == 3:
+        value = int(digits, 16)
+        return (value >> 8) * 17, (value >> 4 & 0xF) * 17, (value & 0xF) * 17
+    value = int(digits[:6], 16)
+    return value >> 16, value >> 8 & 0xFF, value & 0xFF
+
+
+def parse_hex_array(hex_strings: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Parse a sequence of hex colour strings into an RGB array in one vectorized pass.
+
+    Accepts "#RGB", "#RRGGBB" and "#RRGGBBAA" (alpha is discarded), with or without
+    the leading "#". Invalid strings do not stop parsing; their rows are zeroed and
+    their indices returned.
+
+    Args:
+        hex_strings (Sequence[str]): Hex colour codes (e.g., ["#FF0000", "0F0"])
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (N, 3) uint8 RGB array and the indices of invalid strings
+    """
+    strings = np.asarray(hex_strings)
+    if strings.dtype.kind != 'U':
+        strings = strings.astype(str)
+
+    strings = np.ascontiguousarray(strings.reshape(-1))
+    codes = strings.view(np.uint32).reshape(len(strings), strings.itemsize // 4)
+    return _parse_hex_chunks(codes)
+
+
+def parse_hex_buffer(buffer: Union[bytes, bytearray, memoryview], stride: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Parse hex colour codes packed into a buffer of fixed-size records.
+
+    Each record holds one hex code, optionally followed by padding bytes (NUL,
+    whitespace, "," or ";"), e.g. b"#FF0000\\n#00FF00\\n" with a stride of 8.
+
+    Args:
+        buffer (bytes): Buffer whose length is a multiple of stride
+        stride (int): Size of each record in bytes
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (N, 3) uint8 RGB array and the indices of invalid records
+
+    Raises:
+        ValueError: If the buffer length is not a multiple of stride
+    """
+    data = np.frombuffer(buffer, dtype=np.uint8)
+    if stride < 1 or len(data) % stride:
+        raise ValueError("Buffer length must be a multiple of the record stride")
+
+    codes = data.reshape(-1, stride)
+    return _parse_hex_chunks(np.where(_RECORD_PADDING[codes], 0, codes))
+
+
+def _css_value(token: str, modern: bool) -> Tuple[float, str]:
+    """Split a CSS value token into its number and unit ("none" is 0 in modern syntax)."""
+    if token.lower() == 'none':
+        if not modern:
+            raise ValueError("'none' is only allowed in space-separated syntax")
+        return 0.0, ''
+    number, unit = _CSS_NUMBER_UNIT.fullmatch(token).groups()
+    value = float(number)
+    if not math.isfinite(value):
+        raise ValueError(f"Value out of range: {token!r}")
+    return value, unit.lower()
+
+
+def _css_percentage(token: str, modern: bool) -> float:
+    """Parse a saturation or lightness value as a 0-1 fraction."""
+    value, unit = _css_value(token, modern)
+    if unit != '%' and not (modern and unit == ''):
+        raise ValueError("Saturation and lightness must be percentages")
+    if not 0 <= value <= 100:
+        raise ValueError("Saturation and lightness must be between 0% and 100%")
+    return value / 100
+
+
+def _css_alpha(token: Optional[str], modern: bool) -> None:
+    """Validate an alpha value, which Colour does not store."""
+    if token is None:
+        return
+    value, unit = _css_value(token, modern)
+    if unit not in ('', '%') or not 0 <= value <= (100 if unit else 1):
+        raise ValueError("Alpha must be between 0 and 1 or 0% and 100%")
+
+
+def parse_css_colour(text: str) -> Tuple[int, int, int]:
+    """
+    Parse a CSS Color Level 4 rgb(), rgba(), hsl() or hsla() string.
+
+    Both comma-separated ("rgb(255, 0, 0)") and space-separated ("rgb(255 0 0 / 50%)")
+    arguments are accepted, case-insensitively, and rgb()/hsl() are aliases of
+    rgba()/hsla(). RGB channels are numbers 0-255, rounded to the nearest integer, or
+    percentages, and all three must use the same form in comma-separated syntax.
+    Hue may carry a deg, grad, rad or turn unit. Alpha is validated but discarded.
+    Out-of-range and non-finite values are rejected rather than clamped. A bare
+    comma-separated integer triplet ("255, 0, 0") is also accepted as an RGB colour.
+
+    Args:
+        text (str): CSS colour string (e.g., "rgb(255, 0, 0)" or "hsl(120deg 100% 50%)")
+
+    Returns:
+        Tuple[int, int, int]: Red, Green, Blue (0-255)
+
+    Raises:
+        ValueError: If the string is invalid
+    """
+    match = _CSS_SIMPLE_RGB.fullmatch(text) or _BARE_RGB.fullmatch(text)
+    if match is not None:
+        r, g, b = int(match[1]), int(match[2]), int(match[3])
+        if r > 255 or g > 255 or b > 255:
+            raise ValueError("RGB values must be between 0 and 255")
+        return r, g, b
+
+    match = _CSS_FUNCTION.fullmatch(text)
+    if match is None:
+        raise ValueError(f"Invalid colour string: {text!r}")
+
+    function = match.group('function').lower()
+    modern = match.group('modern1') is not None
+    syntax = 'modern' if modern else 'legacy'
+    tokens = match.group(f'{syntax}1', f'{syntax}2', f'{syntax}3')
+    alpha = match.group(f'{syntax}_alpha')
+
+    _css_alpha(alpha, modern)
+
+    if function.startswith('rgb'):
+        values = [_css_value(token, modern) for token in tokens]
+        units = {unit for _, unit in values}
+        if not units <= {'', '%'} or (not modern and len(units) > 1):
+            raise ValueError("RGB values must be all integers or all percentages")
+
+        rgb = []
+        for value, unit in values:
+            if unit == '%':
+                if not 0 <= value <= 100:
+                    raise ValueError("RGB percentages must be between 0% and 100%")
+                value = value * 255 / 100
+            if not 0 <= value <= 255:
+                raise ValueError("RGB values must be between 0 and 255")
+            rgb.append(round(value))
+        return rgb[0], rgb[1], rgb[2]
+
+    hue, unit = _css_value(tokens[0], modern)
+    if unit not in _ANGLE_UNITS:
+        raise ValueError("Hue must be a number or an angle")
+    hue = (hue * _ANGLE_UNITS[unit] / 360) % 1.0
+
+    r, g, b = hsl_to_rgb_single(hue, _css_percentage(tokens[1], modern), _css_percentage(tokens[2], modern))
+    return round(r), round(g), round(b)
+
+
+def parse_css_colour_array(texts: Iterable[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Parse CSS rgb(), rgba(), hsl() and hsla() strings into an RGB array.
+
+    Invalid strings do not stop parsing; their rows are zeroed and their indices returned.
+    See parse_css_colour for the accepted syntax.
+
+    Args:
+        texts (Iterable[str]): CSS colour strings
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (N, 3) uint8 RGB array and the indices of invalid strings
+    """
+    rows = []
+    invalid = []
+    parsed = {}  # Columns often repeat the same strings; remember up to _CSS_MEMO_SIZE of them
+    for index, text in enumerate(texts):
+        try:
+            rgb = parsed.get(text)
+            if rgb is None:
+                rgb = parse_css_colour(text)
+                if len(parsed) < _CSS_MEMO_SIZE:
+                    parsed[text] = rgb
+            rows.append(rgb)
+        except (ValueError, TypeError):
+            rows.append((0, 0, 0))
+            invalid.append(index)
+
+    rgb = np.array(rows, dtype=np.uint8).reshape(-1, 3)
+    return rgb, np.array(invalid, dtype=np.intp)
@@ -0,0 +1,360 @@
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
+
+from .palette import Palette
+
+# Histogram colours assigned to centroids at a time, bounding the (rows, K) distance matrix
+_ASSIGN_CHUNK = 1 << 16
+
+
+def _weighted_means(colours: np.ndarray, counts: np.ndarray, labels: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Pixel-weighted mean colour and total count of each of k labelled groups of histogram colours."""
+    weights = np.bincount(labels, weights=counts, minlength=k)
+    sums = np.stack([np.bincount(labels, weights=colours[:, c] * counts, minlength=k) for c in range(3)], axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return sums / weights[:, np.newaxis], weights
+
+
+def _by_weight(rgb: np.ndarray, weights: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Round colours to uint8 and order them by descending weight, ties keeping their order."""
+    order = np.argsort(-weights, kind='stable')
+    return np.round(rgb[order]).astype(np.uint8), weights[order].astype(np.int64)
+
+
+def median_cut(colours: np.ndarray, counts: np.ndarray, n_colours: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce a colour histogram to at most n_colours colours by median cut.
+
+    Starting from one box around every colour, the box with the widest channel range is
+    repeatedly split at the pixel-weighted median of that channel, until there are
+    n_colours boxes or none can be split. Each box becomes its pixel-weighted mean colour.
+
+    Args:
+        colours (np.ndarray): (M, 3) uint8 distinct colours
+        counts (np.ndarray): (M,) pixel count of each colour
+        n_colours (int): Maximum number of colours to return
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (K, 3) uint8 colours ordered by descending weight,
+            and their (K,) pixel weights
+    """
+    colours = np.asarray(colours, dtype=np.uint8)
+    counts = np.asarray(counts)
+    labels = np.zeros(len(colours), dtype=np.intp)
+    # Per box: member indices, and the channel and size of its widest range
+    boxes: List[np.ndarray] = [np.arange(len(colours))]
+    ranges = [_widest_range(colours)]
+
+    while len(boxes) < n_colours:
+        widest = max(range(len(boxes)), key=lambda i: ranges[i][1])
+        channel, size = ranges[widest]
+        if size == 0:
+            break  # Every box holds a single colour
+
+        members = boxes[widest]
+        values = colours[members, channel]
+        # Pixel-weighted median over the 256 channel levels, kept inside the box so both halves are non-empty
+        cumulative = np.cumsum(np.bincount(values, weights=counts[members], minlength=256))
+        median = int(np.searchsorted(cumulative, cumulative[-1] / 2))
+        median = min(max(median, int(values.min())), int(values.max()) - 1)
+
+        lower = values <= median
+        boxes[widest], upper = members[lower], members[~lower]
+        ranges[widest] = _widest_range(colours[boxes[widest]])
+        labels[upper] = len(boxes)
+        boxes.append(upper)
+        ranges.append(_widest_range(colours[upper]))
+
+    rgb, weights = _weighted_means(colours.astype(np.float64), counts, labels, len(boxes))
+    return _by_weight(rgb, weights)
+
+
+def _widest_range(colours: np.ndarray) -> Tuple[int, int]:
+    """Channel with the widest range of values in an (M, 3) box of colours, and that range."""
+    extent = colours.max(axis=0).astype(np.intp) - colours.min(axis=0)
+    channel = int(np.argmax(extent))
+    return channel, int(extent[channel])
+
+
+def _nearest(points: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """Index of the nearest centroid to each point, by squared Euclidean distance."""
+    labels = np.empty(len(points), dtype=np.intp)
+    centroid_squares = np.einsum('ij,ij->i', centroids, centroids)
+    for start in range(0, len(points), _ASSIGN_CHUNK):
+        chunk = points[start:start + _ASSIGN_CHUNK]
+        # |x|^2 is the same for every centroid, so it does not change the nearest one
+        distances = centroid_squares - 2 * (chunk @ centroids.T)
+        labels[start:start + _ASSIGN_CHUNK] = np.argmin(distances, axis=1)
+    return labels
+
+
+def _kmeans_plus_plus(points: np.ndarray, k: int, rng: np.random.Generator) -> np.ndarray:
+    """Choose k initial centroids from points, each new one drawn in proportion to its squared distance from the rest."""
+    centroids = np.empty((k, 3))
+    centroids[0] = points[rng.integers(len(points))]
+    distances = np.sum((points - centroids[0]) ** 2, axis=1)
+    for i in range(1, k):
+        total = distances.sum()
+        if total == 0:
+            return centroids[:i]  # Fewer distinct points than centroids
+        centroids[i] = points[rng.choice(len(points), p=distances / total)]
+        np.minimum(distances, np.sum((points - centroids[i]) ** 2, axis=1), out=distances)
+    return centroids
+
+
+def kmeans(colours: np.ndarray, counts: np.ndarray, n_colours: int, seed: Optional[int] = 0,
+           init: Optional[Union[Palette, np.ndarray]] = None, sample_size: int = 100_000,
+           batch_size: int = 4096, max_iter: int = 100, tol: float = 0.5) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce a colour histogram to at most n_colours colours by mini-batch k-means.
+
+    A random sample of pixels is drawn from the histogram, centroids are seeded with
+    k-means++ (or taken from init) and refined by mini-batch updates over the sample.
+    Finally every histogram colour is assigned to its nearest centroid, and each centroid
+    becomes the pixel-weighted mean of its colours. Centroids left without pixels are dropped.
+
+    Args:
+        colours (np.ndarray): (M, 3) uint8 distinct colours
+        counts (np.ndarray): (M,) pixel count of each colour
+        n_colours (int): Maximum number of centroids
+        seed (int, optional): Seed for sampling and seeding; the same seed gives the same result
+        init (Palette or array-like, optional): Starting centroids, such as the palette of a
+            similar image, replacing k-means++ seeding; only the first n_colours are used
+        sample_size (int): Pixels sampled from the histogram to fit the centroids on
+        batch_size (int): Sampled pixels per mini-batch update
+        max_iter (int): Maximum number of passes over the sample
+        tol (float): Stop once no centroid moves further than this over a pass (RGB units)
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (K, 3) uint8 colours ordered by descending weight,
+            and their (K,) pixel weights
+
+    Raises:
+        ValueError: If init is empty or not (K, 3), or sample_size or batch_size is less than 1
+    """
+    if sample_size < 1 or batch_size < 1:
+        raise ValueError("Sample and batch sizes must be at least 1")
+    rng = np.random.default_rng(seed)
+    points = np.asarray(colours, dtype=np.float64)
+    counts = np.asarray(counts)
+
+    # Drawing histogram colours in proportion to their counts samples pixels, without the pixels
+    sample = points[rng.choice(len(points), size=sample_size, p=counts / counts.sum())]
+    if init is None:
+        centroids = _kmeans_plus_plus(sample, n_colours, rng)
+    else:
+        centroids = np.array(init._rgb_array() if isinstance(init, Palette) else init, dtype=np.float64)
+        if centroids.ndim != 2 or centroids.shape[1] != 3 or not len(centroids):
+            raise ValueError("Initial centroids must have shape (K, 3) with K >= 1")
+        centroids = centroids[:n_colours]
+
+    # Per-centroid learning rates decay with the number of pixels each has absorbed
+    seen = np.zeros(len(centroids))
+    for _ in range(max_iter):
+        previous = centroids.copy()
+        for batch in np.array_split(rng.permutation(sample), max(1, len(sample) // batch_size)):
+            labels = _nearest(batch, centroids)
+            batch_counts = np.bincount(labels, minlength=len(centroids))
+            batch_sums = np.stack([np.bincount(labels, weights=batch[:, c], minlength=len(centroids))
+                                   for c in range(3)], axis=1)
+            seen += batch_counts
+            moved = batch_counts > 0
+            centroids[moved] += (batch_sums[moved] - batch_counts[moved, np.newaxis] * centroids[moved]) \
+                / seen[moved, np.newaxis]
+        if np.max(np.abs(centroids - previous)) <= tol:
+            break
+
+    labels = _nearest(points, centroids)
+    rgb, weights = _weighted_means(points, counts, labels, len(centroids))
+    kept = weights > 0
+    return _by_weight(rgb[kept], weights[kept])
+
+
+def _prefix_keys(packed: np.ndarray, depth: int) -> np.ndarray:
+    """Keys of the depth-level octree nodes holding 24-bit packed colours: the top depth bits of each channel."""
+    shift = 8 - depth
+    mask = (0xFF >> shift) if depth else 0
+    return ((packed >> (16 + shift)) & mask) << 16 | ((packed >> (8 + shift)) & mask) << 8 | ((packed >> shift) & mask)
+
+
+def _parent_keys(keys: np.ndarray) -> np.ndarray:
+    """Keys of the parents of octree nodes: drop the lowest bit of each channel."""
+    return ((keys >> 17) & 0x7F) << 16 | ((keys >> 9) & 0x7F) << 8 | ((keys >> 1) & 0x7F)
+
+
+class OctreeQuantizer:
+    """A streaming octree colour quantizer whose memory is capped by a maximum number of leaves.
+
+    Pixels can be added in any number of blocks, such as rows of an image. Each leaf keeps
+    the pixel count and channel sums of the colours it covers. Whenever the tree grows beyond
+    max_leaves, the deepest parents holding the fewest pixels are merged into single leaves,
+    so memory stays fixed however many pixels are added.
+    """
+
+    def __init__(self, max_leaves: int = 4096):
+        """
+        Initialize a new OctreeQuantizer instance.
+
+        Args:
+            max_leaves (int): Maximum number of leaves kept between blocks
+
+        Raises:
+            ValueError: If max_leaves is less than 1
+        """
+        if max_leaves < 1:
+            raise ValueError("Maximum number of leaves must be at least 1")
+        self._max_leaves = max_leaves
+        # One row per leaf: its depth (0-8), node key at that depth, pixel count and channel sums
+        self._depths = np.empty(0, dtype=np.intp)
+        self._keys = np.empty(0, dtype=np.intp)
+        self._counts = np.empty(0, dtype=np.int64)
+        self._sums = np.empty((0, 3), dtype=np.int64)
+
+    @property
+    def leaf_count(self) -> int:
+        """Get the current number of leaves."""
+        return len(self._keys)
+
+    @property
+    def pixel_count(self) -> int:
+        """Get the total number of pixels added."""
+        return int(self._counts.sum())
+
+    def add(self, rgb: np.ndarray) -> None:
+        """
+        Add a block of pixels, such as one or more image rows.
+
+        Args:
+            rgb (array-like): (..., 3) uint8 array of pixels
+        """
+        rgb = np.asarray(rgb, dtype=np.uint8).reshape(-1, 3).astype(np.intp)
+        packed, counts = np.unique((rgb[:, 0] << 16) | (rgb[:, 1] << 8) | rgb[:, 2], return_counts=True)
+        self._add_packed(packed, counts)
+
+    def add_histogram(self, colours: np.ndarray, counts: np.ndarray) -> None:
+        """
+        Add distinct colours with their pixel counts.
+
+        Args:
+            colours (np.ndarray): (M, 3) uint8 distinct colours
+            counts (np.ndarray): (M,) pixel count of each colour
+        """
+        rgb = np.asarray(colours, dtype=np.uint8).reshape(-1, 3).astype(np.intp)
+        self._add_packed((rgb[:, 0] << 16) | (rgb[:, 1] << 8) | rgb[:, 2], np.asarray(counts, dtype=np.int64))
+
+    def _add_packed(self, packed: np.ndarray, counts: np.ndarray) -> None:
+        """Route distinct packed colours into the leaves covering them, creating full-depth leaves for the rest."""
+        counts = counts.astype(np.int64)
+        sums = np.stack([(packed >> 16) & 0xFF, (packed >> 8) & 0xFF, packed & 0xFF], axis=1) * counts[:, np.newaxis]
+        new_counts, new_sums = self._counts.copy(), self._sums.copy()
+        unrouted = np.ones(len(packed), dtype=bool)
+
+        # Leaves never overlap, so each colour matches at most one of them
+        for depth in np.unique(self._depths).tolist():
+            leaves = np.flatnonzero(self._depths == depth)
+            order = np.argsort(self._keys[leaves])
+            leaf_keys = self._keys[leaves][order]
+            keys = _prefix_keys(packed, depth)
+            position = np.minimum(np.searchsorted(leaf_keys, keys), len(leaf_keys) - 1)
+            matched = unrouted & (leaf_keys[position] == keys)
+            targets = leaves[order][position[matched]]
+            new_counts += np.bincount(targets, weights=counts[matched], minlength=len(new_counts)).astype(np.int64)
+            for c in range(3):
+                new_sums[:, c] += np.bincount(targets, weights=sums[matched, c], minlength=len(new_counts)).astype(np.int64)
+            unrouted &= ~matched
+
+        self._depths = np.concatenate([self._depths, np.full(np.count_nonzero(unrouted), 8, dtype=np.intp)])
+        self._keys = np.concatenate([self._keys, packed[unrouted]])
+        self._counts = np.concatenate([new_counts, counts[unrouted]])
+        self._sums = np.concatenate([new_sums, sums[unrouted]])
+        self._reduce(self._max_leaves)
+
+    def _reduce(self, max_leaves: int, exact: bool = False) -> None:
+        """
+        Merge the deepest, least populated parents into leaves until at most max_leaves remain.
+
+        Args:
+            max_leaves (int): Number of leaves to get down to
+            exact (bool): Merge only some children of the last parent, so the leaf count lands on
+                max_leaves rather than below it; leaves may then overlap, so pixels can no
+                longer be routed into the tree
+        """
+        while len(self._keys) > max_leaves:
+            depth = int(self._depths.max())
+            if depth == 0:
+                break  # A single root leaf holds every pixel
+            deepest = np.flatnonzero(self._depths == depth)
+            parents, groups = np.unique(_parent_keys(self._keys[deepest]), return_inverse=True)
+            groups = groups.reshape(-1)
+            parent_counts = np.bincount(groups, weights=self._counts[deepest]).astype(np.int64)
+            children = np.bincount(groups)
+
+            # Merge the least populated parents first (ties by key), just enough to get under the cap
+            order = np.lexsort((parents, parent_counts))
+            saved = np.cumsum(children[order] - 1)
+            needed = len(self._keys) - max_leaves
+            merged = order[:int(np.searchsorted(saved, needed)) + 1]
+
+            merging = np.isin(groups, merged)
+            overshoot = int(saved[len(merged) - 1]) - needed
+            if exact and overshoot > 0:
+                # Leave the most populated children of the last parent out of the merge
+                siblings = np.flatnonzero(groups == merged[-1])
+                by_count = siblings[np.lexsort((self._keys[deepest[siblings]], -self._counts[deepest[siblings]]))]
+                merging[by_count[:overshoot]] = False
+            members = deepest[merging]
+            merged_groups, slots = np.unique(groups[merging], return_inverse=True)
+            slots = slots.reshape(-1)
+            keep = np.ones(len(self._keys), dtype=bool)
+            keep[members] = False
+            self._depths = np.concatenate([self._depths[keep], np.full(len(merged_groups), depth - 1, dtype=np.intp)])
+            self._keys = np.concatenate([self._keys[keep], parents[merged_groups]])
+            self._counts = np.concatenate([self._counts[keep], np.bincount(slots, weights=self._counts[members]).astype(np.int64)])
+            self._sums = np.concatenate([self._sums[keep], np.stack(
+                [np.bincount(slots, weights=self._sums[members, c]) for c in range(3)], axis=1).astype(np.int64)])
+
+    def result(self, n_colours: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Reduce the tree to at most n_colours leaves and return their mean colours.
+        The quantizer itself is left unchanged, so more pixels can still be added.
+
+        Args:
+            n_colours (int): Maximum number of colours to return
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (K, 3) uint8 colours ordered by descending weight,
+                and their (K,) pixel weights
+
+        Raises:
+            ValueError: If n_colours is less than 1
+        """
+        if n_colours < 1:
+            raise ValueError("Number of colours must be at least 1")
+        reduced = OctreeQuantizer(self._max_leaves)
+        reduced._depths, reduced._keys, reduced._counts, reduced._sums = \
+            self._depths, self._keys, self._counts, self._sums
+        reduced._reduce(n_colours, exact=True)
+        return _by_weight(reduced._sums / reduced._counts[:, np.newaxis], reduced._counts)
+
+
+def octree(colours: np.ndarray, counts: np.ndarray, n_colours: int,
+           max_leaves: int = 4096) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce a colour histogram to at most n_colours colours with an octree.
+
+    Args:
+        colours (np.ndarray): (M, 3) uint8 distinct colours
+        counts (np.ndarray): (M,) pixel count of each colour
+        n_colours (int): Maximum number of colours to return
+        max_leaves (int): Maximum number of leaves kept while building the tree
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (K, 3) uint8 colours ordered by descending weight,
+            and their (K,) pixel weights
+    """
+    quantizer = OctreeQuantizer(max_leaves)
+    # Feed the histogram in blocks so the routing temporaries stay small too
+    for start in range(0, len(colours), _ASSIGN_CHUNK):
+        quantizer.add_histogram(colours[start:start + _ASSIGN_CHUNK], counts[start:start + _ASSIGN_CHUNK])
+    return quantizer.result(n_colours)
@@ -0,0 +1,338 @@
+from typing import Callable, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .convert import rgb_to_hsl
+
+# Max possible distance in RGB space is sqrt(255^2 * 3) ≈ 441.67
+MAX_RGB_DISTANCE = 441.67
+
+# Colours per side of a pairwise tile: a 128 KB float64 block, small enough to stay in cache
+DEFAULT_BLOCK_SIZE = 128
+
+
+class PaletteScores(NamedTuple):
+    """Every palette score, each between 0 and 1."""
+    contrast: float
+    uniqueness: float
+    harmony: float
+    saturation_variation: float
+    temperature_variation: float
+    brightness: float
+    brightness_balance: float
+
+
+def luminance(rgb: np.ndarray) -> np.ndarray:
+    """
+    Calculate the luminance of RGB colours using standard coefficients.
+
+    Args:
+        rgb (array-like): (..., 3) array of RGB values (0-255)
+
+    Returns:
+        np.ndarray: (...) float array of luminance values (0-255)
+    """
+    rgb = np.asarray(rgb, dtype=np.float64)
+    return 0.299 * rgb[..., 0] + 0.587 * rgb[..., 1] + 0.114 * rgb[..., 2]
+
+
+def pair_harmony(hue_diff: np.ndarray) -> np.ndarray:
+    """
+    Score hue differences by common harmony principles.
+
+    Perfect harmony at:
+    - 0 (same hue/monochromatic) = 1.0
+    - 1/6 (30° analogous) = 0.8
+    - 1/3 (120° triadic) = 0.9
+    - 1/2 (180° complementary) = 0.85
+    Other relationships score 0.5 less the distance to the nearest of these. The
+    bands around 1/6, 1/3 and 1/2 cover every difference above 1/15, so outside
+    them the nearest principle is always monochromatic.
+
+    Args:
+        hue_diff (np.ndarray): Smallest circular hue differences (0-0.5)
+
+    Returns:
+        np.ndarray: Harmony scores between 0 and 1
+    """
+    harmony = np.subtract(0.5, hue_diff)
+    harmony[np.abs(hue_diff - 1 / 6) < 0.1] = 0.8  # Analogous
+    harmony[np.abs(hue_diff - 1 / 2) < 0.1] = 0.85  # Complementary
+    harmony[np.abs(hue_diff - 1 / 3) < 0.1] = 0.9  # Triadic, the best where bands overlap
+    harmony[hue_diff < 0.01] = 1.0  # Monochromatic
+    return harmony
+
+
+def _distance_block(rgb_a: np.ndarray, rgb_b: np.ndarray) -> np.ndarray:
+    """Euclidean distances between two float64 (N, 3) RGB arrays, as a len(a) x len(b) matrix."""
+    distances = rgb_a @ rgb_b.T
+    distances *= -2
+    # Integer-valued inputs keep the expanded squared distances exact in float64
+    distances += np.einsum('ij,ij->i', rgb_a, rgb_a)[:, np.newaxis]
+    distances += np.einsum('ij,ij->i', rgb_b, rgb_b)[np.newaxis, :]
+    return np.sqrt(np.maximum(distances, 0, out=distances), out=distances)
+
+
+def _harmony_block(hues_a: np.ndarray, hues_b: np.ndarray) -> np.ndarray:
+    """Harmony scores between two hue arrays, as a len(a) x len(b) matrix."""
+    hue_diff = np.abs(np.subtract.outer(hues_a, hues_b))
+    # Smallest hue difference accounting for circular nature
+    np.minimum(hue_diff, 1 - hue_diff, out=hue_diff)
+    return pair_harmony(hue_diff)
+
+
+def _pair_count(n: int) -> float:
+    """Number of distinct pairs among n colours."""
+    return n * (n - 1) / 2
+
+
+def _pairwise_sums(values: Sequence[np.ndarray], blocks: Sequence[Callable[[np.ndarray, np.ndarray], np.ndarray]],
+                   block_size: int) -> List[float]:
+    """
+    Sums of symmetric pairwise functions over all pairs, walking the upper triangle in tiles.
+
+    Every function is evaluated on the same tile before moving on, so several metrics
+    share one pass over the pairs. Only one block_size x block_size tile per function is
+    alive at a time, so memory stays bounded however large the input is.
+
+    Args:
+        values (Sequence[np.ndarray]): Per-colour values for each function, indexed along the first axis
+        blocks (Sequence[Callable]): Each computes the pairwise matrix between two slices of its values
+        block_size (int): Rows and columns per tile
+
+    Returns:
+        List[float]: Sum of each function over the n * (n - 1) / 2 distinct pairs
+
+    Raises:
+        ValueError: If block_size is less than 1
+    """
+    if block_size < 1:
+        raise ValueError("Block size must be at least 1")
+
+    n = len(values[0])
+    totals = [0.0] * len(blocks)
+    for start in range(0, n, block_size):
+        stop = start + block_size
+        for k, (value, block) in enumerate(zip(values, blocks)):
+            rows = value[start:stop]
+            # Diagonal tile is symmetric: sum the pairs above the diagonal only
+            totals[k] += np.triu(block(rows, rows), 1).sum()
+            for col_start in range(stop, n, block_size):
+                totals[k] += block(rows, value[col_start:col_start + block_size]).sum()
+    return [float(total) for total in totals]
+
+
+def contrast_score(rgb: np.ndarray) -> float:
+    """
+    Mean normalized luminance difference over all pairs of colours.
+
+    Sorting the luminances turns the sum of pairwise differences into a weighted
+    sum, so this runs in O(n log n) time and O(n) memory.
+
+    Args:
+        rgb (array-like): (N, 3) array of RGB values (0-255), N >= 2
+
+    Returns:
+        float: Contrast score between 0 and 1
+    """
+    return _contrast_of_luminance(luminance(rgb))
+
+
+def _contrast_of_luminance(values: np.ndarray) -> float:
+    """Mean normalized pairwise difference of precomputed luminance values."""
+    return _luminance_difference_sum(values) / 255 / _pair_count(len(values))
+
+
+def _luminance_difference_sum(values: np.ndarray) -> float:
+    """Sum of absolute luminance differences over all pairs, in O(n log n)."""
+    values = np.sort(values)
+    n = len(values)
+    # In sorted order, values[k] is the larger of the pair against each of the k values before it
+    weights = 2 * np.arange(n) - (n - 1)
+    return float(np.dot(weights, values))
+
+
+def uniqueness_score(rgb: np.ndarray, block_size: int = DEFAULT_BLOCK_SIZE) -> float:
+    """
+    Mean normalized Euclidean RGB distance over all pairs of colours.
+
+    Args:
+        rgb (array-like): (N, 3) array of RGB values (0-255), N >= 2
+        block_size (int): Colours per side of each pairwise tile; peak memory is
+            about 8 * block_size^2 bytes
+
+    Returns:
+        float: Uniqueness score between 0 and 1
+    """
+    rgb = np.asarray(rgb, dtype=np.float64)
+    return _pairwise_sums((rgb,), (_distance_block,), block_size)[0] / _pair_count(len(rgb)) / MAX_RGB_DISTANCE
+
+
+def harmony_score(hsl: np.ndarray, block_size: int = DEFAULT_BLOCK_SIZE) -> float:
+    """
+    Mean hue harmony over all pairs of colours.
+
+    Args:
+        hsl (array-like): (N, 3) array of HSL values (0-1), N >= 2
+        block_size (int): Colours per side of each pairwise tile; peak memory is
+            about 8 * block_size^2 bytes
+
+    Returns:
+        float: Harmony score between 0 and 1
+    """
+    hues = np.ascontiguousarray(np.asarray(hsl, dtype=np.float64)[:, 0])
+    return _pairwise_sums((hues,), (_harmony_block,), block_size)[0] / _pair_count(len(hues))
+
+
+def pair_sums(rgb: np.ndarray, hsl: Optional[np.ndarray] = None, block_size: int = DEFAULT_BLOCK_SIZE) -> np.ndarray:
+    """
+    Sum the pairwise terms behind the contrast, uniqueness and harmony scores over all pairs.
+
+    Together with pair_sums_with, this lets the pairwise scores be kept up to date as
+    colours are added or removed, without walking every pair again.
+
+    Args:
+        rgb (array-like): (N, 3) array of RGB values (0-255)
+        hsl (array-like, optional): (N, 3) array of HSL values (0-1), converted from rgb if omitted
+        block_size (int): Colours per side of each pairwise tile, bounding memory use
+
+    Returns:
+        np.ndarray: (3,) sums of luminance differences, RGB distances and harmony scores
+    """
+    rgb = np.asarray(rgb, dtype=np.float64)
+    hsl = rgb_to_hsl(rgb) if hsl is None else np.asarray(hsl, dtype=np.float64)
+    hues = np.ascontiguousarray(hsl[:, 0])
+    distance, harmony = _pairwise_sums((rgb, hues), (_distance_block, _harmony_block), block_size)
+    return np.array([_luminance_difference_sum(luminance(rgb)), distance, harmony])
+
+
+def pair_sums_with(rgb_row: np.ndarray, rgb: np.ndarray, hsl_row: Optional[np.ndarray] = None,
+                   hsl: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Sum the pairwise terms between one colour and each colour of an array, in O(n).
+
+    Args:
+        rgb_row (array-like): (3,) RGB values (0-255) of the single colour
+        rgb (array-like): (N, 3) array of RGB values (0-255)
+        hsl_row (array-like, optional): (3,) HSL values (0-1) of the single colour
+        hsl (array-like, optional): (N, 3) array of HSL values (0-1)
+
+    Returns:
+        np.ndarray: (3,) sums of luminance differences, RGB distances and harmony scores
+    """
+    rgb_row = np.asarray(rgb_row, dtype=np.float64).reshape(1, 3)
+    rgb = np.asarray(rgb, dtype=np.float64)
+    hsl_row = rgb_to_hsl(rgb_row) if hsl_row is None else np.asarray(hsl_row, dtype=np.float64).reshape(1, 3)
+    hsl = rgb_to_hsl(rgb) if hsl is None else np.asarray(hsl, dtype=np.float64)
+    return np.array([
+        np.abs(luminance(rgb) - luminance(rgb_row)).sum(),
+        _distance_block(rgb_row, rgb).sum(),
+        _harmony_block(hsl_row[:, 0], hsl[:, 0]).sum(),
+    ])
+
+
+def scores_from_pair_sums(sums: np.ndarray, n: int) -> Tuple[float, float, float]:
+    """
+    Turn sums from pair_sums into the contrast, uniqueness and harmony scores.
+
+    Args:
+        sums (np.ndarray): (3,) sums of luminance differences, RGB distances and harmony scores
+        n (int): Number of colours the sums were taken over, n >= 2
+
+    Returns:
+        Tuple[float, float, float]: Contrast, uniqueness and harmony scores
+    """
+    pairs = _pair_count(n)
+    return float(sums[0] / 255 / pairs), float(sums[1] / pairs / MAX_RGB_DISTANCE), float(sums[2] / pairs)
+
+
+def saturation_variation_score(hsl: np.ndarray) -> float:
+    """
+    Standard deviation of saturation levels.
+
+    Args:
+        hsl (array-like): (N, 3) array of HSL values (0-1)
+
+    Returns:
+        float: Saturation variation score between 0 and 1
+    """
+    return float(np.std(np.asarray(hsl)[:, 1]))
+
+
+def temperature_variation_score(hsl: np.ndarray) -> float:
+    """
+    Balance between warm (red-ish) and cool colours.
+
+    Args:
+        hsl (array-like): (N, 3) array of HSL values (0-1)
+
+    Returns:
+        float: Temperature variation score between 0 and 1
+    """
+    hues = np.asarray(hsl)[:, 0]
+    warm_colors = int(np.count_nonzero((hues <= 0.167) | (hues >= 0.833)))
+    cool_colors = len(hues) - warm_colors
+    return float(1 - abs(warm_colors - cool_colors) / len(hues))
+
+
+def brightness_score(hsl: np.ndarray) -> float:
+    """
+    Mean lightness of the colours.
+
+    Args:
+        hsl (array-like): (N, 3) array of HSL values (0-1)
+
+    Returns:
+        float: Brightness score between 0 and 1
+    """
+    return float(np.mean(np.asarray(hsl)[:, 2]))
+
+
+def brightness_balance_score(hsl: np.ndarray) -> float:
+    """
+    Balance of light and dark colours around mid lightness.
+
+    Args:
+        hsl (array-like): (N, 3) array of HSL values (0-1)
+
+    Returns:
+        float: Brightness (lightness) balance score between 0 and 1
+    """
+    return float(1 - abs(np.mean(np.asarray(hsl)[:, 2]) - 0.5) * 2)
+
+
+def score_all(rgb: np.ndarray, hsl: Optional[np.ndarray] = None, block_size: int = DEFAULT_BLOCK_SIZE,
+              luminances: Optional[np.ndarray] = None) -> PaletteScores:
+    """
+    Compute every palette score from one set of arrays.
+
+    HSL and luminance are derived once, and uniqueness and harmony share a single
+    tiled pass over the pairs. Scores that need pairs are 1.0 for fewer than two colours.
+
+    Args:
+        rgb (array-like): (N, 3) array of RGB values (0-255), N >= 1
+        hsl (array-like, optional): (N, 3) array of HSL values (0-1), converted from rgb if omitted
+        block_size (int): Colours per side of each pairwise tile, bounding memory use
+        luminances (array-like, optional): (N,) luminance values, computed from rgb if omitted
+
+    Returns:
+        PaletteScores: Every score, each between 0 and 1
+    """
+    rgb = np.asarray(rgb, dtype=np.float64)
+    hsl = rgb_to_hsl(rgb) if hsl is None else np.asarray(hsl, dtype=np.float64)
+    brightness = brightness_score(hsl)
+    if len(rgb) < 2:
+        return PaletteScores(1.0, 1.0, 1.0, 1.0, 1.0, brightness, 1.0)
+
+    hues = np.ascontiguousarray(hsl[:, 0])
+    pairs = _pair_count(len(rgb))
+    distance, harmony = _pairwise_sums((rgb, hues), (_distance_block, _harmony_block), block_size)
+    return PaletteScores(
+        contrast=contrast_score(rgb) if luminances is None else _contrast_of_luminance(luminances),
+        uniqueness=distance / pairs / MAX_RGB_DISTANCE,
+        harmony=harmony / pairs,
+        saturation_variation=saturation_variation_score(hsl),
+        temperature_variation=temperature_variation_score(hsl),
+        brightness=brightness,
+        brightness_balance=float(1 - abs(brightness - 0.5) * 2),
+    )
@@ -0,0 +1,170 @@
+import sys
+import threading
+import weakref
+from multiprocessing import resource_tracker, shared_memory
+from typing import NamedTuple, Tuple, Union
+
+import numpy as np
+
+from .colour_array import ColourArray, _to_uint8
+from .palette import Palette
+
+# Serializes attaching, which briefly swaps out the resource tracker's register function
+_TRACKER_LOCK = threading.Lock()
+
+
+class SharedArrayDescriptor(NamedTuple):
+    """Everything a process needs to attach to a shared colour array; cheap to pickle."""
+    name: str
+    shape: Tuple[int, ...]
+
+
+def _attach_untracked(name: str) -> shared_memory.SharedMemory:
+    """
+    Open an existing segment without handing it to this process's resource tracker.
+
+    Before Python 3.13, attaching registers the segment as if this process had created it,
+    so the tracker would unlink it when the process exits, under the owner's feet.
+    Unregistering afterwards is not safe either, as forked workers share the owner's tracker.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    with _TRACKER_LOCK:
+        register = resource_tracker.register
+        resource_tracker.register = lambda name, rtype: None
+        try:
+            return shared_memory.SharedMemory(name=name)
+        finally:
+            resource_tracker.register = register
+
+
+def _unlink(segment: shared_memory.SharedMemory) -> None:
+    """Remove a segment's name so it is freed once every process has unmapped it."""
+    try:
+        segment.unlink()
+    except FileNotFoundError:
+        pass  # Already unlinked
+
+
+class SharedColourArray:
+    """A uint8 colour array placed in shared memory, so other processes can read it without copying.
+
+    The creating process owns the segment and unlinks it on close(), on leaving a with block,
+    or when the object is garbage collected. Other processes attach with the descriptor and
+    never unlink it. Either way, the mapping itself stays valid until the last NumPy view
+    of rgb is gone, so views outliving the object are safe to use.
+    """
+
+    def __init__(self, segment: shared_memory.SharedMemory, shape: Tuple[int, ...], owner: bool):
+        """
+        Initialize a new SharedColourArray instance; use create() or attach() instead.
+
+        Args:
+            segment (SharedMemory): Shared memory segment holding the colours
+            shape (Tuple[int, ...]): Shape of the uint8 array, ending in 3
+            owner (bool): Whether this process created the segment and must unlink it
+        """
+        self._segment = segment
+        self._owner = owner
+        self._rgb = np.ndarray(shape, dtype=np.uint8, buffer=segment.buf)
+        self._rgb.flags.writeable = False
+        # NumPy does not hold the buffer export, so tie the mapping to the array: every
+        # view keeps the array alive, and the mapping is closed only after the last one
+        weakref.finalize(self._rgb, segment.close)
+        self._unlinker = weakref.finalize(self, _unlink, segment) if owner else None
+
+    @classmethod
+    def create(cls, colours: Union[np.ndarray, ColourArray, Palette]) -> 'SharedColourArray':
+        """
+        Copy colours into a new shared memory segment owned by this process.
+
+        Args:
+            colours (array-like, ColourArray or Palette): (..., 3) array of RGB values (0-255)
+
+        Returns:
+            SharedColourArray: New SharedColourArray instance
+
+        Raises:
+            ValueError: If the array does not end in 3 channels or RGB values are not in valid range
+        """
+        if isinstance(colours, ColourArray):
+            values = colours.rgb
+        elif isinstance(colours, Palette):
+            values = colours._rgb_array()
+        else:
+            values = np.asarray(colours)
+            if values.dtype != np.uint8:
+                values = _to_uint8(np.round(values.astype(np.float64)))
+        if values.ndim < 1 or values.shape[-1] != 3:
+            raise ValueError("RGB array must have shape (..., 3)")
+
+        # Zero-size segments are not allowed, so empty arrays still get one byte
+        segment = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+        np.ndarray(values.shape, dtype=np.uint8, buffer=segment.buf)[...] = values
+        return cls(segment, values.shape, owner=True)
+
+    @classmethod
+    def attach(cls, descriptor: SharedArrayDescriptor) -> 'SharedColourArray':
+        """
+        Attach to a shared colour array created by another process, without copying.
+
+        Args:
+            descriptor (SharedArrayDescriptor): Descriptor of the shared array
+
+        Returns:
+            SharedColourArray: New SharedColourArray instance that does not own the segment
+        """
+        return cls(_attach_untracked(descriptor.name), tuple(descriptor.shape), owner=False)
+
+    @property
+    def descriptor(self) -> SharedArrayDescriptor:
+        """Get the descriptor other processes use to attach to this array."""
+        if self.closed:
+            raise ValueError("Shared colour array is closed")
+        return SharedArrayDescriptor(self._segment.name, self._rgb.shape)
+
+    @property
+    def rgb(self) -> np.ndarray:
+        """Get the read-only uint8 array backed by the shared memory."""
+        if self.closed:
+            raise ValueError("Shared colour array is closed")
+        return self._rgb
+
+    @property
+    def closed(self) -> bool:
+        """Check whether close() has been called."""
+        return self._rgb is None
+
+    def to_colour_array(self) -> ColourArray:
+        """
+        Copy the colours out into a ColourArray.
+
+        Returns:
+            ColourArray: New ColourArray instance
+        """
+        return ColourArray(self.rgb.reshape(-1, 3))
+
+    def close(self) -> None:
+        """
+        Release this object's hold on the segment, unlinking it if this process created it.
+        The memory is freed once every process has dropped its views of rgb.
+        """
+        self._rgb = None
+        if self._unlinker is not None:
+            self._unlinker()
+
+    def __enter__(self) -> 'SharedColourArray':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        """Get the number of rows in the array."""
+        return len(self.rgb)
+
+    def __repr__(self) -> str:
+        """Get string representation of the shared array."""
+        if self.closed:
+            return "SharedColourArray(closed)"
+        return f"SharedColourArray(name={self._segment.name!r}, shape={self._rgb.shape}, owner={self._owner})"
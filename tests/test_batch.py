@@ -0,0 +1,64 @@
+import pytest
+import numpy as np
+from pyletteyes.batch import PaletteBatch
+from pyletteyes.colour import Colour
+from pyletteyes.palette import Palette
+
+
+@pytest.fixture
+def ragged_palettes():
+    """Create reproducible random palettes of mixed sizes, including single colours and repeats."""
+    rng = np.random.default_rng(11)
+    palettes = [
+        Palette([Colour(*rgb) for rgb in rng.integers(0, 256, size=(size, 3)).tolist()])
+        for size in [1, 2, 5, 8, 3, 1, 8]
+    ]
+    palettes.append(Palette([Colour(10, 20, 30)] * 3))
+    return palettes
+
+
+def test_scores_match_palette(ragged_palettes):
+    batch = PaletteBatch.from_palettes(ragged_palettes)
+    scores = batch.score_all()
+
+    for name, values in scores._asdict().items():
+        assert values.shape == (len(ragged_palettes),)
+        expected = [getattr(palette, f"score_{name}")() for palette in ragged_palettes]
+        np.testing.assert_allclose(values, expected, atol=1e-12, err_msg=name)
+        np.testing.assert_allclose(getattr(batch, f"score_{name}")(), values, atol=1e-12)
+
+
+def test_chunking_does_not_change_scores(ragged_palettes, monkeypatch):
+    from pyletteyes import batch as batch_module
+
+    expected = PaletteBatch.from_palettes(ragged_palettes).score_all()
+    monkeypatch.setattr(batch_module, "_CHUNK_PAIRS", 1)
+    scores = PaletteBatch.from_palettes(ragged_palettes).score_all()
+    for name in expected._fields:
+        np.testing.assert_allclose(getattr(scores, name), getattr(expected, name), atol=1e-12)
+
+
+def test_dense_and_offsets():
+    rgb = np.array([[[255, 0, 0], [0, 0, 255]], [[0, 0, 0], [255, 255, 255]]])
+    batch = PaletteBatch(rgb)
+    assert len(batch) == 2
+    assert batch.sizes.tolist() == [2, 2]
+    assert batch[1].colours == [Colour(0, 0, 0), Colour(255, 255, 255)]
+
+    flat = PaletteBatch.from_offsets([(255, 0, 0), (0, 0, 255), (0, 0, 0)], [0, 2, 3])
+    assert flat.sizes.tolist() == [2, 1]
+    assert flat.mask.tolist() == [[True, True], [True, False]]
+    assert flat[1].colours == [Colour(0, 0, 0)]
+
+
+def test_invalid_batches():
+    with pytest.raises(ValueError):
+        PaletteBatch(np.zeros((2, 3)))
+    with pytest.raises(ValueError):
+        PaletteBatch(np.full((1, 2, 3), 256))
+    with pytest.raises(ValueError):
+        PaletteBatch(np.zeros((2, 2, 3)), mask=[[True, True], [False, False]])
+    with pytest.raises(ValueError):
+        PaletteBatch.from_offsets(np.zeros((3, 3)), [0, 3, 3])
+    with pytest.raises(ValueError):
+        PaletteBatch.from_offsets(np.zeros((3, 3)), [0, 2])
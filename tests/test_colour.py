@@ -1,6 +1,17 @@
+import pickle
+import threading
+from collections import OrderedDict
 import pytest
 from unittest.mock import patch
-from pyletteyes.colour import Colour
+from pyletteyes.colour import Colour, disable_interning, enable_interning, interning_info
+
+
+@pytest.fixture
+def interning():
+    """Enable a small interning cache for the duration of a test."""
+    enable_interning(maxsize=2)
+    yield
+    disable_interning()
 
 
 def test_colour_initialization():
@@ -34,6 +45,11 @@ def test_hex_conversion():
     c = Colour.from_hex("FF8000")
     assert c.rgb == (255, 128, 0)
 
+    # Test short and alpha forms, like the bulk parsers
+    assert Colour.from_hex("#FFF").rgb == (255, 255, 255)
+    assert Colour.from_hex("f80").rgb == (255, 136, 0)
+    assert Colour.from_hex("#FF800080").rgb == (255, 128, 0)
+
     # Test invalid hex
     with pytest.raises(ValueError):
         Colour.from_hex("#FF80")  # Too short
@@ -181,7 +197,8 @@ def test_valid_from_string():
         ("rgb(0, 0, 255)", (0, 0, 255)),
         ("rgb(128, 128, 128)", (128, 128, 128)),
         ("rgb(0, 0, 0)", (0, 0, 0)),
-        ("rgb(255, 255, 255)", (255, 255, 255))
+        ("rgb(255, 255, 255)", (255, 255, 255)),
+        ("255, 0, 0", (255, 0, 0)),  # Bare triplet
     ]
 
     for rgb_string, expected in test_cases:
@@ -197,7 +214,7 @@ def test_invalid_from_string():
         "rgb(256, 0, 0)",  # Red value too high
         "rgb(-1, 0, 0)",  # Negative value
         "rgb(0, 0",  # Missing closing parenthesis
-        "rgb(0, 0, 0, 0)",  # Too many values
+        "rgb(0, 0, 0, 0, 0)",  # Too many values
         "rgb(a, b, c)",  # Non-numeric values
         "rgb()",  # Empty string
         "rgb(0, 0,)",  # Missing value
@@ -249,4 +266,135 @@ def test_edge_cases():
 
     # Whitespace at start/end shouldn't matter
     colour = Colour.from_string("  rgb(255, 0, 0)  ")
-    assert colour.to_string() == "rgb(255, 0, 0)"
\ No newline at end of file
+    assert colour.to_string() == "rgb(255, 0, 0)"
+
+def test_hashing():
+    c1 = Colour(255, 128, 0)
+    c2 = Colour(255.2, 128, 0)
+    c3 = Colour(0, 128, 255)
+
+    # Equal colours must hash equally so they collapse in sets and dicts
+    assert hash(c1) == hash(c2)
+    assert len({c1, c2, c3}) == 2
+    assert {c1: "orange"}[c2] == "orange"
+
+
+def test_slots():
+    c = Colour(255, 128, 0)
+    assert not hasattr(c, "__dict__")
+    with pytest.raises(AttributeError):
+        c.alpha = 1.0
+
+
+def test_pickle_roundtrip():
+    c = Colour(255, 128, 0)
+    assert pickle.loads(pickle.dumps(c)) == c
+
+
+def test_interning_disabled_by_default():
+    assert interning_info() is None
+    assert Colour(255, 128, 0) is not Colour(255, 128, 0)
+
+
+def test_interning(interning):
+    white = Colour.from_hex("#FFFFFF")
+    assert Colour(255, 255, 255) is white
+    assert Colour.from_string("rgb(255, 255, 255)") is white
+    assert pickle.loads(pickle.dumps(white)) is white
+
+    info = interning_info()
+    assert info.hits == 3
+    assert info.misses == 1
+    assert info.currsize == 1
+    assert info.maxsize == 2
+
+
+def test_interning_eviction(interning):
+    red = Colour(255, 0, 0)
+    green = Colour(0, 255, 0)
+    assert Colour(255, 0, 0) is red  # Red is now the most recently used
+
+    Colour(0, 0, 255)  # Evicts green, the least recently used
+    assert interning_info().currsize == 2
+    assert Colour(255, 0, 0) is red
+    assert Colour(0, 255, 0) is not green
+
+
+def test_shared_colours_are_immutable(interning):
+    colour = Colour(1, 2, 3)
+    with pytest.raises(AttributeError):
+        colour._r = 200
+    with pytest.raises(AttributeError):
+        del colour._g
+    with pytest.raises(AttributeError):
+        colour.extra = 1
+
+    assert Colour(1, 2, 3).rgb == (1, 2, 3)
+    assert Colour(1, 2, 3) in {colour}
+
+
+def test_interning_eviction_from_another_thread(interning):
+    from pyletteyes import colour as colour_module
+
+    cache = colour_module._intern_cache
+    red = Colour(255, 0, 0)
+
+    class EvictingDict(OrderedDict):
+        """Has another thread add two colours, evicting red, right after red is looked up."""
+
+        def get(self, key, default=None):
+            colour = super().get(key, default)
+            if key == red.packed and not hasattr(self, 'evictor'):
+                self.evictor = threading.Thread(target=lambda: (Colour(0, 255, 0), Colour(0, 0, 255)))
+                self.evictor.start()
+                self.evictor.join()
+            return colour
+
+    cache.instances = EvictingDict(cache.instances)
+    colour = Colour(255, 0, 0)  # Red is gone by the time it would be marked as recently used
+    assert colour == red and colour is not red
+    assert interning_info().misses == 4
+    assert Colour(255, 0, 0) is colour
+
+
+def test_interning_invalid_maxsize():
+    with pytest.raises(ValueError):
+        enable_interning(maxsize=0)
+
+
+def test_hsl_is_memoized():
+    from pyletteyes import colour as colour_module
+    colour_module._packed_hsl.cache_clear()
+
+    with patch.object(colour_module, "rgb_to_hsl_single", wraps=colour_module.rgb_to_hsl_single) as convert:
+        c = Colour(12, 34, 56)
+        c.lighten(0.1)
+        c.darken(0.1)
+        c.get_complementary()
+        assert Colour(12, 34, 56).hsl == c.hsl
+        assert convert.call_count == 1
+
+
+def test_packed_conversion():
+    c = Colour.from_packed(0xFF8000)
+    assert c.rgb == (255, 128, 0)
+    assert c.packed == 0xFF8000
+    assert hash(c) == c.packed
+
+    with pytest.raises(ValueError):
+        Colour.from_packed(0x1000000)
+    with pytest.raises(ValueError):
+        Colour.from_packed(-1)
+
+
+def test_hex_rejects_int_syntax():
+    # Characters int(..., 16) would otherwise accept
+    for hex_string in ("#-1FFFF", "#FF_FFF", "# FFFFF", "#+FFFFF"):
+        with pytest.raises(ValueError):
+            Colour.from_hex(hex_string)
+
+
+def test_lighten_darken_clamp_lightness():
+    c = Colour(100, 100, 100)
+    assert c.lighten(-2).rgb == (0, 0, 0)
+    assert c.darken(-2).rgb == (255, 255, 255)
@@ -0,0 +1,120 @@
+import pytest
+import numpy as np
+from pyletteyes.colour import Colour
+from pyletteyes.colour_array import ColourArray
+from pyletteyes.palette import Palette
+
+
+@pytest.fixture
+def random_colours():
+    """Create a reproducible sample of random colours, including greys."""
+    rng = np.random.default_rng(42)
+    rgb = rng.integers(0, 256, size=(500, 3), dtype=np.uint8)
+    greys = np.repeat(np.arange(0, 256, 15, dtype=np.uint8)[:, np.newaxis], 3, axis=1)
+    return ColourArray(np.concatenate([rgb, greys]))
+
+
+def test_initialization():
+    arr = ColourArray([(255, 128, 0), (0, 0, 0)])
+    assert arr.rgb.dtype == np.uint8
+    assert arr.rgb.shape == (2, 3)
+    assert arr.rgb.flags['C_CONTIGUOUS']
+
+    # Test float inputs (should round)
+    arr = ColourArray([(255.4, 128.6, 0.2)])
+    assert arr[0].rgb == (255, 129, 0)
+
+    # Test empty array
+    assert len(ColourArray([])) == 0
+
+    # Test invalid values and shapes
+    with pytest.raises(ValueError):
+        ColourArray([(256, 128, 0)])
+    with pytest.raises(ValueError):
+        ColourArray([(-1, 128, 0)])
+    with pytest.raises(ValueError):
+        ColourArray([(255, 128)])
+
+
+def test_immutability():
+    source = np.array([[1, 2, 3]], dtype=np.uint8)
+    arr = ColourArray(source)
+
+    # Test that the array makes a copy of its input
+    source[0, 0] = 100
+    assert arr[0].rgb == (1, 2, 3)
+
+    with pytest.raises(ValueError):
+        arr.rgb[0, 0] = 100
+
+
+def test_colour_and_palette_roundtrip():
+    colours = [Colour(255, 0, 0), Colour(0, 255, 0), Colour(0, 0, 255)]
+    arr = ColourArray.from_colours(colours)
+    assert arr.to_colours() == colours
+
+    palette = Palette(colours)
+    assert ColourArray.from_palette(palette) == arr
+    assert arr.to_palette().colours == colours
+
+    with pytest.raises(ValueError):
+        ColourArray([]).to_palette()
+
+
+def test_indexing_and_iteration():
+    arr = ColourArray([(255, 0, 0), (0, 255, 0), (0, 0, 255)])
+    assert arr[-1] == Colour(0, 0, 255)
+    assert arr[1:] == ColourArray([(0, 255, 0), (0, 0, 255)])
+    assert all(isinstance(c, Colour) for c in arr)
+    assert arr != ColourArray([(255, 0, 0)])
+
+
+def test_hsl_matches_colour(random_colours):
+    expected = np.array([c.hsl for c in random_colours.to_colours()])
+    np.testing.assert_allclose(random_colours.hsl, expected, atol=1e-12)
+
+
+def test_from_hsl_matches_colour(random_colours):
+    hsl = random_colours.hsl
+    expected = [Colour.from_hsl(tuple(row)) for row in hsl]
+    assert ColourArray.from_hsl(hsl).to_colours() == expected
+
+    with pytest.raises(ValueError, match="HSL values must be within the range of 0.0 to 1.0"):
+        ColourArray.from_hsl([(0.5, 1.1, 0.5)])
+
+
+@pytest.mark.parametrize("method,args", [
+    ("lighten", (0.2,)),
+    ("darken", (0.2,)),
+    ("lighten", (-0.9,)),
+    ("darken", (-0.9,)),
+    ("lighten", (2,)),
+    ("darken", (2,)),
+    ("get_pastel", ()),
+    ("get_complementary", ()),
+])
+def test_transforms_match_colour(random_colours, method, args):
+    expected = [getattr(c, method)(*args) for c in random_colours.to_colours()]
+    assert getattr(random_colours, method)(*args).to_colours() == expected
+
+
+def test_analogous_matches_colour(random_colours):
+    left, right = random_colours.get_analogous(angle=45)
+    expected = [c.get_analogous(angle=45) for c in random_colours.to_colours()]
+    assert left.to_colours() == [pair[0] for pair in expected]
+    assert right.to_colours() == [pair[1] for pair in expected]
+
+
+def test_string_conversion():
+    arr = ColourArray([(255, 128, 0), (0, 0, 0)])
+    assert arr.to_hex() == ["#FF8000", "#000000"]
+    assert arr.to_string() == ["rgb(255, 128, 0)", "rgb(0, 0, 0)"]
+    assert repr(arr) == "ColourArray(size=2, colours=['#FF8000', '#000000'])"
+
+
+def test_from_hex():
+    arr = ColourArray.from_hex(["#FF8000", "000", "#0000FFFF"])
+    assert arr.to_hex() == ["#FF8000", "#000000", "#0000FF"]
+
+    with pytest.raises(ValueError, match=r"indices \[1, 2\]"):
+        ColourArray.from_hex(["#FF8000", "#GG8000", "#FF80"])
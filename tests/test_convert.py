@@ -0,0 +1,75 @@
+import colorsys
+import pytest
+import numpy as np
+from pyletteyes.colour import Colour
+from pyletteyes.convert import hsl_to_rgb, hsl_to_rgb_single, pack_rgb, rgb_to_hsl, rgb_to_hsl_single, unpack_rgb
+
+
+@pytest.fixture
+def random_rgb():
+    """Create a reproducible sample of random RGB values, including greys."""
+    rng = np.random.default_rng(7)
+    rgb = rng.integers(0, 256, size=(2000, 3))
+    greys = np.repeat(np.arange(256)[:, np.newaxis], 3, axis=1)
+    return np.concatenate([rgb, greys])
+
+
+def test_rgb_to_hsl_matches_colorsys(random_rgb):
+    expected = []
+    for r, g, b in random_rgb.tolist():
+        h, l, s = colorsys.rgb_to_hls(r / 255, g / 255, b / 255)
+        expected.append((h, s, l))
+
+    np.testing.assert_array_equal(rgb_to_hsl(random_rgb), np.array(expected))
+
+
+def test_hsl_to_rgb_matches_colorsys(random_rgb):
+    hsl = rgb_to_hsl(random_rgb)
+    expected = [
+        [v * 255 for v in colorsys.hls_to_rgb(h, l, s)]
+        for h, s, l in hsl.tolist()
+    ]
+
+    np.testing.assert_array_equal(hsl_to_rgb(hsl), np.array(expected))
+
+
+def test_roundtrip(random_rgb):
+    np.testing.assert_array_equal(np.round(hsl_to_rgb(rgb_to_hsl(random_rgb))), random_rgb)
+
+
+def test_leading_dimensions():
+    rgb = np.array([[[255, 0, 0], [0, 255, 0]], [[0, 0, 255], [10, 10, 10]]])
+    hsl = rgb_to_hsl(rgb)
+    assert hsl.shape == (2, 2, 3)
+    np.testing.assert_allclose(hsl[0, 0], (0.0, 1.0, 0.5))
+    np.testing.assert_allclose(hsl_to_rgb(hsl), rgb, atol=1e-9)
+
+
+def test_single_matches_array(random_rgb):
+    for r, g, b in random_rgb[:200].tolist():
+        hsl = rgb_to_hsl_single(r, g, b)
+        assert hsl == tuple(rgb_to_hsl(np.array([r, g, b])).tolist())
+        assert hsl_to_rgb_single(*hsl) == tuple(hsl_to_rgb(np.array(hsl)).tolist())
+
+
+@pytest.mark.parametrize('dtype', [np.uint8, np.int64, np.float64])
+def test_rgb_to_hsl_dtypes(random_rgb, dtype):
+    np.testing.assert_array_equal(rgb_to_hsl(random_rgb.astype(dtype)), rgb_to_hsl(random_rgb))
+
+
+def test_matches_colorsys_across_blocks():
+    rng = np.random.default_rng(11)
+    rgb = rng.integers(0, 256, size=(40000, 3), dtype=np.uint8)
+    hsl = rng.random((40000, 3)) * [3.0, 1.0, 1.0] - [1.0, 0.0, 0.0]
+    hsl[::5, 1] = 0.0
+    hsl[1::7, 2] = 0.5
+    hsl[2::9, 0] = np.resize([0.0, 1 / 6, 0.5, 2 / 3, 1.0, 1 / 3, -1 / 3], len(hsl[2::9]))
+
+    np.testing.assert_array_equal(rgb_to_hsl(rgb), [rgb_to_hsl_single(*c) for c in rgb.tolist()])
+    np.testing.assert_array_equal(hsl_to_rgb(hsl), [hsl_to_rgb_single(*c) for c in hsl.tolist()])
+
+
+def test_pack_unpack(random_rgb):
+    packed = pack_rgb(random_rgb)
+    assert packed.tolist() == [Colour(*rgb).packed for rgb in random_rgb.tolist()]
+    np.testing.assert_array_equal(unpack_rgb(packed), random_rgb)
@@ -0,0 +1,48 @@
+import numpy as np
+from pyletteyes.colour import Colour
+from pyletteyes.formatting import format_hex_array, format_rgb_array
+from pyletteyes.parsing import parse_hex_buffer
+
+
+def test_format_hex_array():
+    rgb = [(255, 128, 0), (0, 1, 2)]
+    assert format_hex_array(rgb) == ["#FF8000", "#000102"]
+    assert format_hex_array(rgb, as_bytes=True) == b"#FF8000\n#000102\n"
+
+
+def test_format_rgb_array():
+    rgb = [(255, 8, 0), (10, 100, 0)]
+    assert format_rgb_array(rgb) == ["rgb(255, 8, 0)", "rgb(10, 100, 0)"]
+    assert format_rgb_array(rgb, as_bytes=True) == b"rgb(255, 8, 0)\nrgb(10, 100, 0)\n"
+
+
+def test_format_empty():
+    empty = np.zeros((0, 3), dtype=np.uint8)
+    assert format_hex_array(empty) == []
+    assert format_rgb_array(empty, as_bytes=True) == b""
+
+
+def test_format_matches_colour():
+    rng = np.random.default_rng(0)
+    rgb = rng.integers(0, 256, size=(1000, 3))
+    colours = [Colour(*c) for c in rgb.tolist()]
+
+    assert format_hex_array(rgb) == [c.to_hex() for c in colours]
+    assert format_rgb_array(rgb) == [c.to_string() for c in colours]
+
+
+def test_hex_bytes_roundtrip():
+    rgb = np.random.default_rng(1).integers(0, 256, size=(100, 3), dtype=np.uint8)
+    parsed, invalid = parse_hex_buffer(format_hex_array(rgb, as_bytes=True), stride=8)
+    assert invalid.size == 0
+    np.testing.assert_array_equal(parsed, rgb)
+
+
+def test_format_rgb_array_across_blocks():
+    # Enough colours to span several blocks, with every digit count in every channel
+    rgb = np.random.default_rng(8).integers(0, 256, size=(20000, 3), dtype=np.uint8)
+    rgb[:1000] = np.random.default_rng(9).integers(0, 10, size=(1000, 3))
+    expected = "".join(f"rgb({r}, {g}, {b})\n" for r, g, b in rgb.tolist())
+
+    assert format_rgb_array(rgb, as_bytes=True) == expected.encode("ascii")
+    assert format_rgb_array(rgb) == expected.splitlines()
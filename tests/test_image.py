@@ -0,0 +1,231 @@
+import pytest
+import numpy as np
+from PIL import Image
+from pyletteyes.colour import Colour
+from pyletteyes import image
+from pyletteyes.image import ColourHistogram, colour_histogram, extract_palette, read_strips
+from pyletteyes.palette import Palette
+
+
+@pytest.fixture
+def striped_image():
+    """Create an image of horizontal stripes: 5 rows red, 3 rows blue, 2 rows white."""
+    rgb = np.zeros((10, 4, 3), dtype=np.uint8)
+    rgb[:5] = (255, 0, 0)
+    rgb[5:8] = (0, 0, 255)
+    rgb[8:] = (255, 255, 255)
+    return Image.fromarray(rgb)
+
+
+def test_colour_histogram():
+    rgb = np.array([[[1, 2, 3], [255, 0, 0]], [[1, 2, 3], [0, 0, 0]]], dtype=np.uint8)
+    colours, counts = colour_histogram(rgb)
+
+    assert colours.tolist() == [[0, 0, 0], [1, 2, 3], [255, 0, 0]]
+    assert counts.tolist() == [1, 2, 1]
+
+
+def test_histogram_matches_unique():
+    rgb = np.random.default_rng(1).integers(0, 4, size=(50, 60, 3), dtype=np.uint8) * 85
+    colours, counts = colour_histogram(rgb)
+    expected, expected_counts = np.unique(rgb.reshape(-1, 3), axis=0, return_counts=True)
+
+    np.testing.assert_array_equal(colours, expected)
+    np.testing.assert_array_equal(counts, expected_counts)
+
+
+def test_from_image(striped_image, tmp_path):
+    palette = Palette.from_image(striped_image, n_colours=2)
+    assert palette.colours == [Colour(255, 0, 0), Colour(0, 0, 255)]
+
+    path = tmp_path / "stripes.png"
+    striped_image.save(path)
+    palette, weights = Palette.from_image(path, return_weights=True)
+    assert palette.colours == [Colour(255, 0, 0), Colour(0, 0, 255), Colour(255, 255, 255)]
+    assert weights.tolist() == [20, 12, 8]
+
+
+def test_modes_and_ties():
+    # Alpha is dropped; equal counts go to the lower packed value
+    rgba = Image.new('RGBA', (2, 1))
+    rgba.putpixel((0, 0), (0, 255, 0, 10))
+    rgba.putpixel((1, 0), (0, 0, 255, 255))
+    palette, weights = extract_palette(rgba, n_colours=1)
+    assert palette.colours == [Colour(0, 0, 255)]
+    assert weights.tolist() == [1]
+
+    grey, _ = extract_palette(Image.new('L', (3, 3), 128))
+    assert grey.colours == [Colour(128, 128, 128)]
+
+
+def test_invalid_extraction(striped_image):
+    with pytest.raises(ValueError):
+        extract_palette(striped_image, n_colours=0)
+    with pytest.raises(ValueError):
+        extract_palette(striped_image, strategy='random')
+    with pytest.raises(ValueError):
+        extract_palette(Image.new('RGB', (0, 0)))
+    with pytest.raises(ValueError):
+        extract_palette(striped_image, strip_rows=0)
+
+
+@pytest.mark.parametrize("shape", [(0, 3), (1, 3), (2, 3), (300, 300, 3), (70000, 3)])
+def test_histogram_across_count_blocks(shape):
+    rgb = np.random.default_rng(3).integers(0, 256, size=shape, dtype=np.uint8)
+    colours, counts = colour_histogram(rgb)
+    expected, expected_counts = np.unique(rgb.reshape(-1, 3), axis=0, return_counts=True)
+
+    np.testing.assert_array_equal(colours, expected)
+    np.testing.assert_array_equal(counts, expected_counts)
+
+
+@pytest.mark.parametrize("fast_add_at", [True, False])
+def test_histogram_bins_match_sorting(monkeypatch, fast_add_at):
+    rgb = np.random.default_rng(5).integers(0, 6, size=(90, 40, 3), dtype=np.uint8) * 51
+    expected, expected_counts = colour_histogram(rgb)
+    monkeypatch.setattr(image, '_SORT_LIMIT', 500)
+    monkeypatch.setattr(image, '_COUNT_BLOCK', 70)
+    monkeypatch.setattr(image, '_FAST_ADD_AT', fast_add_at)
+
+    histogram = ColourHistogram()
+    for start in range(0, 90, 4):
+        histogram.add(rgb[start:start + 4])
+        assert histogram.pixel_count == min(start + 4, 90) * 40
+        if start == 40:
+            colours, counts = histogram.result()
+            assert counts.sum() == 44 * 40
+    colours, counts = histogram.result()
+
+    np.testing.assert_array_equal(colours, expected)
+    np.testing.assert_array_equal(counts, expected_counts)
+    np.testing.assert_array_equal(colour_histogram(rgb)[1], expected_counts)
+
+def test_histogram_of_strided_pixels():
+    rgb = np.random.default_rng(4).integers(0, 8, size=(40, 50, 4), dtype=np.uint8)
+    colours, counts = colour_histogram(rgb[::3, ::2, 2::-1])
+    expected, expected_counts = np.unique(rgb[::3, ::2, 2::-1].reshape(-1, 3), axis=0, return_counts=True)
+
+    np.testing.assert_array_equal(colours, expected)
+    np.testing.assert_array_equal(counts, expected_counts)
+
+def test_colour_histogram_in_blocks():
+    rgb = np.random.default_rng(2).integers(0, 4, size=(30, 20, 3), dtype=np.uint8) * 85
+    histogram = ColourHistogram()
+    for start in range(0, 30, 7):
+        histogram.add(rgb[start:start + 7])
+    colours, counts = histogram.result()
+    expected, expected_counts = colour_histogram(rgb)
+
+    assert histogram.pixel_count == 600
+    np.testing.assert_array_equal(colours, expected)
+    np.testing.assert_array_equal(counts, expected_counts)
+
+
+@pytest.mark.parametrize("name, options", [
+    ("plain.tif", {}),
+    ("lzw.tif", {"compression": "tiff_lzw"}),
+    ("bottom_up.bmp", {}),
+    ("image.png", {}),
+])
+def test_read_strips_matches_whole_image(tmp_path, name, options):
+    rgb = np.random.default_rng(3).integers(0, 6, size=(37, 23, 3), dtype=np.uint8) * 51
+    path = tmp_path / name
+    Image.fromarray(rgb).save(path, **options)
+
+    strips = list(read_strips(path, strip_rows=8))
+    assert [len(strip) for strip in strips] == [8, 8, 8, 8, 5]
+    np.testing.assert_array_equal(np.concatenate(strips), rgb)
+
+    palette, weights = Palette.from_image(path, n_colours=6, strategy='median_cut', return_weights=True)
+    streamed, streamed_weights = Palette.from_image(path, n_colours=6, strategy='median_cut',
+                                                    return_weights=True, strip_rows=5)
+    assert streamed.colours == palette.colours
+    np.testing.assert_array_equal(streamed_weights, weights)
+
+
+def test_read_strips_converts_modes(tmp_path):
+    path = tmp_path / "grey.tif"
+    Image.new('L', (5, 4), 90).save(path)
+    strips = list(read_strips(path, strip_rows=3))
+
+    assert [strip.shape for strip in strips] == [(3, 5, 3), (1, 5, 3)]
+    assert (np.concatenate(strips) == 90).all()
+    with pytest.raises(ValueError):
+        next(read_strips(path, strip_rows=0))
+
+
+def test_reduced_decoding(tmp_path):
+    rgb = np.zeros((64, 48, 3), dtype=np.uint8)
+    rgb[:48] = (200, 30, 30)
+    path = tmp_path / "blocks.png"
+    Image.fromarray(rgb).save(path)
+
+    palette, weights, sampled = Palette.from_image(path, n_colours=2, return_weights=True,
+                                                   return_sample_size=True, max_pixels=200)
+    assert palette.colours == [Colour(200, 30, 30), Colour(0, 0, 0)]
+    assert 180 <= sampled <= 200
+    assert weights.tolist() == [3 * weights[1], weights[1]]
+
+    _, sampled = Palette.from_image(path, return_sample_size=True, scale=0.5)
+    assert sampled == 32 * 24
+    # A budget the image already fits in leaves it at full resolution
+    _, weights, sampled = extract_palette(path, n_colours=1, max_pixels=10_000, scale=1, return_sample_size=True)
+    assert sampled == 64 * 48
+    assert weights.tolist() == [48 * 48]
+
+
+def test_reduced_decoding_lands_near_budget():
+    image = Image.new('RGB', (101, 100), (5, 6, 7))
+    _, sampled = Palette.from_image(image, return_sample_size=True, max_pixels=10_000)
+    assert 9_800 <= sampled <= 10_000
+
+
+def test_reduced_decoding_leaves_image_untouched(tmp_path):
+    path = tmp_path / "flat.jpg"
+    Image.new('RGB', (400, 300), (20, 120, 220)).save(path, quality=95)
+
+    with Image.open(path) as image:
+        _, sampled = Palette.from_image(image, return_sample_size=True, max_pixels=5000)
+        assert image.size == (400, 300)
+        assert sampled <= 5000
+        np.testing.assert_allclose(np.asarray(image)[0, 0], (20, 120, 220), atol=3)
+
+
+def test_reduced_decoding_in_strips(tmp_path):
+    rgb = np.random.default_rng(6).integers(0, 3, size=(120, 90, 3), dtype=np.uint8) * 120
+    path = tmp_path / "noise.png"
+    Image.fromarray(rgb).save(path)
+
+    palette, weights, sampled = Palette.from_image(path, return_weights=True, return_sample_size=True,
+                                                   max_pixels=3000, strip_rows=7)
+    expected, expected_weights, expected_sampled = extract_palette(path, max_pixels=3000, return_sample_size=True)
+    assert sampled == expected_sampled <= 3000
+    assert palette.colours == expected.colours
+    np.testing.assert_array_equal(weights, expected_weights)
+
+
+def test_jpeg_draft_decoding(tmp_path):
+    path = tmp_path / "flat.jpg"
+    Image.new('RGB', (400, 320), (20, 120, 220)).save(path, quality=95)
+
+    palette, sampled = Palette.from_image(path, n_colours=1, return_sample_size=True, max_pixels=2000)
+    assert 1900 <= sampled <= 2000
+    np.testing.assert_allclose(palette.colours[0].rgb, (20, 120, 220), atol=3)
+
+
+def test_invalid_reduced_decoding(striped_image):
+    with pytest.raises(ValueError):
+        extract_palette(striped_image, max_pixels=0)
+    with pytest.raises(ValueError):
+        extract_palette(striped_image, scale=0)
+    with pytest.raises(ValueError):
+        extract_palette(striped_image, scale=1.5)
+
+
+def test_strips_of_in_memory_image(striped_image):
+    palette, weights = Palette.from_image(striped_image, return_weights=True, strip_rows=3)
+    assert palette.colours == [Colour(255, 0, 0), Colour(0, 0, 255), Colour(255, 255, 255)]
+    assert weights.tolist() == [20, 12, 8]
+
+    grey = Image.new('L', (4, 5), 60).convert('LA')
+    np.testing.assert_array_equal(np.concatenate(list(read_strips(grey, strip_rows=2))), np.full((5, 4, 3), 60))
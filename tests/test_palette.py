@@ -1,5 +1,6 @@
 import pytest
 import numpy as np
+from unittest.mock import patch
 from pyletteyes.palette import Palette
 from pyletteyes.colour import Colour
 
@@ -120,12 +121,53 @@ def test_brightness_score():
     assert pytest.approx(mixed_palette.score_brightness(), abs=0.01) == 0.5
 
 
+def test_score_all_matches_individual_scores(basic_palette):
+    basic_palette.add_colour(Colour(40, 200, 120))
+    scores = basic_palette.score_all()
+
+    for name, value in scores._asdict().items():
+        assert value == pytest.approx(getattr(basic_palette, f"score_{name}")(), abs=1e-12)
+
+    single = Palette([Colour(0, 0, 0)]).score_all()
+    assert single.brightness == 0.0
+    assert single.contrast == single.uniqueness == single.harmony == 1.0
+
+
 def test_dominant_colour(basic_palette):
     dominant = basic_palette.get_dominant_colour()
     assert isinstance(dominant, Colour)
     assert dominant == basic_palette[0]
 
 
+def test_dominant_colour_strategies():
+    red, near_red, blue = Colour(250, 10, 10), Colour(240, 20, 15), Colour(0, 0, 255)
+    palette = Palette([blue, red, near_red, blue])
+
+    # Repeats count towards frequency
+    assert palette.get_dominant_colour() == blue
+    assert palette.get_dominant_colour(weights=[1, 2, 0, 0]) == red
+
+    # Nearby reds pool their weight, outweighing the single heaviest colour
+    weights = [5, 4, 3, 0]
+    assert palette.get_dominant_colour(weights=weights) == blue
+    assert palette.get_dominant_colour(weights=weights, strategy='centroid') == Colour(246, 14, 12)
+    assert palette.get_dominant_colour(weights=weights, strategy='perceptual') == red
+
+    # Ties go to the first colour
+    assert palette.get_dominant_colour(weights=[1, 1, 0, 1], strategy='perceptual') == blue
+
+
+def test_dominant_colour_invalid(basic_palette):
+    with pytest.raises(ValueError):
+        basic_palette.get_dominant_colour(weights=[1, 2])
+    with pytest.raises(ValueError):
+        basic_palette.get_dominant_colour(weights=[1, -1, 1])
+    with pytest.raises(ValueError):
+        basic_palette.get_dominant_colour(weights=[0, 0, 0])
+    with pytest.raises(ValueError):
+        basic_palette.get_dominant_colour(strategy='median')
+
+
 def test_iteration(basic_palette):
     # Test that palette is iterable
     colours = list(basic_palette)
@@ -268,4 +310,92 @@ def test_single_colour_palette():
     assert scp.score_temperature_variation() == 1.0
     assert scp.score_saturation_variation() == 1.0
     assert scp.score_harmony() == 1.0
-    assert scp.score_contrast() == 1.0
\ No newline at end of file
+    assert scp.score_contrast() == 1.0
+
+def test_membership(basic_palette):
+    assert Colour(255, 0, 0) in basic_palette
+    assert Colour(128, 128, 128) not in basic_palette
+    assert "not a colour" not in basic_palette
+
+    # Duplicates are only forgotten once every copy is removed
+    basic_palette.add_colour(Colour(255, 0, 0))
+    basic_palette.remove_colour(Colour(255, 0, 0))
+    assert Colour(255, 0, 0) in basic_palette
+    basic_palette.remove_colour(Colour(255, 0, 0))
+    assert Colour(255, 0, 0) not in basic_palette
+
+
+def test_hsl_converted_once_per_change(basic_palette):
+    from pyletteyes import palette as palette_module
+
+    with patch.object(palette_module, "rgb_to_hsl", wraps=palette_module.rgb_to_hsl) as convert:
+        basic_palette.score_harmony()
+        basic_palette.score_saturation_variation()
+        basic_palette.score_temperature_variation()
+        basic_palette.score_brightness()
+        basic_palette.score_brightness_balance()
+        assert convert.call_count == 1
+
+        # Mutating the palette invalidates the converted values
+        basic_palette.add_colour(Colour(0, 0, 0))
+        assert basic_palette.score_brightness() == pytest.approx(0.375)
+        assert convert.call_count == 2
+
+
+def test_scores_cached_until_mutation(basic_palette):
+    from pyletteyes import palette as palette_module
+
+    with patch.object(palette_module, "harmony_score", wraps=palette_module.harmony_score) as harmony:
+        first = basic_palette.score_harmony()
+        assert basic_palette.score_harmony() == first
+        assert harmony.call_count == 1
+
+        # Releasing the cache only costs a recompute
+        basic_palette.clear_cache()
+        assert basic_palette.score_harmony() == first
+        assert harmony.call_count == 2
+
+        basic_palette.add_colour(Colour(255, 255, 0))
+        basic_palette.score_harmony()
+        assert harmony.call_count == 3
+
+        basic_palette.remove_colour(Colour(255, 255, 0))
+        assert basic_palette.score_harmony() == first
+        assert harmony.call_count == 4
+
+    with pytest.raises(ValueError):
+        basic_palette._rgb_array()[0, 0] = 0
+
+
+def test_incremental_scores_match_full_recompute():
+    rng = np.random.default_rng(3)
+    colours = [Colour(*rgb) for rgb in rng.integers(0, 256, size=(40, 3)).tolist()]
+    palette = Palette(colours[:2], incremental=True)
+
+    for i, colour in enumerate(colours[2:]):
+        palette.add_colour(colour)
+        if i % 3 == 0:
+            palette.remove_colour(palette[i % palette.size])
+        palette.add_colour(palette[0])  # Repeated colours
+
+        expected = Palette(palette.colours).score_all()
+        for name, value in palette.score_all()._asdict().items():
+            assert value == pytest.approx(getattr(expected, name), abs=1e-9), name
+
+    with patch("pyletteyes.palette.uniqueness_score") as full:
+        palette.add_colour(Colour(1, 2, 3))
+        palette.score_uniqueness()
+        full.assert_not_called()
+
+
+def test_hex_list_invalid():
+    with pytest.raises(ValueError, match=r"indices \[1\]"):
+        Palette.from_hex_list(["#FF0000", "#GG0000"])
+
+
+def test_string_list_formats_and_invalid():
+    palette = Palette.from_string_list(["rgba(255, 0, 0, 0.5)", "hsl(120 100% 50%)"])
+    assert palette.to_string_list() == ["rgb(255, 0, 0)", "rgb(0, 255, 0)"]
+
+    with pytest.raises(ValueError, match=r"indices \[0, 2\]"):
+        Palette.from_string_list(["rgb(256, 0, 0)", "rgb(0, 0, 0)", "rgb(0, 0)"])
@@ -0,0 +1,86 @@
+import pytest
+import numpy as np
+from PIL import Image
+from pyletteyes.colour import Colour
+from pyletteyes.palette import Palette
+from pyletteyes.parallel import extract_palettes, score_many
+
+
+@pytest.fixture
+def palettes():
+    """Create reproducible random palettes of mixed sizes."""
+    rng = np.random.default_rng(5)
+    return [
+        Palette([Colour(*rgb) for rgb in rng.integers(0, 256, size=(size, 3)).tolist()])
+        for size in rng.integers(1, 9, size=50)
+    ]
+
+
+@pytest.mark.parametrize("workers,chunksize", [(1, 7), (2, 7), (3, 1000)])
+def test_scores_in_input_order(palettes, workers, chunksize):
+    scores = score_many(palettes, workers=workers, chunksize=chunksize)
+
+    for name, values in scores._asdict().items():
+        expected = [getattr(palette, f"score_{name}")() for palette in palettes]
+        np.testing.assert_allclose(values, expected, atol=1e-12, err_msg=name)
+
+
+def test_empty_and_invalid(palettes):
+    assert score_many([], workers=1).contrast.shape == (0,)
+
+    with pytest.raises(ValueError):
+        score_many(palettes, workers=0)
+    with pytest.raises(ValueError):
+        score_many(palettes, chunksize=0)
+
+
+@pytest.fixture
+def image_paths(tmp_path):
+    """Write single-colour images, one of them a corrupt file, and return their paths."""
+    paths = []
+    for i in range(7):
+        path = tmp_path / f"image_{i}.png"
+        Image.new('RGB', (4 + i, 3), (i * 30, 100, 200)).save(path)
+        paths.append(path)
+    broken = tmp_path / "broken.png"
+    broken.write_bytes(b"not an image")
+    paths.insert(3, broken)
+    return paths
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_extract_palettes(image_paths, workers):
+    extraction = extract_palettes(iter(image_paths), workers=workers, n_colours=2, max_pixels=1000)
+    results = {path: (palette, weights) for path, palette, weights in extraction}
+
+    assert [path for path, _ in extraction.errors] == [image_paths[3]]
+    assert sorted(results) == sorted(image_paths[:3] + image_paths[4:])
+    for i, path in enumerate(image_paths[:3] + image_paths[4:]):
+        palette, weights = results[path]
+        assert palette.colours == [Colour(i * 30, 100, 200)]
+        assert weights.tolist() == [(4 + i) * 3]
+
+
+def test_extract_palettes_stops_early(image_paths):
+    taken = []
+
+    def lazy_paths():
+        for path in image_paths:
+            taken.append(path)
+            yield path
+
+    with extract_palettes(lazy_paths(), workers=2) as extraction:
+        next(extraction)
+    # Only a bounded number of images were queued before stopping
+    assert len(taken) < len(image_paths)
+    with pytest.raises(StopIteration):
+        next(extraction)
+
+
+def test_extract_palettes_invalid(image_paths):
+    with pytest.raises(ValueError):
+        extract_palettes(image_paths, workers=0)
+    with pytest.raises(ValueError):
+        extract_palettes(image_paths, n_colours=0)
+    with pytest.raises(ValueError):
+        extract_palettes(image_paths, strategy='random')
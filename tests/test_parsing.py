@@ -0,0 +1,142 @@
+import pytest
+import numpy as np
+from pyletteyes.parsing import (parse_css_colour, parse_css_colour_array, parse_hex_array, parse_hex_buffer,
+                                parse_hex_colour)
+
+
+def test_parse_hex_array_formats():
+    rgb, invalid = parse_hex_array(["#FF8000", "ff8000", "#F80", "f80", "#FF8000CC", "FF8000cc"])
+
+    assert invalid.size == 0
+    assert rgb.dtype == np.uint8
+    assert rgb.tolist() == [
+        [255, 128, 0],
+        [255, 128, 0],
+        [255, 136, 0],
+        [255, 136, 0],
+        [255, 128, 0],
+        [255, 128, 0],
+    ]
+
+
+def test_parse_hex_array_reports_invalid_rows():
+    hex_strings = [
+        "#FF0000",
+        "#GG8000",  # Invalid characters
+        "#FF80",  # Wrong length
+        "",  # Empty string
+        "#FF8000FF00",  # Too long
+        "#FF 000",  # Embedded whitespace
+        "##FF0000",  # Two hashes
+        "#0000FF",
+    ]
+    rgb, invalid = parse_hex_array(hex_strings)
+
+    assert invalid.tolist() == [1, 2, 3, 4, 5, 6]
+    assert rgb[0].tolist() == [255, 0, 0]
+    assert rgb[-1].tolist() == [0, 0, 255]
+    assert not rgb[invalid].any()  # Invalid rows are zeroed
+
+
+def test_parse_hex_array_matches_colour():
+    from pyletteyes.colour import Colour
+
+    rng = np.random.default_rng(0)
+    expected = rng.integers(0, 256, size=(1000, 3))
+    hex_strings = [Colour(*rgb).to_hex() for rgb in expected.tolist()]
+
+    rgb, invalid = parse_hex_array(hex_strings)
+    assert invalid.size == 0
+    np.testing.assert_array_equal(rgb, expected)
+
+
+def test_parse_hex_colour_matches_array():
+    hex_strings = ["#FF8000", "ff8000", "#F80", "f80", "#FF8000CC", "FF8000cc", "#GG8000", "#FF80", "",
+                   "#FF8000FF00", "#FF 000", "##FF0000", "#-1FFFF", "#FF_FFF", "#+FFFFF", "#", "FF80001"]
+    rgb, invalid = parse_hex_array(hex_strings)
+
+    for index, text in enumerate(hex_strings):
+        if index in invalid:
+            with pytest.raises(ValueError):
+                parse_hex_colour(text)
+        else:
+            assert parse_hex_colour(text) == tuple(rgb[index].tolist())
+
+
+def test_parse_hex_array_empty():
+    rgb, invalid = parse_hex_array([])
+    assert rgb.shape == (0, 3)
+    assert invalid.size == 0
+
+
+def test_parse_hex_buffer():
+    buffer = b"#FF0000\n#00ff00\n0000FF\n\n#XYZ   \n#FFF,   "
+    rgb, invalid = parse_hex_buffer(buffer, stride=8)
+
+    assert rgb.tolist() == [[255, 0, 0], [0, 255, 0], [0, 0, 255], [0, 0, 0], [255, 255, 255]]
+    assert invalid.tolist() == [3]
+
+    with pytest.raises(ValueError):
+        parse_hex_buffer(b"#FF0000\n#00", stride=8)
+
+
+@pytest.mark.parametrize("text,expected", [
+    ("rgb(255, 128, 0)", (255, 128, 0)),
+    ("  RGB( 255 ,128,0 )  ", (255, 128, 0)),
+    ("rgba(255, 128, 0, 0.5)", (255, 128, 0)),
+    ("rgba(255, 128, 0)", (255, 128, 0)),
+    ("rgb(100%, 50%, 0%)", (255, 128, 0)),
+    ("rgb(255 128 0)", (255, 128, 0)),
+    ("rgb(255 128 0 / 50%)", (255, 128, 0)),
+    ("rgb(100% 128 none)", (255, 128, 0)),
+    ("hsl(120, 100%, 50%)", (0, 255, 0)),
+    ("hsla(240, 100%, 50%, 0.3)", (0, 0, 255)),
+    ("hsl(120deg 100% 50%)", (0, 255, 0)),
+    ("hsl(0.5turn 100% 50% / 1)", (0, 255, 255)),
+    ("hsl(200grad 100 50)", (0, 255, 255)),
+    ("hsl(-120 100% 50%)", (0, 0, 255)),
+    ("rgb(255, 128, 0, 0.5)", (255, 128, 0)),  # rgb() and rgba() are aliases
+    ("hsl(120 100% 50% / 0.5)", (0, 255, 0)),
+    ("rgb(127.5, 0.4, 254.6)", (128, 0, 255)),  # Fractional channels are rounded
+    ("rgb(1e2 2.5e1 0)", (100, 25, 0)),
+    ("255, 128, 0", (255, 128, 0)),  # Bare triplet
+    (" 255,128 , 0 ", (255, 128, 0)),
+])
+def test_parse_css_colour(text, expected):
+    assert parse_css_colour(text) == expected
+
+
+@pytest.mark.parametrize("text", [
+    "rgb(256, 0, 0)",  # Out of range
+    "rgb(255.5, 0, 0)",  # Out of range before rounding
+    "rgb(100%, 0, 0)",  # Mixed integers and percentages with commas
+    "rgb(0, 0, 0, 0, 0)",  # Too many values
+    "hsl(1e400deg 50% 50%)",  # Infinite hue
+    "rgb(1e400 0 0)",  # Infinite channel
+    "rgba(0, 0, 0, -1e400)",  # Infinite alpha
+    "rgba(0, 0, 0, 2)",  # Alpha out of range
+    "rgb(255 0, 0)",  # Mixed separators
+    "rgb(none, 0, 0)",  # 'none' needs space-separated syntax
+    "rgb(10deg 0 0)",  # Angle on an RGB channel
+    "hsl(120, 100, 50)",  # Saturation and lightness need percentages with commas
+    "hsl(120 110% 50%)",  # Saturation out of range
+    "hsl(50% 100% 50%)",  # Percentage hue
+    "hwb(120 0% 0%)",  # Unsupported function
+    "256, 0, 0",  # Bare triplet out of range
+    "255 0 0",  # Bare triplets need commas
+    "255, 0",  # Too few values
+])
+def test_parse_css_colour_invalid(text):
+    with pytest.raises(ValueError):
+        parse_css_colour(text)
+
+
+def test_parse_css_colour_array():
+    rgb, invalid = parse_css_colour_array(["rgb(1, 2, 3)", "rgb(1, 2)", None, "hsl(0 0% 100%)"])
+
+    assert rgb.tolist() == [[1, 2, 3], [0, 0, 0], [0, 0, 0], [255, 255, 255]]
+    assert invalid.tolist() == [1, 2]
+
+    rgb, invalid = parse_css_colour_array([])
+    assert rgb.shape == (0, 3)
+    assert invalid.size == 0
@@ -0,0 +1,176 @@
+import pytest
+import numpy as np
+from PIL import Image
+from pyletteyes.image import colour_histogram, extract_palette
+from pyletteyes.palette import Palette
+from pyletteyes.quantize import OctreeQuantizer, kmeans, median_cut, octree
+
+
+@pytest.fixture
+def gradient_histogram():
+    """Create the histogram of a reproducible noisy image with two equally common hues."""
+    rng = np.random.default_rng(4)
+    reds = np.clip(rng.normal((200, 40, 40), 12, size=(2000, 3)), 0, 255)
+    blues = np.clip(rng.normal((30, 60, 190), 12, size=(2000, 3)), 0, 255)
+    return colour_histogram(np.round(np.concatenate([reds, blues])).astype(np.uint8))
+
+
+def test_median_cut_weights_and_order(gradient_histogram):
+    colours, counts = gradient_histogram
+    rgb, weights = median_cut(colours, counts, 2)
+
+    # The weighted median falls between the two clusters
+    assert rgb.dtype == np.uint8
+    assert weights.tolist() == [2000, 2000]
+    np.testing.assert_allclose(sorted(rgb.tolist()), [(30, 60, 190), (200, 40, 40)], atol=3)
+
+
+def test_median_cut_is_deterministic(gradient_histogram):
+    colours, counts = gradient_histogram
+    rgb, weights = median_cut(colours, counts, 16)
+
+    assert len(rgb) == 16
+    assert weights.sum() == counts.sum()
+    assert (np.diff(weights) <= 0).all()
+    again_rgb, again_weights = median_cut(colours, counts, 16)
+    np.testing.assert_array_equal(rgb, again_rgb)
+    np.testing.assert_array_equal(weights, again_weights)
+
+
+def test_median_cut_fewer_colours_than_requested():
+    colours = np.array([[0, 0, 0], [255, 255, 255]], dtype=np.uint8)
+    rgb, weights = median_cut(colours, np.array([3, 1]), 8)
+
+    assert rgb.tolist() == [[0, 0, 0], [255, 255, 255]]
+    assert weights.tolist() == [3, 1]
+
+
+def test_median_cut_strategy():
+    rgb = np.zeros((4, 4, 3), dtype=np.uint8)
+    rgb[2] = (240, 0, 0)
+    rgb[3] = (250, 0, 0)
+    palette, weights = extract_palette(Image.fromarray(rgb), n_colours=2, strategy='median_cut')
+
+    assert [c.rgb for c in palette] == [(0, 0, 0), (245, 0, 0)]
+    assert weights.tolist() == [8, 8]
+
+
+def test_kmeans_finds_clusters(gradient_histogram):
+    colours, counts = gradient_histogram
+    rgb, weights = kmeans(colours, counts, 2, seed=1)
+
+    assert weights.sum() == counts.sum()
+    np.testing.assert_allclose(sorted(rgb.tolist()), [(30, 60, 190), (200, 40, 40)], atol=3)
+    assert sorted(weights.tolist()) == [2000, 2000]
+
+
+def test_kmeans_is_deterministic(gradient_histogram):
+    colours, counts = gradient_histogram
+    first = kmeans(colours, counts, 6, seed=3, sample_size=2000, batch_size=256)
+    second = kmeans(colours, counts, 6, seed=3, sample_size=2000, batch_size=256)
+
+    np.testing.assert_array_equal(first[0], second[0])
+    np.testing.assert_array_equal(first[1], second[1])
+
+
+def test_kmeans_warm_start(gradient_histogram):
+    from pyletteyes.colour import Colour
+    from pyletteyes.palette import Palette
+
+    colours, counts = gradient_histogram
+    init = Palette([Colour(190, 50, 50), Colour(40, 70, 180)])
+    rgb, weights = kmeans(colours, counts, 8, init=init, max_iter=1)
+
+    # The warm start fixes the number of centroids and converges within a pass
+    assert len(rgb) == 2
+    np.testing.assert_allclose(sorted(rgb.tolist()), [(30, 60, 190), (200, 40, 40)], atol=3)
+
+    # Only the first n_colours starting centroids are used
+    rgb, weights = kmeans(colours, counts, 1, init=init, max_iter=1)
+    assert len(rgb) == 1
+    assert weights.sum() == counts.sum()
+
+    with pytest.raises(ValueError):
+        kmeans(colours, counts, 2, init=np.zeros((0, 3)))
+
+
+def test_kmeans_fewer_colours_than_requested():
+    colours = np.array([[0, 0, 0], [255, 255, 255]], dtype=np.uint8)
+    rgb, weights = kmeans(colours, np.array([3, 1]), 8)
+
+    assert rgb.tolist() == [[0, 0, 0], [255, 255, 255]]
+    assert weights.tolist() == [3, 1]
+
+
+def test_kmeans_strategy():
+    rgb = np.zeros((4, 4, 3), dtype=np.uint8)
+    rgb[2:] = (250, 0, 0)
+    palette, weights = extract_palette(Image.fromarray(rgb), n_colours=2, strategy='kmeans', seed=7)
+
+    assert sorted(c.rgb for c in palette) == [(0, 0, 0), (250, 0, 0)]
+    assert weights.tolist() == [8, 8]
+
+
+def test_octree_stays_bounded(gradient_histogram):
+    colours, counts = gradient_histogram
+    quantizer = OctreeQuantizer(max_leaves=64)
+    pixels = np.repeat(colours, counts, axis=0)
+    for start in range(0, len(pixels), 500):
+        quantizer.add(pixels[start:start + 500])
+        assert quantizer.leaf_count <= 64
+
+    assert quantizer.pixel_count == 4000
+    rgb, weights = quantizer.result(2)
+    assert weights.sum() == 4000
+    np.testing.assert_allclose(sorted(rgb.tolist()), [(30, 60, 190), (200, 40, 40)], atol=3)
+
+
+def test_octree_returns_requested_count(gradient_histogram):
+    colours, counts = gradient_histogram
+    rgb, weights = octree(colours, counts, 12, max_leaves=256)
+
+    assert len(rgb) == 12
+    assert weights.sum() == counts.sum()
+    assert (np.diff(weights) <= 0).all()
+    again_rgb, again_weights = octree(colours, counts, 12, max_leaves=256)
+    np.testing.assert_array_equal(rgb, again_rgb)
+    np.testing.assert_array_equal(weights, again_weights)
+
+
+def test_octree_exact_for_few_colours():
+    quantizer = OctreeQuantizer()
+    quantizer.add(np.array([[0, 0, 0], [255, 255, 255], [0, 0, 0]], dtype=np.uint8))
+    quantizer.add(np.array([[[10, 20, 30]]], dtype=np.uint8))
+    rgb, weights = quantizer.result(8)
+
+    assert rgb.tolist() == [[0, 0, 0], [255, 255, 255], [10, 20, 30]]
+    assert weights.tolist() == [2, 1, 1]
+    assert quantizer.leaf_count == 3
+
+    with pytest.raises(ValueError):
+        OctreeQuantizer(max_leaves=0)
+    with pytest.raises(ValueError):
+        quantizer.result(0)
+
+
+def test_octree_strategy():
+    rgb = np.zeros((4, 4, 3), dtype=np.uint8)
+    rgb[2:] = (250, 0, 0)
+    palette, weights = extract_palette(Image.fromarray(rgb), n_colours=2, strategy='octree')
+
+    assert [c.rgb for c in palette] == [(0, 0, 0), (250, 0, 0)]
+    assert weights.tolist() == [8, 8]
+
+
+def test_palette_from_pixel_rows():
+    rgb = np.zeros((4, 4, 3), dtype=np.uint8)
+    rgb[:, 1:] = (40, 80, 120)
+    palette, weights = Palette.from_pixel_rows(iter(rgb), n_colours=4, return_weights=True)
+
+    assert palette.colours == Palette.from_list([(40, 80, 120), (0, 0, 0)]).colours
+    assert weights.tolist() == [12, 4]
+
+    with pytest.raises(ValueError):
+        Palette.from_pixel_rows([])
+    with pytest.raises(ValueError):
+        Palette.from_pixel_rows(iter(rgb), n_colours=0)
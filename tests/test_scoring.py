@@ -0,0 +1,96 @@
+import pytest
+import numpy as np
+from pyletteyes.convert import rgb_to_hsl
+from pyletteyes.scoring import contrast_score, harmony_score, luminance, score_all, uniqueness_score
+
+
+def loop_contrast(rgb):
+    """Reference pairwise contrast, one pair at a time."""
+    lums = [0.299 * r + 0.587 * g + 0.114 * b for r, g, b in rgb.tolist()]
+    contrasts = [abs(l1 - l2) / 255 for i, l1 in enumerate(lums) for l2 in lums[i + 1:]]
+    return sum(contrasts) / len(contrasts)
+
+
+def loop_uniqueness(rgb):
+    """Reference pairwise uniqueness, one pair at a time."""
+    values = rgb.astype(float)
+    similarities = [
+        1 - np.sqrt(np.sum((values[i] - values[j]) ** 2)) / 441.67
+        for i in range(len(values)) for j in range(i + 1, len(values))
+    ]
+    return float(1 - np.mean(similarities))
+
+
+def loop_harmony(hsl):
+    """Reference pairwise harmony, one pair at a time."""
+    hues = hsl[:, 0].tolist()
+    scores = []
+    for i, h1 in enumerate(hues):
+        for h2 in hues[i + 1:]:
+            hue_diff = min(abs(h1 - h2), 1 - abs(h1 - h2))
+            scores.append(max(
+                1.0 if hue_diff < 0.01 else 0,
+                0.8 if abs(hue_diff - 1 / 6) < 0.1 else 0,
+                0.9 if abs(hue_diff - 1 / 3) < 0.1 else 0,
+                0.85 if abs(hue_diff - 1 / 2) < 0.1 else 0,
+                0.5 - min(abs(hue_diff), abs(hue_diff - 1 / 6), abs(hue_diff - 1 / 3), abs(hue_diff - 1 / 2))
+            ))
+    return sum(scores) / len(scores)
+
+
+@pytest.fixture(params=[2, 3, 17, 200])
+def random_rgb(request):
+    """Create reproducible random palettes of several sizes, with repeated colours."""
+    rng = np.random.default_rng(request.param)
+    rgb = rng.integers(0, 256, size=(request.param, 3), dtype=np.uint8)
+    return np.concatenate([rgb, rgb[:request.param // 4]])
+
+
+def test_luminance():
+    np.testing.assert_allclose(luminance([[255, 255, 255], [0, 0, 0], [255, 0, 0]]), [255.0, 0.0, 76.245])
+
+
+def test_contrast_matches_loop(random_rgb):
+    assert contrast_score(random_rgb) == pytest.approx(loop_contrast(random_rgb), abs=1e-12)
+
+
+def test_uniqueness_matches_loop(random_rgb):
+    assert uniqueness_score(random_rgb) == pytest.approx(loop_uniqueness(random_rgb), abs=1e-12)
+
+
+def test_harmony_matches_loop(random_rgb):
+    hsl = rgb_to_hsl(random_rgb)
+    assert harmony_score(hsl) == pytest.approx(loop_harmony(hsl), abs=1e-12)
+
+
+def test_extreme_pairs():
+    black_white = np.array([[0, 0, 0], [255, 255, 255]], dtype=np.uint8)
+    assert contrast_score(black_white) == pytest.approx(1.0)
+    assert uniqueness_score(black_white) == pytest.approx(1.0, abs=1e-4)
+
+    same = np.array([[10, 20, 30]] * 3, dtype=np.uint8)
+    assert contrast_score(same) == 0.0
+    assert uniqueness_score(same) == 0.0
+    assert harmony_score(rgb_to_hsl(same)) == 1.0
+
+
+@pytest.mark.parametrize("block_size", [1, 3, 64, 10000])
+def test_block_size_does_not_change_scores(random_rgb, block_size):
+    hsl = rgb_to_hsl(random_rgb)
+    assert uniqueness_score(random_rgb, block_size) == pytest.approx(uniqueness_score(random_rgb), abs=1e-12)
+    assert harmony_score(hsl, block_size) == pytest.approx(harmony_score(hsl), abs=1e-12)
+
+
+def test_invalid_block_size():
+    with pytest.raises(ValueError):
+        uniqueness_score(np.zeros((4, 3)), block_size=0)
+
+
+def test_score_all_shares_one_pass(random_rgb):
+    hsl = rgb_to_hsl(random_rgb)
+    scores = score_all(random_rgb, block_size=7)
+
+    assert scores.brightness == score_all(random_rgb, hsl).brightness
+    assert scores.contrast == contrast_score(random_rgb)
+    assert scores.uniqueness == pytest.approx(uniqueness_score(random_rgb), abs=1e-12)
+    assert scores.harmony == pytest.approx(harmony_score(hsl), abs=1e-12)
@@ -0,0 +1,93 @@
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import pytest
+import numpy as np
+from pyletteyes.colour import Colour
+from pyletteyes.colour_array import ColourArray
+from pyletteyes.palette import Palette
+from pyletteyes.shared import SharedColourArray
+
+
+def sum_shared(descriptor):
+    """Attach to a shared array in a worker process and sum its values."""
+    with SharedColourArray.attach(descriptor) as shared:
+        return int(shared.rgb.sum(dtype=np.int64))
+
+
+@pytest.fixture
+def random_rgb():
+    """Create a reproducible (N, 3) array of random colours."""
+    return np.random.default_rng(9).integers(0, 256, size=(1000, 3), dtype=np.uint8)
+
+
+def test_create_and_attach(random_rgb):
+    with SharedColourArray.create(random_rgb) as shared:
+        np.testing.assert_array_equal(shared.rgb, random_rgb)
+        assert len(pickle.dumps(shared.descriptor)) < 200
+
+        attached = SharedColourArray.attach(shared.descriptor)
+        np.testing.assert_array_equal(attached.rgb, random_rgb)
+        with pytest.raises(ValueError):
+            attached.rgb[0, 0] = 0
+
+        # Closing an attached view leaves the segment in place
+        attached.close()
+        assert attached.closed
+        np.testing.assert_array_equal(shared.rgb, random_rgb)
+        assert shared.to_colour_array() == ColourArray(random_rgb)
+
+
+def test_owner_unlinks_segment(random_rgb):
+    shared = SharedColourArray.create(random_rgb)
+    name = shared.descriptor.name
+    shared.close()
+
+    assert shared.closed
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=name)
+
+
+def test_garbage_collection_unlinks_segment(random_rgb):
+    shared = SharedColourArray.create(random_rgb)
+    name = shared.descriptor.name
+    del shared
+
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=name)
+
+
+def test_workers_attach(random_rgb):
+    with SharedColourArray.create(random_rgb) as shared:
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            results = list(executor.map(sum_shared, [shared.descriptor] * 3))
+
+        # Workers exiting must not take the segment with them
+        assert results == [int(random_rgb.sum(dtype=np.int64))] * 3
+        np.testing.assert_array_equal(SharedColourArray.attach(shared.descriptor).rgb, random_rgb)
+
+
+def test_create_from_palette_and_batch_shapes():
+    palette = Palette([Colour(255, 0, 0), Colour(0, 0, 255)])
+    with SharedColourArray.create(palette) as shared:
+        assert shared.rgb.tolist() == [[255, 0, 0], [0, 0, 255]]
+
+    with SharedColourArray.create(np.zeros((4, 5, 3), dtype=np.uint8)) as shared:
+        assert shared.rgb.shape == (4, 5, 3)
+
+    with pytest.raises(ValueError):
+        SharedColourArray.create(np.zeros((4, 2)))
+    with pytest.raises(ValueError):
+        SharedColourArray.create([(256, 0, 0)])
+
+
+def test_views_outlive_close(random_rgb):
+    shared = SharedColourArray.create(random_rgb)
+    view = shared.rgb[10:20]
+    shared.close()
+
+    assert shared.closed
+    np.testing.assert_array_equal(view, random_rgb[10:20])
+    with pytest.raises(ValueError):
+        shared.rgb